@@ -0,0 +1,52 @@
+"""Compare the parallel and serial scoring of a questionnaire battery.
+
+Run with `python benchmarks/bench_parallel.py [n_respondents] [workers]`.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from veleslibrary.compiled import factories
+from veleslibrary.parallel import score_parallel
+from veleslibrary.scoring import compile_battery
+
+
+def main(n_respondents=4_000_000, workers=None):
+    battery = {
+        f"{lang}_{code}": function
+        for lang, code, function in factories()
+        if code != "tls_15" or lang == "en"
+    }
+    scorer = compile_battery(battery)
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as folder:
+        source = Path(folder) / "battery.npy"
+        responses = np.lib.format.open_memmap(
+            source, "w+", np.uint8, (n_respondents, scorer.items)
+        )
+        for start in range(0, n_respondents, 500_000):
+            stop = min(start + 500_000, n_respondents)
+            responses[start:stop] = rng.integers(1, 5, (stop - start, scorer.items))
+        responses.flush()
+
+        start = time.perf_counter()
+        serial = scorer(np.load(source, mmap_mode="r"))
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = score_parallel(battery, source, workers=workers)
+        parallel_time = time.perf_counter() - start
+
+    assert np.array_equal(np.column_stack(list(parallel.values())), serial)
+    print(
+        f"{n_respondents} rows × {scorer.items} items, {len(scorer.names)} scores: "
+        f"serial {serial_time:.2f} s, parallel {parallel_time:.2f} s"
+    )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,212 @@
+"""Measure every questionnaire function and compare it with the stored baselines.
+
+For every function in every language it measures:
+
+- the cold import time of its module in a fresh interpreter,
+- the construction time of the page with default arguments,
+- the serialization time of the page to JSON and the size of the JSON,
+- the memory allocated while constructing the page (peak, with `tracemalloc`).
+
+Timings are the best of `--repeat` runs. The results are compared with
+`benchmarks/baselines/questionnaires.json` and the script exits with status 1 if any value
+is more than `--threshold` (relative) above its baseline. Timing differences smaller than
+`--min-seconds` are ignored as noise. Baselines depend on the interpreter, so the script
+exits with status 2 if they were recorded on another Python version.
+
+The sizes (`json_bytes`, `allocated_bytes`) don't depend on the machine and are checked
+on every CI run by the `bench` tox environment:
+
+    tox -e bench
+
+Timings only make sense on the machine that recorded the baselines, so check them locally
+before and after a change:
+
+    python benchmarks/bench_questionnaires.py [--threshold 0.25] [--only pl.tipi]
+
+and store new baselines (e.g. after an intended change) with the Python version CI uses:
+
+    python benchmarks/bench_questionnaires.py --update
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from veleslibrary.compiled import factories
+
+BASELINES = Path(__file__).parent / "baselines" / "questionnaires.json"
+
+METRICS = (
+    "import_seconds",
+    "construct_seconds",
+    "serialize_seconds",
+    "json_bytes",
+    "allocated_bytes",
+)
+
+_IMPORT = """
+import time
+start = time.perf_counter()
+from {module} import {code}
+print(time.perf_counter() - start)
+"""
+
+
+def cold_import(function, repeat):
+    """Best time of importing the module of the function in a fresh interpreter"""
+    code = _IMPORT.format(module=function.__module__, code=function.__name__)
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(repeat)
+    )
+
+
+def best_time(callable_, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        callable_()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def measure(function, repeat=5):
+    """
+    Measure a single questionnaire function.
+    """
+    page = function()
+    serialize = lambda: json.dumps(page.dict(), ensure_ascii=False)
+
+    tracemalloc.start()
+    function()
+    allocated = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "import_seconds": cold_import(function, repeat),
+        "construct_seconds": best_time(function, repeat),
+        "serialize_seconds": best_time(serialize, repeat),
+        "json_bytes": len(serialize().encode("utf-8")),
+        "allocated_bytes": allocated,
+    }
+
+
+def _minor(version):
+    """Major and minor part of a Python version, e.g. '3.12'"""
+    return ".".join(version.split(".")[:2])
+
+
+def compare(results, baselines, threshold, min_seconds, checked=METRICS):
+    """
+    Return the regressions as `(questionnaire, metric, baseline, current)` tuples.
+    """
+    regressions = []
+    for questionnaire, metrics in results.items():
+        baseline = baselines.get(questionnaire)
+        if baseline is None:
+            continue
+        for metric in checked:
+            old, new = baseline[metric], metrics[metric]
+            if metric.endswith("_seconds") and new - old < min_seconds:
+                continue
+            if new > old * (1 + threshold):
+                regressions.append((questionnaire, metric, old, new))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed relative increase over the baseline (default: 0.25)",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.002,
+        help="ignore timing increases smaller than this (default: 0.002)",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--metrics",
+        nargs="*",
+        choices=METRICS,
+        default=METRICS,
+        help="metrics to compare with the baselines (default: all)",
+    )
+    parser.add_argument(
+        "--only", nargs="*", help="questionnaires to measure, e.g. en.rses pl.tipi"
+    )
+    parser.add_argument("--baselines", type=Path, default=BASELINES)
+    parser.add_argument(
+        "--update", action="store_true", help="store the results as the new baselines"
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for lang, code, function in factories():
+        questionnaire = f"{lang}.{code}"
+        if args.only and questionnaire not in args.only:
+            continue
+        results[questionnaire] = metrics = measure(function, args.repeat)
+        print(
+            f"{questionnaire:<14} import {metrics['import_seconds'] * 1000:7.1f} ms  "
+            f"construct {metrics['construct_seconds'] * 1000:7.2f} ms  "
+            f"serialize {metrics['serialize_seconds'] * 1000:6.2f} ms  "
+            f"json {metrics['json_bytes'] / 1024:6.1f} KiB  "
+            f"allocated {metrics['allocated_bytes'] / 1024:7.1f} KiB"
+        )
+
+    stored = {}
+    if args.baselines.exists():
+        stored = json.loads(args.baselines.read_text(encoding="utf-8"))
+
+    if args.update:
+        stored["python"] = platform.python_version()
+        stored["results"] = stored.get("results", {}) | results
+        args.baselines.parent.mkdir(parents=True, exist_ok=True)
+        args.baselines.write_text(
+            json.dumps(stored, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        print(f"Baselines written to {args.baselines}")
+        return 0
+
+    recorded = stored.get("python", "")
+    if _minor(recorded) != _minor(platform.python_version()):
+        print(
+            f"Baselines were recorded on Python {recorded or 'unknown'}, "
+            f"not {platform.python_version()}. Record them with --update."
+        )
+        return 2
+
+    regressions = compare(
+        results,
+        stored.get("results", {}),
+        args.threshold,
+        args.min_seconds,
+        args.metrics,
+    )
+    for questionnaire, metric, old, new in regressions:
+        print(
+            f"REGRESSION {questionnaire} {metric}: {old:.6g} -> {new:.6g} "
+            f"(+{(new / old - 1) * 100:.0f}%)"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Compare the vectorized scoring with a naive per-row loop.
+
+Run with `python benchmarks/bench_scoring.py [n_respondents]`.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from veleslibrary.compiled import factories
+from veleslibrary.scoring import compile_spec
+
+
+def naive_score(spec, responses):
+    """
+    Score every respondent in a Python loop, the way it used to be done.
+    """
+    low, high = spec.response_range
+    groups = ({"total": range(1, spec.items + 1)} if spec.total else {}) | {
+        name: items for name, items in spec.subscales.items()
+    }
+    scores = []
+    for row in responses.tolist():
+        keyed = [
+            low + high - answer if item in spec.reverse else answer
+            for item, answer in enumerate(row, start=1)
+        ]
+        row_scores = []
+        for items in groups.values():
+            total = sum(keyed[item - 1] for item in items)
+            row_scores.append(
+                total / len(items) if spec.aggregation == "mean" else total
+            )
+        scores.append(row_scores)
+    return np.array(scores, dtype=float)
+
+
+def main(n_respondents=1_000_000, naive_respondents=20_000):
+    rng = np.random.default_rng(0)
+    for lang, code, function in factories():
+        if lang != "en" and code == "tls_15":
+            continue
+        spec = function.scoring
+        low, high = spec.response_range
+        responses = rng.integers(low, high + 1, (n_respondents, spec.items), np.uint8)
+        scorer = compile_spec(spec)
+
+        start = time.perf_counter()
+        scores = scorer(responses)
+        vectorized = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = naive_score(spec, responses[:naive_respondents])
+        naive = (time.perf_counter() - start) * n_respondents / naive_respondents
+
+        assert np.allclose(scores[:naive_respondents], expected)
+        print(
+            f"{lang}.{code:<10} {n_respondents:>9} rows  "
+            f"vectorized {vectorized:7.3f} s  naive (extrapolated) {naive:8.2f} s  "
+            f"speed-up ×{naive / vectorized:,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,54 @@
+"""Measure the throughput of the streaming scoring of a JSONL export.
+
+Run with `python benchmarks/bench_streaming.py [n_rows] [chunk_size]`.
+"""
+
+import json
+import sys
+import tempfile
+import resource
+from pathlib import Path
+
+import numpy as np
+
+from veleslibrary.questionnaires import nfcs, rses, sd3
+from veleslibrary.streaming import score_file
+
+
+def main(n_rows=200_000, chunk_size=10_000):
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as folder:
+        source = Path(folder) / "results.jsonl"
+        with open(source, "w", encoding="utf-8") as file:
+            for start in range(0, n_rows, chunk_size):
+                n = min(chunk_size, n_rows - start)
+                answers = {
+                    "RSES": rng.integers(1, 5, (n, 10)),
+                    "NFCS": rng.integers(1, 7, (n, 41)),
+                    "SD3": rng.integers(1, 6, (n, 27)),
+                }
+                for i in range(n):
+                    row = {"id": start + i}
+                    for name, items in answers.items():
+                        row |= {
+                            f"{name}_{j}": int(a) for j, a in enumerate(items[i], 1)
+                        }
+                    file.write(json.dumps(row) + "\n")
+
+        stats = score_file(
+            source,
+            Path(folder) / "scores.csv",
+            [rses, nfcs, sd3],
+            keep=["id"],
+            chunk_size=chunk_size,
+        )
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(
+            f"{stats.rows} rows ({source.stat().st_size / 2**20:.0f} MiB) in "
+            f"{stats.seconds:.2f} s: {stats.rows_per_second:,.0f} rows/s, "
+            f"peak RSS {peak / 2**10:.0f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,27 @@
+"""Measure how many per-participant item order variants are made per second.
+
+Run with `python benchmarks/bench_variants.py [n_participants]`.
+"""
+
+import sys
+import time
+
+from veleslibrary.questionnaires import mini_cope, nfcs, sd3
+from veleslibrary.variants import variants
+
+
+def main(n_participants=20_000):
+    for questionnaire in (sd3, mini_cope, nfcs):
+        shuffled = variants(questionnaire)
+        start = time.perf_counter()
+        for participant in range(n_participants):
+            shuffled(participant)
+        seconds = time.perf_counter() - start
+        print(
+            f"{questionnaire.__name__:<10} {n_participants / seconds:10.0f} pages/s  "
+            f"{seconds / n_participants * 1e6:6.1f} µs/page"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,26 @@
+"""Shared fixtures for the tests."""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+
+@pytest.fixture
+def run_isolated():
+    """
+    Run code in a fresh interpreter, so that the modules imported by other tests don't count.
+    The code should fail with an AssertionError if the check fails.
+    """
+
+    def run(code):
+        result = subprocess.run(
+            [sys.executable, "-c", textwrap.dedent(code)],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 0, result.stderr
+
+    return run
@@ -1,74 +1,59 @@
 """Test all functions in the veleslibrary package."""
 
-import importlib.util
+import importlib
 import inspect
+import json
 import os
-import pytest
-import veleslibrary
-
 
-def get_package_path(package_name):
-    """
-    Dynamically locate the path of a Python package.
+import pytest
 
-    :param package_name: The name of the Python package (e.g., "veleslibrary").
-    :return: The absolute path to the package directory.
-    """
-    spec = importlib.util.find_spec(package_name)
-    if not spec or not spec.submodule_search_locations:
-        raise ImportError(f"Cannot find package {package_name}")
-    return os.path.abspath(spec.submodule_search_locations[0])
+from veleslibrary import registry
 
 
-def collect_function_paths_from_package(package_name):
+def collect_questionnaire_functions():
     """
-    Collect full paths (e.g., veleslibrary.questionnaires.rses) of all functions in the given package.
+    Walk the questionnaire and test packages and collect `(module, function)` names of every questionnaire function.
 
-    :param package_name: The top-level name of the package (e.g., "veleslibrary").
-    :return: A list of full paths to functions in the package.
+    Questionnaire functions take a `name` argument (see `veleslibrary.questionnaires`), which tells them apart from helpers such as `tls_15.translation()`.
     """
-    package_path = get_package_path(package_name)
-    function_paths = []
-
-    for root, _, files in os.walk(package_path):
-        for file in files:
-            if file.endswith(".py") and not file.startswith("__"):
-                module_path = os.path.join(root, file)
-                relative_path = os.path.relpath(module_path, package_path)
-                module_name = os.path.splitext(relative_path.replace(os.sep, "."))[0]
-
-                # Construct the full module name
-                full_module_name = f"{package_name}.{module_name}"
-
-                # Dynamically load the module
-                try:
-                    spec = importlib.util.spec_from_file_location(
-                        full_module_name, module_path
-                    )
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                except Exception as e:  # pylint: disable=broad-except
-                    print(f"Failed to load module {full_module_name}: {e}")
+    functions = []
+    for package_name in registry.PACKAGES.values():
+        package_path = importlib.import_module(package_name).__path__[0]
+        for root, _, files in os.walk(package_path):
+            for file in sorted(files):
+                if not file.endswith(".py") or file.startswith("__"):
                     continue
-
-                # Collect functions defined in the module
-                for name in inspect.getmembers(module, inspect.isfunction):
-                    function_paths.append(f"{full_module_name}.{name[0]}")
-    function_paths = [
-        ".".join(path.split(".")[:-2] + path.split(".")[-1:]) for path in function_paths
-    ]
-    return function_paths
-
-
-def test_all():
+                relative_path = os.path.relpath(os.path.join(root, file), package_path)
+                module_name = os.path.splitext(relative_path.replace(os.sep, "."))[0]
+                module = importlib.import_module(f"{package_name}.{module_name}")
+                for name, function in inspect.getmembers(module, inspect.isfunction):
+                    if (
+                        function.__module__ == module.__name__
+                        and not name.startswith("_")
+                        and "name" in inspect.signature(function).parameters
+                    ):
+                        functions.append((module.__name__, name))
+    return functions
+
+
+def test_every_function_is_registered():
+    """
+    Every questionnaire function found on disk should be in the registry index, so none escapes the smoke test.
+    """
+    functions = collect_questionnaire_functions()
+    assert ("veleslibrary.questionnaires.es.tls_15", "tls_15") in functions
+    stored = json.loads(registry.INDEX_PATH.read_text(encoding="utf-8"))
+    assert set(functions) <= {(entry["module"], entry["code"]) for entry in stored}
+    assert set(functions) <= {
+        (entry.module, entry.code) for entry in registry.entries()
+    }
+
+
+@pytest.mark.parametrize(
+    "entry", registry.entries(), ids=lambda entry: f"{entry.lang}.{entry.code}"
+)
+def test_all(entry):
     """
-    Dynamically import all functions in the veleslibrary package and run them.
+    Run every questionnaire and test in the veleslibrary package with default arguments.
     """
-    veleslibrary_functions = [
-        f"{func}()" for func in collect_function_paths_from_package("veleslibrary")
-    ]
-    for func in veleslibrary_functions:
-        try:
-            eval(func, {"veleslibrary": veleslibrary})  # pylint: disable=eval-used
-        except Exception as e:  # pylint: disable=broad-except
-            pytest.fail(f"Function {func} raised an exception: {e}")
+    entry()
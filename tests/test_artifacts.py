@@ -0,0 +1,91 @@
+"""Test the precompressed, content-hashed JSON."""
+
+import gzip
+import json
+
+from veleslibrary.artifacts import (
+    Artifact,
+    ArtifactCache,
+    artifact,
+    battery_artifact,
+    canonical_json,
+)
+from veleslibrary.questionnaires import nfcs, nfcsShort, rses
+
+
+def test_etag_is_stable():
+    """
+    ETags must not change between versions, or clients would download unchanged questionnaires again.
+    """
+    value = Artifact.from_json({"b": 1, "a": ["ż", 1.5]})
+
+    assert value.body == '{"a":["ż",1.5],"b":1}'.encode("utf-8")
+    assert value.etag == (
+        '"6542d0839c5b5475ba50a6c12b68cf75f981c7ea21efc4a3eaac2cdbab94dbfe"'
+    )
+
+
+def test_etag_is_the_same_in_every_process(run_isolated):
+    """
+    A fresh interpreter, with a different hash seed, should get the same ETag.
+    """
+    etag = artifact(rses, name="RSES_pre").etag
+    run_isolated(
+        f"""
+        from veleslibrary.artifacts import artifact
+        from veleslibrary.questionnaires import rses
+
+        assert artifact(rses, name="RSES_pre").etag == {etag!r}
+        """
+    )
+
+
+def test_body_and_gzip_match_the_page():
+    """
+    The body should be the page JSON and the gzip bytes should decompress to the body.
+    """
+    value = artifact(nfcs, name="NFCS_pre")
+
+    assert json.loads(value.body) == nfcs(name="NFCS_pre").dict()
+    assert gzip.decompress(value.gzip) == value.body
+    assert value.body == canonical_json(json.loads(value.body))
+    assert artifact(nfcs, name="NFCS_post").etag != value.etag
+
+
+def test_cache_returns_the_same_artifact():
+    """
+    Artifacts are immutable, so hits should return the stored object.
+    """
+    cache = ArtifactCache()
+    first = cache.get(rses)
+    assert cache.get(rses, "RSES") is first
+    assert cache.get(rses, questionOptions={"isRequired": True}) is not first
+    assert (cache.info().hits, cache.info().misses) == (1, 2)
+
+
+def test_battery_keeps_one_stylesheet():
+    """
+    A battery should have one page per questionnaire and one copy of the NFCS stylesheet.
+    """
+    value = battery_artifact(nfcs, (nfcsShort, {"name": "NFCS_post"}))
+    survey = json.loads(value.body)
+
+    assert [page["name"] for page in survey["pages"]] == ["NFCS_page", "NFCS_post_page"]
+    assert json.dumps(survey).count('data-veles-style=\\"nfcs\\"') == 1
+    assert battery_artifact(nfcs, (nfcsShort, {"name": "NFCS_post"})) is value
+
+
+def test_if_none_match():
+    """
+    Conditional requests should match the strong ETag, in lists, weak or as a wildcard.
+    """
+    value = artifact(rses)
+
+    assert value.matches(value.etag)
+    assert value.matches(f'"other", W/{value.etag}')
+    assert value.matches("*")
+    assert not value.matches('"other"')
+    assert not value.matches(None)
+    assert value.gzip_etag == value.etag[:-1] + '-gz"'
+    assert value.matches(value.gzip_etag, gzip=True)
+    assert not value.matches(value.gzip_etag) and not value.matches(value.etag, True)
@@ -0,0 +1,94 @@
+"""Test the counterbalancing of questionnaire batteries."""
+
+from collections import Counter
+
+import pytest
+
+from veleslibrary import registry
+from veleslibrary.battery import BatteryPlanner, latin_square, random_blocks
+from veleslibrary.compiled import load_json
+from veleslibrary.styles import style_tag
+
+
+@pytest.mark.parametrize("n", range(1, 10))
+def test_latin_square_is_balanced(n):
+    """
+    Every treatment should be in every position and follow every other one equally often.
+    """
+    square = latin_square(n)
+    assert len(square) == (n if n % 2 == 0 else 2 * n)
+    assert all(sorted(row) == list(range(n)) for row in square)
+    for position in range(n):
+        counts = Counter(row[position] for row in square)
+        assert len(set(counts.values())) == 1 and len(counts) == n
+    pairs = Counter(pair for row in square for pair in zip(row, row[1:]))
+    assert len(pairs) == n * (n - 1)
+    assert len(set(pairs.values())) <= 1
+
+
+def test_designs_are_cached():
+    """
+    Designs should be computed once.
+    """
+    assert latin_square(4) is latin_square(4)
+    assert (
+        BatteryPlanner(["rses", "sd3"]).design is BatteryPlanner(["sd3", "nfcs"]).design
+    )
+
+
+def test_orders_of_participants():
+    """
+    Consecutive participants should go through the rows of the square.
+    """
+    planner = BatteryPlanner(["rses", "sd3", ("tipi", "pl"), ("tls_15", "pl")])
+    rows = [planner.row(participant) for participant in range(8)]
+    assert rows[:4] == list(latin_square(4)) and rows[4:] == rows[:4]
+    assert [entry.code for entry in planner.order(0)] == [
+        "rses",
+        "sd3",
+        "tls_15",
+        "tipi",
+    ]
+    assert planner.row("participant-x") == planner.row("participant-x")
+    assert planner.pages(2) == [
+        load_json(entry.code, entry.lang) for entry in planner.order(2)
+    ]
+
+
+def test_pages_keep_one_stylesheet():
+    """
+    A battery with both forms of NFCS should carry the NFCS stylesheet once, on the first of them.
+    """
+    planner = BatteryPlanner(["nfcs", "rses", "nfcsShort"])
+    for participant in range(len(planner.design)):
+        order = [entry.code for entry in planner.order(participant)]
+        styled = [
+            code
+            for code, page in zip(order, planner.pages(participant))
+            if style_tag("nfcs") in page["elements"][0].get("html", "")
+        ]
+        assert styled == [next(code for code in order if code != "rses")]
+
+
+def test_large_battery():
+    """
+    Large batteries should use random orders, reproducible with the seed.
+    """
+    codes = [entry.code for entry in registry.entries(lang="en")] * 3
+    planner = BatteryPlanner([(code, "en") for code in codes])
+    assert planner.design == random_blocks(len(codes))
+    assert planner.design is BatteryPlanner(codes).design
+    assert all(sorted(row) == list(range(len(codes))) for row in planner.design[:10])
+    assert BatteryPlanner(codes, seed=1).design != planner.design
+
+
+def test_invalid():
+    """
+    Empty batteries, unknown questionnaires and designs should be rejected.
+    """
+    with pytest.raises(ValueError):
+        BatteryPlanner([])
+    with pytest.raises(ValueError):
+        BatteryPlanner(["rses"], design="cyclic")
+    with pytest.raises(KeyError):
+        BatteryPlanner([("rses", "xx")])
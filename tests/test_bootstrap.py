@@ -0,0 +1,88 @@
+"""Test the bootstrap confidence intervals of α."""
+
+import numpy as np
+
+from veleslibrary import bootstrap
+from veleslibrary.bootstrap import bootstrap_alpha
+from veleslibrary.questionnaires import rses, tls_15
+from veleslibrary.reliability import ReliabilityMonitor
+
+
+def correlated_answers(n, items, low, high, seed=0):
+    """
+    Generate answers driven by one latent trait, so α is clearly positive.
+    """
+    rng = np.random.default_rng(seed)
+    trait = rng.normal(size=(n, 1))
+    latent = trait + rng.normal(size=(n, items))
+    return np.clip(np.round(latent + (low + high) / 2), low, high)
+
+
+def naive_alpha(responses):
+    covariance = np.cov(responses, rowvar=False)
+    k = covariance.shape[0]
+    return k / (k - 1) * (1 - np.trace(covariance) / covariance.sum())
+
+
+def test_estimates_match_the_reliability_monitor():
+    """
+    Point estimates should be α of the whole sample, with reverse keying and subscales.
+    """
+    answers = correlated_answers(300, 15, 1, 5)
+    intervals = bootstrap_alpha(tls_15, answers, resamples=200, workers=1, seed=0)
+    expected = ReliabilityMonitor(tls_15).update(answers).alpha()
+
+    assert list(intervals) == list(expected)
+    for name, interval in intervals.items():
+        assert np.isclose(interval.estimate, expected[name])
+        assert interval.percentile[0] < interval.estimate < interval.percentile[1]
+        assert interval.bca[0] < interval.bca[1]
+
+
+def test_resamples_match_indexing():
+    """
+    Resampling through row counts should give α of the resampled rows.
+    """
+    answers = correlated_answers(50, 10, 1, 4)
+    intervals = bootstrap_alpha(
+        rses, answers, resamples=1, workers=1, seed=3, confidence=0
+    )
+
+    seed = np.random.SeedSequence(3).spawn(1)[0]
+    rows = np.random.default_rng(seed).integers(0, 50, (1, 50))[0]
+    recoded = answers.copy()
+    reverse = np.asarray(rses.scoring.reverse) - 1
+    recoded[:, reverse] = 5 - recoded[:, reverse]
+
+    assert np.isclose(intervals["total"].percentile[0], naive_alpha(recoded[rows]))
+
+
+def test_reproducible_whatever_the_workers():
+    """
+    Intervals should depend only on the seed, not on the number of processes.
+    """
+    answers = correlated_answers(200, 10, 1, 4)
+    serial = bootstrap_alpha(rses, answers, resamples=300, workers=1, seed=7)
+    other = bootstrap_alpha(rses, answers, resamples=300, workers=1, seed=8)
+
+    assert serial["total"].percentile != other["total"].percentile
+    assert bootstrap_alpha(rses, answers, resamples=300, workers=2, seed=7) == serial
+
+
+def test_batches_fit_the_memory_budget(monkeypatch):
+    """
+    Large samples should be resampled in smaller batches, so a batch stays within the budget.
+    """
+    sizes = []
+    batch = bootstrap._bootstrap_batch
+
+    def recorded(source, membership, resamples, seed):
+        sizes.append(resamples)
+        return batch(source, membership, resamples, seed)
+
+    monkeypatch.setattr(bootstrap, "_bootstrap_batch", recorded)
+    monkeypatch.setattr(bootstrap, "MEMORY_BUDGET", 16 * 1000 * 25)
+    bootstrap_alpha(rses, correlated_answers(1000, 10, 1, 4), resamples=60, workers=1)
+    bootstrap_alpha(rses, correlated_answers(10, 10, 1, 4), resamples=60, workers=1)
+
+    assert sizes == [25, 25, 10, 60]
@@ -0,0 +1,67 @@
+"""Test the questionnaire cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from veleslibrary.cache import QuestionnaireCache
+from veleslibrary.questionnaires import nfcs, rses, sd3
+
+
+def test_hits_return_equal_independent_copies():
+    """
+    A cached questionnaire should serialize like a fresh one and stay intact when a copy is changed.
+    """
+    cache = QuestionnaireCache()
+    first = cache.get(sd3, name="SD3_pre")
+    first.questions[1].choices.append("6 – Broken")
+    first.questions[2].title = "Changed"
+    first.name = "Changed_page"
+
+    second = cache.get(sd3, name="SD3_pre")
+    assert second.dict() == sd3(name="SD3_pre").dict()
+    assert cache.info().hits == 1
+    assert cache.info().misses == 1
+
+
+def test_key_includes_defaults_and_options():
+    """
+    Explicit default arguments share the entry, different options don't.
+    """
+    cache = QuestionnaireCache()
+    cache.get(rses)
+    cache.get(rses, "RSES")
+    cache.get(rses, questionOptions={"isRequired": True})
+    cache.get(nfcs, ratingOptions={"rateMax": 6})
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.size) == (1, 3, 3)
+
+
+def test_lru_eviction():
+    """
+    The least recently used questionnaire should be evicted first.
+    """
+    cache = QuestionnaireCache(maxsize=2)
+    cache.get(rses, name="A")
+    cache.get(rses, name="B")
+    cache.get(rses, name="A")
+    cache.get(rses, name="C")
+
+    assert cache.info().evictions == 1
+    cache.get(rses, name="A")
+    assert cache.info().hits == 2
+
+
+def test_concurrent_access():
+    """
+    Many threads should get correct questionnaires and consistent counters.
+    """
+    cache = QuestionnaireCache(maxsize=3)
+    names = [f"RSES_{i % 5}" for i in range(200)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        pages = list(pool.map(lambda name: cache.get(rses, name=name), names))
+
+    assert [page.name for page in pages] == [f"{name}_page" for name in names]
+    info = cache.info()
+    assert info.hits + info.misses == len(names)
+    assert info.size <= 3
@@ -0,0 +1,100 @@
+"""Test the careless responding detection."""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from veleslibrary.careless import (
+    CarelessFlag,
+    Thresholds,
+    chi2_quantile,
+    detect,
+    longstring,
+)
+from veleslibrary.questionnaires import mini_cope, nfcs, rses, sd3
+
+
+def attentive(questionnaire, n, rng):
+    """Simulate answers driven by one latent trait per subscale"""
+    spec = questionnaire.scoring
+    low, high = spec.response_range
+    traits = rng.normal(size=(n, len(spec.subscales)))
+    answers = np.zeros((n, spec.items))
+    for column, items in enumerate(spec.subscales.values()):
+        index = np.asarray(items) - 1
+        answers[:, index] = traits[:, [column]] + rng.normal(
+            scale=0.6, size=(n, len(index))
+        )
+    middle, spread = (low + high) / 2, (high - low) / 4
+    answers = np.clip(np.round(middle + spread * answers), low, high)
+    if spec.reverse:
+        reverse = np.asarray(spec.reverse) - 1
+        answers[:, reverse] = low + high - answers[:, reverse]
+    return answers
+
+
+@pytest.mark.parametrize("questionnaire", [nfcs, sd3, mini_cope])
+def test_random_and_straight_responders_are_flagged(questionnaire):
+    """
+    Straight-line rows and most random rows should be flagged, and only few attentive ones.
+    """
+    rng = np.random.default_rng(0)
+    low, high = questionnaire.scoring.response_range
+    responses = attentive(questionnaire, 5000, rng)
+    responses[:100] = rng.integers(low, high + 1, size=(100, responses.shape[1]))
+    responses[100:200] = low + 1
+
+    result = detect(questionnaire, responses)
+    assert result.careless[:100].mean() > 0.85
+    assert result.careless[100:200].all()
+    assert (result.flags[100:200] & CarelessFlag.LONGSTRING).all()
+    assert (result.flags[100:200] & CarelessFlag.LOW_IRV).all()
+    assert result.careless[200:].mean() < 0.1
+    assert np.nanmedian(result.even_odd[200:]) > 0.7
+
+
+def test_longstring():
+    """
+    Runs should be counted within rows and broken by missing answers.
+    """
+    responses = np.array([[1, 1, 2, 2, 2, np.nan, np.nan, 1], [4] * 8])
+    assert longstring(responses).tolist() == [3, 8]
+
+
+def test_even_odd_needs_subscales():
+    """
+    Questionnaires without three subscales should get NaN consistency and no flag.
+    """
+    responses = np.random.default_rng(0).integers(1, 5, size=(50, 10)).astype(float)
+    result = detect(rses, responses)
+    assert np.isnan(result.even_odd).all()
+    assert not (result.flags & CarelessFlag.EVEN_ODD).any()
+
+
+def test_missing_answers_and_thresholds():
+    """
+    Missing answers shouldn't raise warnings or flags, and thresholds should be adjustable.
+    """
+    rng = np.random.default_rng(1)
+    responses = attentive(sd3, 200, rng)
+    responses[0] = np.nan
+    responses[1, :5] = np.nan
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = detect(sd3, responses, chunk_size=64)
+    assert result.flags[0] == 0
+    assert np.isnan(result.mahalanobis[:2]).all()
+    assert not np.isnan(result.irv[1])
+
+    strict = detect(sd3, responses, Thresholds(longstring=2))
+    assert strict.counts()["LONGSTRING"] > result.counts()["LONGSTRING"]
+
+
+def test_chi2_quantile():
+    """
+    The approximation should be close to the exact quantiles.
+    """
+    assert chi2_quantile(0.999, 10) == pytest.approx(29.588, rel=0.01)
+    assert chi2_quantile(0.999, 41) == pytest.approx(74.745, rel=0.01)
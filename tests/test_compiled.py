@@ -0,0 +1,56 @@
+"""Test the precompiled SurveyJS JSON."""
+
+import pytest
+
+from veleslibrary.compiled import factories, load_json
+
+FACTORIES = list(factories())
+
+
+@pytest.mark.parametrize("lang, code, function", FACTORIES)
+def test_json_is_up_to_date(lang, code, function):
+    """
+    The precompiled JSON should be the same as the one built by the function.
+    Run `python -m veleslibrary.compiled` if this fails.
+    """
+    assert load_json(code, lang) == function().dict()
+
+
+@pytest.mark.parametrize("lang, code, function", FACTORIES)
+def test_name_is_swapped(lang, code, function):
+    """
+    Swapping the name in the JSON should give the same result as passing it to the function.
+    """
+    assert load_json(code, lang, name="Custom") == function(name="Custom").dict()
+
+
+def test_returned_json_is_independent():
+    """
+    Changing the returned JSON shouldn't affect the next calls.
+    """
+    load_json("rses")["elements"].clear()
+    assert len(load_json("rses")["elements"]) == 11
+
+
+def test_unknown_questionnaire():
+    """
+    Unknown questionnaires should raise a KeyError.
+    """
+    with pytest.raises(KeyError):
+        load_json("tipi", "en")
+
+
+def test_load_json_does_not_import_pydantic(run_isolated):
+    """
+    The fast path shouldn't import velesresearch nor pydantic.
+    """
+    run_isolated(
+        """
+        import sys
+        from veleslibrary.compiled import load_json
+
+        load_json("tls_15", "hu", name="TLS")
+        assert "velesresearch" not in sys.modules
+        assert "pydantic" not in sys.modules
+        """
+    )
@@ -0,0 +1,199 @@
+"""Test the asynchronous scoring of submitted results."""
+
+import asyncio
+import json
+import math
+
+import numpy as np
+import pytest
+
+from veleslibrary.ingestion import FileSink, MemorySink, ResultIngestor
+from veleslibrary.questionnaires import rses, sd3
+from veleslibrary.streaming import score_rows
+
+QUESTIONNAIRES = [rses, sd3]
+
+
+def payloads(n, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(n):
+        row = {"id": f"p{i}"}
+        row |= {f"RSES_{item}": int(rng.integers(1, 5)) for item in range(1, 11)}
+        row |= {f"SD3_{item}": int(rng.integers(1, 6)) for item in range(1, 28)}
+        rows.append(row)
+    return rows
+
+
+def test_scores_match_streaming():
+    """
+    Submitted payloads should get the same scores as the batch scoring, in bursts of many batches.
+    """
+    rows = payloads(1000)
+    expected = next(score_rows(rows, QUESTIONNAIRES, keep=["id"], chunk_size=1000))
+    sink = MemorySink()
+
+    async def run():
+        async with ResultIngestor(
+            QUESTIONNAIRES, sink, keep=["id"], batch_size=64
+        ) as ingestor:
+            futures = [await ingestor.submit(row) for row in rows]
+            return await asyncio.gather(*futures), ingestor
+
+    scored, ingestor = asyncio.run(run())
+    assert scored == expected
+    assert [sink[row["id"]] for row in rows] == expected
+    stats = ingestor.stats()
+    assert (stats.received, stats.scored, stats.written) == (1000, 1000, 1000)
+    assert 1000 / 64 <= stats.batches < 1000
+
+
+def test_single_submission_is_not_held_for_a_full_batch():
+    """
+    A single submission should be scored after `max_delay`, without waiting for a full batch.
+    """
+
+    async def run():
+        async with ResultIngestor(QUESTIONNAIRES, max_delay=0.002) as ingestor:
+            first = await ingestor.score(payloads(1)[0])
+            second = await ingestor.score(json.dumps(payloads(1, seed=1)[0]))
+            return first, second, ingestor.stats()
+
+    first, second, stats = asyncio.run(run())
+    assert (stats.received, stats.scored, stats.batches) == (2, 2, 2)
+    assert not math.isnan(first["RSES_total"])
+    assert not math.isnan(second["RSES_total"])
+
+
+def test_invalid_payloads_are_rejected():
+    """
+    A payload that isn't a JSON object should be refused without failing the rest of its batch.
+    """
+
+    async def run():
+        async with ResultIngestor([rses], max_delay=0.05) as ingestor:
+            future = await ingestor.submit(payloads(1)[0])
+            with pytest.raises(ValueError, match="JSON object"):
+                await ingestor.submit("[1, 2, 3]")
+            with pytest.raises(ValueError, match="JSON object"):
+                ingestor.submit_nowait([1, 2, 3])
+            return await future, ingestor.stats()
+
+    scores, stats = asyncio.run(run())
+    assert not math.isnan(scores["RSES_total"])
+    assert (stats.received, stats.scored) == (1, 1)
+
+
+def test_bad_answers_dont_fail_the_batch():
+    """
+    A malformed answer or a payload that can't be scored should only affect its own submitter.
+    """
+
+    class BrokenPayload(dict):
+        def get(self, *args):
+            raise RuntimeError("broken payload")
+
+    valid = payloads(3)
+    malformed = valid[1] | {"RSES_4": {"x": 1}}
+    expected = next(score_rows(valid, QUESTIONNAIRES, keep=["id"]))
+
+    async def run():
+        async with ResultIngestor(
+            QUESTIONNAIRES, keep=["id"], max_delay=0.05
+        ) as ingestor:
+            futures = [
+                await ingestor.submit(valid[0]),
+                await ingestor.submit(malformed),
+                await ingestor.submit(BrokenPayload(valid[2])),
+                await ingestor.submit(valid[2]),
+            ]
+            results = await asyncio.gather(*futures, return_exceptions=True)
+            return results, ingestor.stats()
+
+    (first, bad, broken, last), stats = asyncio.run(run())
+    assert (first, last) == (expected[0], expected[2])
+    assert math.isnan(bad["RSES_total"])
+    assert bad["SD3_Narcissism"] == expected[1]["SD3_Narcissism"]
+    assert isinstance(broken, RuntimeError)
+    assert (stats.received, stats.scored) == (4, 3)
+
+
+def test_close_without_start():
+    """
+    Closing an ingestor that was never started should do nothing.
+    """
+    asyncio.run(ResultIngestor([rses]).close())
+
+
+def test_backpressure():
+    """
+    A full queue should refuse payloads without losing the accepted ones.
+    """
+
+    class SlowSink:
+        def __init__(self):
+            self.rows = []
+
+        async def write(self, rows):
+            await asyncio.sleep(0.01)
+            self.rows += rows
+
+    sink = SlowSink()
+
+    async def run():
+        ingestor = await ResultIngestor(
+            [rses], sink, batch_size=1, queue_size=2
+        ).start()
+        rows = payloads(20)
+        with pytest.raises(asyncio.QueueFull):
+            for row in rows:
+                ingestor.submit_nowait(row)
+        accepted = ingestor.stats().received
+        await ingestor.close()
+        return accepted
+
+    accepted = asyncio.run(run())
+    assert accepted < 20
+    assert len(sink.rows) == accepted
+
+
+def test_missing_answers_and_sink_errors():
+    """
+    Missing answers should give NaN scores and a failing sink should be reported on close.
+    """
+
+    class BrokenSink:
+        def write(self, rows):
+            raise OSError("disk full")
+
+    async def run():
+        ingestor = await ResultIngestor([rses], BrokenSink()).start()
+        scores = await ingestor.score({"RSES_1": 2})
+        with pytest.raises(OSError, match="disk full"):
+            await ingestor.close()
+        return scores, ingestor.stats()
+
+    scores, stats = asyncio.run(run())
+    assert math.isnan(scores["RSES_total"])
+    assert (stats.scored, stats.written, stats.write_errors) == (1, 0, 1)
+
+
+def test_file_sink(tmp_path):
+    """
+    The file sink should append scored rows, with one header in a .csv file.
+    """
+    rows = payloads(10)
+    path = tmp_path / "scores.csv"
+
+    async def run():
+        for part in (rows[:5], rows[5:]):
+            ingestor = ResultIngestor([rses], keep=["id"])
+            ingestor.sink = FileSink(path, ingestor.fieldnames)
+            async with ingestor:
+                for row in part:
+                    await ingestor.submit(row)
+
+    asyncio.run(run())
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "id,RSES_total"
+    assert len(lines) == 11
@@ -0,0 +1,60 @@
+"""Test the memory-mapped item store."""
+
+import pytest
+
+from veleslibrary import itemstore
+from veleslibrary.itemstore import ItemStore
+
+
+def test_store_is_up_to_date():
+    """
+    The stored texts should be the same as the JSON sources.
+    Run `python -m veleslibrary.itemstore` if this fails.
+    """
+    store = itemstore.open_store(itemstore.STORE_PATH)
+    sources = itemstore.read_sources()
+    assert store.groups() == list(sources)
+    for group, texts in sources.items():
+        assert store.texts(group) == (texts if store.is_list(group) else [texts])
+
+
+def test_round_trip(tmp_path):
+    """
+    Written texts should be read back as zero-copy views of UTF-8.
+    """
+    groups = {"pl/x/instruction": "Zażółć gęślą jaźń", "pl/x/items": ["", "b", "ć"]}
+    with ItemStore(itemstore.write(tmp_path / "items.bin", groups)) as store:
+        assert store.groups() == list(groups)
+        assert store.texts("pl/x/instruction") == ["Zażółć gęślą jaźń"]
+        assert not store.is_list("pl/x/instruction")
+        assert store.texts("pl/x/items") == ["", "b", "ć"]
+        views = store.views("pl/x/items")
+        assert all(isinstance(view, memoryview) for view in views)
+        assert bytes(views[2]) == "ć".encode("utf-8")
+        with pytest.raises(KeyError):
+            store.views("pl/y/items")
+        del views
+
+
+def test_not_a_store(tmp_path):
+    """
+    Other files should be rejected.
+    """
+    (tmp_path / "other.bin").write_bytes(b"x" * 32)
+    with pytest.raises(ValueError):
+        ItemStore(tmp_path / "other.bin")
+
+
+def test_load():
+    """
+    Loaded texts should be cached, read-only and interned.
+    """
+    texts = itemstore.load("tipi", "pl")
+    assert texts is itemstore.load("tipi", "pl")
+    assert set(texts) == {"instruction", "intro", "scale", "items"}
+    assert isinstance(texts["instruction"], str) and len(texts["items"]) == 10
+    with pytest.raises(TypeError):
+        texts["items"] = ()
+    with pytest.raises(KeyError):
+        itemstore.load("tipi", "en")
+    assert itemstore.languages("rses") == ["en", "pl"]
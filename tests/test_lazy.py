@@ -0,0 +1,54 @@
+"""Test that the questionnaires are imported only when they are used."""
+
+
+def test_import_is_lazy(run_isolated):
+    """
+    Importing the package should not import any questionnaire nor velesresearch.
+    """
+    run_isolated(
+        """
+        import sys
+        import veleslibrary
+
+        loaded = [m for m in sys.modules if m.startswith("veleslibrary.questionnaires.")]
+        assert "velesresearch" not in sys.modules
+        assert loaded == [], loaded
+        """
+    )
+
+
+def test_only_used_questionnaire_is_imported(run_isolated):
+    """
+    Using pl.tipi should import pl/tipi.py and nothing else from the library.
+    """
+    run_isolated(
+        """
+        import sys
+        import veleslibrary
+
+        veleslibrary.questionnaires.pl.tipi()
+
+        loaded = sorted(m for m in sys.modules if m.startswith("veleslibrary.questionnaires."))
+        assert loaded == [
+            "veleslibrary.questionnaires.pl",
+            "veleslibrary.questionnaires.pl.tipi",
+        ], loaded
+        """
+    )
+
+
+def test_submodule_import_does_not_shadow_function(run_isolated):
+    """
+    Importing a questionnaire module directly should keep the function exported by the package.
+    """
+    run_isolated(
+        """
+        import veleslibrary.questionnaires.rses
+        from veleslibrary.questionnaires import rses
+        from veleslibrary import nfcsShort, pl
+
+        assert callable(rses) and rses.__name__ == "rses"
+        assert callable(nfcsShort)
+        assert "tipi" in dir(pl)
+        """
+    )
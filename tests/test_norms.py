@@ -0,0 +1,91 @@
+"""Test the norm tables."""
+
+import numpy as np
+import pytest
+
+from veleslibrary import norms, registry
+
+
+@pytest.fixture
+def norms_path(tmp_path, monkeypatch):
+    """Write norms of RSES to a temporary directory"""
+    monkeypatch.setattr(norms, "NORMS_PATH", tmp_path)
+    rng = np.random.default_rng(0)
+    female = rng.integers(10, 41, 500)
+    everyone = rng.integers(10, 41, 1000)
+    norms.write(
+        "rses",
+        "pl",
+        [
+            norms.table(everyone),
+            norms.table(female, sex="female", age=(18, 29)),
+            norms.table([1, 2, 2, 3], score="Other"),
+        ],
+        source="Simulated sample",
+        path=tmp_path,
+    )
+    yield female, everyone
+    norms.load.cache_clear()
+
+
+def test_percentiles_match_counting(norms_path):
+    """
+    Percentile ranks should count the people below and half of the ones with the same score.
+    """
+    _, everyone = norms_path
+    raw = np.array([9, 10, 17, 25.5, 40, 41, np.nan])
+    expected = [
+        ((everyone < x).sum() + (everyone == x).sum() / 2) / len(everyone) * 100
+        for x in raw[:-1]
+    ]
+
+    result = norms.load("rses", "pl").percentiles(raw)
+    assert result[:-1] == pytest.approx(expected)
+    assert result[0] == 0 and result[-2] == 100 and np.isnan(result[-1])
+
+
+def test_strata(norms_path):
+    """
+    Participants in a specific stratum should use its table and the others the general one.
+    """
+    female, everyone = norms_path
+    rses_norms = norms.load("rses", "pl")
+    raw = np.array([25, 25, 25, 25])
+    sex = np.array(["female", "female", "male", "female"])
+    age = np.array([20, 45, 20, np.nan])
+
+    general = rses_norms.tables[-2].percentiles(raw[:1])[0]
+    specific = rses_norms.tables[0].percentiles(raw[:1])[0]
+    assert rses_norms.tables[0].n == len(female)
+    assert specific != general
+    assert rses_norms.percentiles(raw, sex, age).tolist() == [
+        specific,
+        general,
+        general,
+        general,
+    ]
+
+    t_scores = rses_norms.t_scores(everyone)
+    assert t_scores.mean() == pytest.approx(50)
+    assert t_scores.std(ddof=1) == pytest.approx(10)
+    assert rses_norms.percentiles([2], score="Other")[0] == 50
+    assert np.isnan(rses_norms.percentiles([2], score="Missing")[0])
+
+
+def test_loading(norms_path):
+    """
+    Norms should be cached, listed and reachable from the registry.
+    """
+    assert norms.load("rses", "pl") is registry.get("rses", "pl").norms
+    assert norms.available() == [("rses", "pl")]
+    assert norms.load("rses", "pl").source == "Simulated sample"
+    with pytest.raises(KeyError):
+        norms.load("rses", "en")
+
+
+def test_invalid_table():
+    """
+    Tables with unsorted scores should be refused.
+    """
+    with pytest.raises(ValueError):
+        norms.NormTable.from_dict({"scores": [2, 1], "counts": [1, 1]})
@@ -0,0 +1,70 @@
+"""Test the parallel scoring."""
+
+import numpy as np
+import pytest
+
+from veleslibrary.parallel import score_parallel
+from veleslibrary.questionnaires import mini_cope, nfcs, rses, sd3
+from veleslibrary.scoring import compile_battery, default_name, score
+
+BATTERY = [rses, nfcs, sd3, mini_cope]
+
+
+def battery_responses(n):
+    """
+    Random coded answers of the whole battery, side by side.
+    """
+    rng = np.random.default_rng(2)
+    return np.hstack(
+        [
+            rng.integers(*q.scoring.response_range, (n, q.scoring.items), endpoint=True)
+            for q in BATTERY
+        ]
+    ).astype(np.uint8)
+
+
+def test_battery_matches_separate_scoring():
+    """
+    A battery should give the same scores as its questionnaires scored one by one.
+    """
+    responses = battery_responses(300)
+    scorer = compile_battery(BATTERY)
+    scores = scorer(responses)
+
+    column = 0
+    for questionnaire in BATTERY:
+        items = questionnaire.scoring.items
+        separate = score(questionnaire, responses[:, column : column + items])
+        for name, values in separate.items():
+            index = scorer.names.index(f"{default_name(questionnaire)}_{name}")
+            assert np.array_equal(scores[:, index], values)
+        column += items
+
+
+@pytest.mark.parametrize("from_file", [False, True])
+def test_parallel_matches_serial(tmp_path, from_file):
+    """
+    Parallel scores should be exactly the serial ones, in the original order.
+    """
+    responses = battery_responses(2500)
+    serial = compile_battery(BATTERY)(responses)
+    source = responses
+    if from_file:
+        source = tmp_path / "responses.npy"
+        np.save(source, responses)
+
+    parallel = score_parallel(BATTERY, source, workers=3, chunk_size=300)
+
+    assert list(parallel) == list(compile_battery(BATTERY).names)
+    assert np.array_equal(np.column_stack(list(parallel.values())), serial)
+
+
+def test_single_questionnaire_in_one_worker():
+    """
+    A single questionnaire and one worker should fall back to the serial path.
+    """
+    responses = battery_responses(50)[:, :10]
+    assert np.array_equal(
+        score_parallel(rses, responses, workers=1)["total"],
+        score(rses, responses)["total"],
+    )
@@ -0,0 +1,65 @@
+"""Test the index of questionnaires."""
+
+import pytest
+
+from veleslibrary import registry
+
+
+def test_index_is_up_to_date():
+    """
+    The stored index should list everything in the packages.
+    Run `python -m veleslibrary.registry` if this fails.
+    """
+    assert registry.discover() == registry.entries()
+
+
+def test_lookup_does_not_import_questionnaires(run_isolated):
+    """
+    Looking up metadata shouldn't import the questionnaire modules or velesresearch.
+    """
+    run_isolated(
+        """
+        import sys
+        from veleslibrary import registry
+
+        entry = registry.get("tls_15", "hu")
+        assert (entry.items, entry.scale_length) == (15, 5)
+        assert [e.lang for e in registry.entries(code="tls_15")] == ["en", "es", "hu", "pl", "sv"]
+        assert "velesresearch" not in sys.modules
+        assert "veleslibrary.questionnaires.hu.tls_15" not in sys.modules
+        """
+    )
+
+
+def test_metadata():
+    """
+    Metadata should come from the specs and the docstrings.
+    """
+    rses = registry.get("rses", "pl")
+    assert rses.title == "Rosenberg Self-Esteem Scale (RSES)"
+    assert rses.citation.startswith("Rosenberg, M. (2011).")
+    assert "<" not in rses.adaptation
+    assert registry.get("nfcs").short_form == "nfcsShort"
+    assert registry.get("nfcsShort").long_form == "nfcs"
+    assert registry.get("rses").short_form is None
+
+
+def test_factory():
+    """
+    Entries should resolve and call the questionnaire functions.
+    """
+    from veleslibrary.questionnaires import pl
+
+    entry = registry.get("tipi", "pl")
+    assert entry.factory is pl.tipi
+    assert entry(name="X").dict() == pl.tipi(name="X").dict()
+    assert [e.code for e in registry.entries(lang="pl")] == ["tipi", "rses", "tls_15"]
+
+
+def test_unknown():
+    """
+    Unknown questionnaires should raise a KeyError.
+    """
+    with pytest.raises(KeyError):
+        registry.get("tipi", "en")
+    assert registry.entries(lang="xx") == []
@@ -0,0 +1,97 @@
+"""Test the streaming reliability statistics."""
+
+import json
+
+import numpy as np
+
+from veleslibrary.questionnaires import nfcs, rses
+from veleslibrary.reliability import ItemStatistics, ReliabilityMonitor
+from veleslibrary.scoring import reverse_key
+
+
+def correlated_responses(n, items, low, high, seed=3):
+    """
+    Answers driven by one common factor, so that α is clearly positive.
+    """
+    rng = np.random.default_rng(seed)
+    factor = rng.normal(size=(n, 1))
+    noise = rng.normal(size=(n, items))
+    raw = (high + low) / 2 + factor + noise
+    return np.clip(np.rint(raw), low, high)
+
+
+def direct_alpha(data):
+    """
+    Cronbach's α from the full data.
+    """
+    covariance = np.cov(data, rowvar=False)
+    k = data.shape[1]
+    return k / (k - 1) * (1 - np.trace(covariance) / covariance.sum())
+
+
+def test_batches_and_merges_match_full_data():
+    """
+    Batch updates and merged shards should give the statistics of the whole data set.
+    """
+    data = correlated_responses(3000, 6, 1, 5)
+    whole = ItemStatistics(6).update(data)
+
+    shards = [ItemStatistics(6) for _ in range(3)]
+    for i, batch in enumerate(np.array_split(data, 17)):
+        shards[i % 3].update(batch)
+    # The third shard comes from another node as JSON
+    remote = ItemStatistics.from_state(json.loads(json.dumps(shards[2].state())))
+    merged = shards[0].merge(shards[1]).merge(remote)
+
+    assert merged.n == whole.n == 3000
+    assert np.allclose(merged.mean, data.mean(axis=0))
+    assert np.allclose(merged.covariance(), np.cov(data, rowvar=False))
+    assert np.isclose(merged.alpha(), direct_alpha(data))
+
+
+def test_item_total_correlations():
+    """
+    Corrected item-total correlations should correlate each item with the sum of the others.
+    """
+    data = correlated_responses(1000, 5, 1, 7)
+    statistics = ItemStatistics(5).update(data)
+    expected = [
+        np.corrcoef(data[:, i], np.delete(data, i, axis=1).sum(axis=1))[0, 1]
+        for i in range(5)
+    ]
+    assert np.allclose(statistics.item_total_correlations(), expected)
+    assert np.isclose(
+        statistics.item_total_correlations([2, 4])[0],
+        np.corrcoef(data[:, 1], data[:, 3])[0, 1],
+    )
+
+
+def test_monitor_keys_reverse_items_and_subscales():
+    """
+    The monitor should reverse-key the items and report every subscale.
+    """
+    responses = correlated_responses(2000, 41, 1, 6)
+    reverse = np.asarray(nfcs.scoring.reverse) - 1
+    responses[:, reverse] = 7 - responses[:, reverse]
+
+    monitor = ReliabilityMonitor(nfcs)
+    for batch in np.array_split(responses, 4):
+        monitor.update(batch)
+    alpha = monitor.alpha()
+
+    keyed = reverse_key(nfcs.scoring, responses)
+    assert list(alpha) == ["total", *nfcs.scoring.subscales]
+    assert np.isclose(alpha["total"], direct_alpha(keyed))
+    order = np.asarray(nfcs.scoring.subscales["Need for order"]) - 1
+    assert np.isclose(alpha["Need for order"], direct_alpha(keyed[:, order]))
+    assert alpha["total"] > 0.9
+
+
+def test_missing_rows_are_skipped():
+    """
+    Rows with missing answers should be left out.
+    """
+    responses = correlated_responses(100, 10, 1, 4)
+    responses[::10, 0] = np.nan
+    monitor = ReliabilityMonitor(rses).update(responses)
+    assert monitor.statistics.n == 90
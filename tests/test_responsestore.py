@@ -0,0 +1,112 @@
+"""Test the uint8 response store."""
+
+import json
+
+import numpy as np
+import pytest
+
+from veleslibrary.questionnaires import mini_cope, nfcs, rses
+from veleslibrary.reliability import ReliabilityMonitor
+from veleslibrary.responsestore import MISSING, ResponseStore
+from veleslibrary.scoring import MissingPolicy, score
+from veleslibrary.specs import ScoringSpec
+
+
+def answers(questionnaire, rows, seed=0, missing=0.0):
+    """
+    Draw random coded answers with a share of missing ones.
+    """
+    rng = np.random.default_rng(seed)
+    low, high = questionnaire.scoring.response_range
+    responses = rng.integers(low, high + 1, (rows, questionnaire.scoring.items))
+    responses = responses.astype(np.float64)
+    responses[rng.random(responses.shape) < missing] = np.nan
+    return responses
+
+
+def test_round_trip(tmp_path):
+    """
+    Reopened stores should return the same answers as memory-mapped uint8 arrays.
+    """
+    first = {"RSES": answers(rses, 100, 1), "COPE": answers(mini_cope, 100, 2, 0.1)}
+    second = {"RSES": answers(rses, 50, 3, 0.1), "COPE": answers(mini_cope, 50, 4)}
+    store = ResponseStore.create(tmp_path, {"RSES": rses, "COPE": mini_cope})
+    store.append(first)
+    assert isinstance(store.codes("RSES"), np.memmap)
+    store.append(second)
+
+    store = ResponseStore(tmp_path)
+    assert len(store) == 150
+    assert store.nbytes == 150 * (10 + 28)
+    assert store.specs["COPE"] == mini_cope.scoring
+    assert store.questionnaires["RSES"] == "veleslibrary.questionnaires.rses.rses"
+    codes = store.codes("COPE")
+    assert codes.dtype == np.uint8
+    assert not isinstance(codes, np.memmap)
+    assert all(isinstance(block, np.memmap) for block in store.blocks("COPE"))
+    expected = np.concatenate([first["COPE"], second["COPE"]])
+    assert (codes == np.nan_to_num(expected, nan=MISSING)).all()
+    assert not store.blocks("RSES")[0].flags.writeable
+    decoded = np.concatenate(list(store.chunks("RSES", chunk_size=32)))
+    assert np.array_equal(
+        decoded, np.concatenate([first["RSES"], second["RSES"]]), equal_nan=True
+    )
+
+
+def test_scoring_and_reliability(tmp_path):
+    """
+    Scores and reliability from the store should match the ones of the original answers.
+    """
+    responses = answers(nfcs, 1000, missing=0.02)
+    store = ResponseStore.create(tmp_path, [nfcs])
+    store.append({"NFCS": responses[:600]})
+    store.append({"NFCS": responses[600:]})
+
+    policy = MissingPolicy("prorate", 0.8)
+    scores = store.score(missing=policy, chunk_size=128)
+    expected = score(nfcs, responses, missing=policy)
+    assert set(scores) == {f"NFCS_{name}" for name in expected}
+    for name, column in expected.items():
+        assert np.array_equal(scores[f"NFCS_{name}"], column, equal_nan=True)
+    by_column = store.score(missing={"NFCS_total": policy})
+    assert np.array_equal(by_column["NFCS_total"], expected["total"], equal_nan=True)
+
+    alpha = ReliabilityMonitor(nfcs).update(responses).alpha()
+    assert store.reliability("NFCS", chunk_size=100).alpha() == pytest.approx(alpha)
+
+
+def test_invalid_answers(tmp_path):
+    """
+    Answers out of range, mismatched rows and unknown questionnaires should be refused.
+    """
+    store = ResponseStore.create(tmp_path, {"RSES": rses, "COPE": mini_cope})
+    valid = {"RSES": answers(rses, 10), "COPE": answers(mini_cope, 10)}
+    for invalid in (
+        {**valid, "RSES": valid["RSES"] + 0.5},
+        {**valid, "COPE": valid["COPE"] + 4},
+        {**valid, "COPE": valid["COPE"][:5]},
+        {"RSES": valid["RSES"]},
+    ):
+        with pytest.raises(ValueError):
+            store.append(invalid)
+    assert len(ResponseStore(tmp_path)) == 0
+    with pytest.raises(KeyError):
+        store.codes("NFCS")
+    with pytest.raises(FileExistsError):
+        ResponseStore.create(tmp_path, [rses])
+    with pytest.raises(ValueError):
+        ResponseStore.create(tmp_path / "wide", {"X": ScoringSpec(2, (1, 300))})
+
+
+def test_schema_is_plain_json(tmp_path):
+    """
+    The schema should describe the questionnaires and blocks without any pickled objects.
+    """
+    store = ResponseStore.create(tmp_path, [rses])
+    store.append({"RSES": answers(rses, 7)})
+    schema = json.loads((tmp_path / "schema.json").read_text(encoding="utf-8"))
+
+    assert schema["missing"] == MISSING
+    assert schema["blocks"] == [7]
+    assert ScoringSpec.from_dict(schema["questionnaires"][0]["spec"]) == rses.scoring
+    assert (tmp_path / "RSES" / "000000.npy").exists()
@@ -0,0 +1,174 @@
+"""Test the vectorized scoring."""
+
+import numpy as np
+import pytest
+
+from veleslibrary.compiled import factories
+from veleslibrary.questionnaires import mini_cope, rses, sd3
+from veleslibrary.questionnaires.pl import rses as rses_pl
+from veleslibrary.scoring import (
+    MISSING_METHODS,
+    MissingPolicy,
+    compile_battery,
+    compile_spec,
+    score,
+)
+
+FACTORIES = list(factories())
+
+
+def reference_scores(spec, responses):
+    """
+    Score the responses item by item, following the spec literally.
+    """
+    low, high = spec.response_range
+    keyed = responses.astype(float)
+    for item in spec.reverse:
+        keyed[:, item - 1] = low + high - keyed[:, item - 1]
+    groups = ([range(1, spec.items + 1)] if spec.total else []) + list(
+        spec.subscales.values()
+    )
+    aggregate = np.mean if spec.aggregation == "mean" else np.sum
+    return np.column_stack(
+        [aggregate(keyed[:, np.asarray(items) - 1], axis=1) for items in groups]
+    )
+
+
+@pytest.mark.parametrize("lang, code, function", FACTORIES)
+def test_matches_reference(lang, code, function):
+    """
+    The matrix product should give the same scores as item-by-item scoring.
+    """
+    spec = function.scoring
+    low, high = spec.response_range
+    responses = np.random.default_rng(1).integers(low, high + 1, (500, spec.items))
+
+    scores = compile_spec(spec)(responses, chunk_size=128)
+    assert np.allclose(scores, reference_scores(spec, responses))
+
+
+def test_rses_by_hand():
+    """
+    Reverse items 3, 5, 8, 9, 10 of RSES should be recoded 1↔4 and 2↔3.
+    """
+    responses = np.array([[4] * 10, [1, 2, 3, 4, 1, 2, 3, 4, 1, 2]], dtype=np.uint8)
+    assert score(rses, responses)["total"].tolist() == [25, 26]
+
+
+@pytest.mark.parametrize("questionnaire", [rses, rses_pl])
+def test_rses_choice_values(questionnaire):
+    """
+    RSES choices are listed from "Strongly Agree", and higher self-esteem should give a higher total.
+    """
+    spec = questionnaire.scoring
+    element = next(e for e in questionnaire().dict()["elements"] if "choices" in e)
+    values = dict(zip(element["choices"], spec.choice_values))
+    agree, disagree = element["choices"][0], element["choices"][-1]
+    items = range(1, spec.items + 1)
+    patterns = [
+        [agree] * spec.items,
+        [disagree if item in spec.reverse else agree for item in items],
+        [agree if item in spec.reverse else disagree for item in items],
+    ]
+    responses = np.array([[values[choice] for choice in row] for row in patterns])
+
+    assert spec.choice_values == (4, 3, 2, 1)
+    assert score(questionnaire, responses)["total"].tolist() == [25, 40, 10]
+
+
+def test_names_and_average():
+    """
+    Mini-COPE has no total score and its subscales are averages.
+    """
+    responses = np.tile(np.arange(28) % 4, (3, 1))
+    scores = score(mini_cope, responses)
+    assert "total" not in scores
+    assert scores["Active Coping"].tolist() == [0.5] * 3
+    assert scores["Self-Blame"].tolist() == [2.5] * 3
+
+
+def test_wrong_shape():
+    """
+    Arrays with a wrong number of items should be rejected.
+    """
+    with pytest.raises(ValueError):
+        score(rses, np.ones((5, 9)))
+
+
+def reference_missing(spec, responses, policy):
+    """
+    Score the responses row by row with a missing-data policy.
+    """
+    low, high = spec.response_range
+    keyed = responses.astype(float)
+    for item in spec.reverse:
+        keyed[:, item - 1] = low + high - keyed[:, item - 1]
+    groups = ([range(1, spec.items + 1)] if spec.total else []) + list(
+        spec.subscales.values()
+    )
+    scores = np.full((len(keyed), len(groups)), np.nan)
+    for row, values in enumerate(keyed):
+        for column, items in enumerate(groups):
+            group = values[np.asarray(items) - 1]
+            answered = group[~np.isnan(group)]
+            if len(answered) < policy.required(len(group)) or not len(answered):
+                continue
+            if policy.method == "nan" and len(answered) < len(group):
+                continue
+            if policy.method == "person_mean":
+                group = np.where(np.isnan(group), np.nanmean(values), group)
+            else:
+                group = np.full(len(group), answered.mean())
+            scores[row, column] = (
+                group.mean() if spec.aggregation == "mean" else group.sum()
+            )
+    return scores
+
+
+@pytest.mark.parametrize("method", MISSING_METHODS)
+@pytest.mark.parametrize("questionnaire", [rses, sd3, mini_cope])
+def test_missing_policies_match_reference(questionnaire, method):
+    """
+    Every policy should match row-by-row scoring, with and without a minimum of answered items.
+    """
+    spec = questionnaire.scoring
+    low, high = spec.response_range
+    rng = np.random.default_rng(2)
+    responses = rng.integers(low, high + 1, (300, spec.items)).astype(float)
+    responses[rng.random(responses.shape) < 0.2] = np.nan
+    responses[0] = np.nan
+
+    for policy in (MissingPolicy(method), MissingPolicy(method, min_answered=0.75)):
+        scores = compile_spec(spec)(responses, chunk_size=64, missing=policy)
+        assert np.allclose(
+            scores, reference_missing(spec, responses, policy), equal_nan=True
+        )
+
+
+def test_policies_per_score():
+    """
+    Scores without a policy of their own should stay NaN with missing answers.
+    """
+    responses = np.full((1, 27), 3.0)
+    responses[0, [0, 9]] = np.nan
+    scores = score(sd3, responses, missing={"Narcissism": MissingPolicy("prorate")})
+
+    assert np.isnan(scores["Machiavellianism"][0])
+    assert scores["Narcissism"][0] == 27
+    assert scores["Psychopathy"][0] == 27
+    with pytest.raises(ValueError):
+        score(sd3, responses, missing={"Unknown": MissingPolicy()})
+    with pytest.raises(ValueError):
+        MissingPolicy("mean")
+
+
+def test_person_mean_in_battery():
+    """
+    Person means should come from the items of the same questionnaire of a battery.
+    """
+    responses = np.column_stack([np.full((1, 10), 4.0), np.full((1, 28), 1.0)])
+    responses[0, 11] = np.nan
+    scores = compile_battery([rses, mini_cope])(
+        responses, missing=MissingPolicy("person_mean")
+    )
+    assert scores[0, 1] == 1
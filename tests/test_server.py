@@ -0,0 +1,219 @@
+"""Test the local questionnaire service."""
+
+import asyncio
+import gzip
+import json
+import threading
+
+from veleslibrary.artifacts import ArtifactCache, artifact, canonical_json
+from veleslibrary.questionnaires import tls_15
+from veleslibrary.questionnaires.pl import rses as pl_rses
+from veleslibrary.server import QuestionnaireServer, accepts_gzip
+
+
+async def request(port, target, headers=None, method="GET"):
+    """Send one request and return the status, headers and body"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    lines = [f"{method} {target} HTTP/1.1", "Host: localhost", "Connection: close"]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    status, *fields = head.decode("latin-1").split("\r\n")
+    fields = dict(field.split(": ", 1) for field in fields)
+    return int(status.split()[1]), fields, body
+
+
+def serve(check, **kwargs):
+    """Run a check against a server on a free port"""
+
+    async def run():
+        async with QuestionnaireServer(port=0, **kwargs) as server:
+            await check(server)
+
+    asyncio.run(run())
+
+
+def test_serves_questionnaire_json():
+    """
+    The body should be the canonical JSON of the questionnaire built with the query.
+    """
+
+    async def check(server):
+        status, headers, body = await request(
+            server.port,
+            "/q/pl/rses?name=RSES_pre&options=%7B%22questionOptions%22%3A"
+            "%7B%22isRequired%22%3Atrue%7D%7D",
+        )
+        expected = pl_rses(name="RSES_pre", questionOptions={"isRequired": True})
+        assert status == 200
+        assert body == canonical_json(expected.dict())
+        assert headers["Content-Type"] == "application/json; charset=utf-8"
+        assert headers["ETag"].startswith('"')
+
+    serve(check)
+
+
+def test_conditional_get_and_gzip():
+    """
+    A matching If-None-Match should get a 304 and gzip should be used when accepted, with its own ETag.
+    """
+
+    async def check(server):
+        accept = {"Accept-Encoding": "gzip, br"}
+        _, headers, body = await request(server.port, "/q/en/tls_15", accept)
+        assert headers["Content-Encoding"] == "gzip"
+        assert headers["Vary"] == "Accept-Encoding"
+        assert json.loads(gzip.decompress(body)) == tls_15().dict()
+
+        status, headers2, body = await request(
+            server.port, "/q/en/tls_15", accept | {"If-None-Match": headers["ETag"]}
+        )
+        assert (status, body) == (304, b"")
+        assert headers2["ETag"] == headers["ETag"]
+
+        status, identity, body = await request(
+            server.port, "/q/en/tls_15", {"If-None-Match": headers["ETag"]}
+        )
+        assert status == 200 and "Content-Encoding" not in identity
+        assert identity["ETag"] != headers["ETag"]
+        assert identity["ETag"] == artifact(tls_15).etag
+
+    serve(check)
+
+
+def test_errors():
+    """
+    Unknown questionnaires, parameters and methods should get JSON errors.
+    """
+
+    async def check(server):
+        status, _, body = await request(server.port, "/q/en/unknown")
+        assert status == 404
+        assert "unknown" in json.loads(body)["error"]
+        assert (await request(server.port, "/q/en/rses?foo=1"))[0] == 400
+        assert (await request(server.port, "/q/en/rses?options=[1]"))[0] == 400
+        status, _, _ = await request(server.port, '/q/en/tls_15?options={"lang":"pl"}')
+        assert status == 400
+        assert (await request(server.port, "/other"))[0] == 404
+        status, headers, _ = await request(server.port, "/q/en/rses", method="POST")
+        assert (status, headers["Allow"]) == (405, "GET, HEAD")
+
+    serve(check)
+
+
+def test_unexpected_errors_are_logged(caplog):
+    """
+    A failing build should get a 500, be logged and close only its own connection.
+    """
+    cache = ArtifactCache()
+
+    def failing_get(*args, **kwargs):
+        raise RuntimeError("broken questionnaire")
+
+    cache.get = failing_get
+
+    async def check(server):
+        status, headers, _ = await request(server.port, "/q/en/sd3")
+        assert (status, headers["Connection"]) == (500, "close")
+        assert (await request(server.port, "/q/en/unknown"))[0] == 404
+
+    serve(check, cache=cache)
+    (record,) = [r for r in caplog.records if r.levelname == "ERROR"]
+    assert record.name == "veleslibrary.server"
+    assert "GET /q/en/sd3" in record.getMessage()
+    assert "broken questionnaire" in str(record.exc_info[1])
+
+
+def test_concurrent_misses_build_once():
+    """
+    Many clients asking for the same new questionnaire should wait for a single build.
+    """
+    cache = ArtifactCache()
+    threads = set()
+    get = cache.get
+
+    def tracking_get(*args, **kwargs):
+        threads.add(threading.get_ident())
+        return get(*args, **kwargs)
+
+    cache.get = tracking_get
+
+    async def check(server):
+        responses = await asyncio.gather(
+            *(request(server.port, "/q/en/sd3?name=SD3_pre") for _ in range(50))
+        )
+        assert {status for status, _, _ in responses} == {200}
+        assert len({headers["ETag"] for _, headers, _ in responses}) == 1
+        info = cache.info()
+        assert (info.misses, info.size) == (1, 1)
+        assert len(threads) == 1
+        assert threading.get_ident() not in threads
+
+    serve(check, cache=cache)
+
+
+def test_keep_alive():
+    """
+    An HTTP/1.1 connection should answer several requests.
+    """
+
+    async def check(server):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        for _ in range(3):
+            writer.write(b"HEAD /q/en/rses HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            head = await reader.readuntil(b"\r\n\r\n")
+            assert head.startswith(b"HTTP/1.1 200 OK")
+            assert b"Connection: close" not in head
+        writer.close()
+        await writer.wait_closed()
+
+    serve(check)
+
+
+def test_accepts_gzip():
+    """
+    gzip should be used unless missing or refused with q=0.
+    """
+    assert accepts_gzip("gzip, deflate")
+    assert accepts_gzip("br;q=1.0, *;q=0.5")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("br")
+    assert not accepts_gzip(None)
+
+
+def test_questionnaire_modules_are_imported_off_the_loop(run_isolated):
+    """
+    The first request for a questionnaire should import its module in the executor.
+    """
+    run_isolated(
+        """
+        import asyncio
+        import sys
+        import threading
+
+        from veleslibrary.server import QuestionnaireServer
+
+        importers = []
+
+        class Recorder:
+            def find_spec(self, name, path=None, target=None):
+                if name == "veleslibrary.questionnaires.sd3":
+                    importers.append(threading.current_thread())
+                return None
+
+        sys.meta_path.insert(0, Recorder())
+
+        async def run():
+            async with QuestionnaireServer(port=0) as server:
+                await server.artifact("en", "sd3")
+                await server.artifact("en", "sd3", "name=SD3_pre")
+
+        asyncio.run(run())
+        assert len(importers) == 1
+        assert importers[0] is not threading.main_thread()
+        """
+    )
@@ -0,0 +1,92 @@
+"""Test that the scoring specs agree with the docstrings and the questionnaires."""
+
+import re
+
+import pytest
+
+from veleslibrary.compiled import factories
+from veleslibrary.specs import ScoringSpec
+
+FACTORIES = list(factories())
+
+
+def docstring_sections(function):
+    """
+    Split the docstring of a questionnaire into its `## ` sections.
+
+    :param function: The questionnaire function.
+    :return: A dictionary of section titles and their stripped contents.
+    """
+    sections = {}
+    title = None
+    for line in function.__doc__.splitlines():
+        if line.strip().startswith("## "):
+            title = line.strip()[3:].rstrip(":")
+            sections[title] = []
+        elif line.strip().startswith("Args:"):
+            title = None
+        elif title is not None and line.strip():
+            sections[title].append(line.strip())
+    return sections
+
+
+def item_numbers(text):
+    """
+    Parse a comma-separated list of item numbers. "None." means no items.
+    """
+    if text == "None.":
+        return ()
+    return tuple(int(item) for item in text.split(","))
+
+
+@pytest.mark.parametrize("lang, code, function", FACTORIES)
+def test_spec_matches_docstring(lang, code, function):
+    """
+    Reverse items, subscales and score calculation should be the same as in the docstring.
+    """
+    spec = function.scoring
+    sections = docstring_sections(function)
+
+    assert isinstance(spec, ScoringSpec)
+    assert spec.reverse == item_numbers(" ".join(sections["Reverse items"]))
+
+    subscales = {}
+    for line in sections["Subscales"]:
+        if line != "None.":
+            subscale, items = re.fullmatch(r"\d+\. (.+?): (.+)", line).groups()
+            subscales[subscale] = item_numbers(items)
+    assert spec.subscales == subscales
+
+    aggregations = {"A simple sum.": "sum", "An average.": "mean"}
+    calculation = sections["Score calculation"][0].split(" Can ")[0]
+    assert spec.aggregation == aggregations[calculation]
+
+
+@pytest.mark.parametrize("lang, code, function", FACTORIES)
+def test_spec_matches_questionnaire(lang, code, function):
+    """
+    The number of items and the response range should agree with the built questionnaire.
+    """
+    spec = function.scoring
+    low, high = spec.response_range
+    items = []
+    for element in function().dict()["elements"]:
+        if element["type"] == "radiogroup":
+            items.append(element["name"])
+            assert len(element["choices"]) == high - low + 1
+        elif element["type"] == "matrixdropdown":
+            items.extend(row["value"] for row in element["rows"])
+            assert element["columns"][0]["rateMax"] - 1 == high - low
+
+    assert len(items) == spec.items
+    assert items[-1].endswith(f"_{spec.items}")
+
+
+def test_invalid_spec():
+    """
+    Items out of range and unknown aggregations should be rejected.
+    """
+    with pytest.raises(ValueError):
+        ScoringSpec(5, (1, 4), reverse=(6,))
+    with pytest.raises(ValueError):
+        ScoringSpec(5, (1, 4), aggregation="median")
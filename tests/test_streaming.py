@@ -0,0 +1,273 @@
+"""Test the streaming scoring of exports."""
+
+import csv
+import json
+import tracemalloc
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from veleslibrary import streaming
+from veleslibrary.questionnaires import nfcsShort, rses
+from veleslibrary.questionnaires.pl import rses as rses_pl
+from veleslibrary.scoring import MissingPolicy, score
+from veleslibrary.streaming import (
+    Checkpoint,
+    read_rows,
+    score_file,
+    score_rows,
+    update_file,
+)
+
+RSES_CHOICES = ["Strongly Agree", "Agree", "Disagree", "Strongly Disagree"]
+
+
+def export_rows(n, seed=0):
+    """
+    Generate SurveyJS-like results: RSES as choice texts and nested NFCS short matrix.
+    """
+    rng = np.random.default_rng(seed)
+    rses_answers = rng.integers(1, 5, (n, 10))
+    nfcs_answers = rng.integers(1, 7, (n, 15))
+    rows = []
+    for i in range(n):
+        row = {"id": i}
+        row |= {
+            f"RSES_{j + 1}": RSES_CHOICES[4 - a] for j, a in enumerate(rses_answers[i])
+        }
+        row["NFCS"] = {
+            f"NFCS_{j + 1}": {"NFCS": int(a)} for j, a in enumerate(nfcs_answers[i])
+        }
+        rows.append(row)
+    return rows, rses_answers, nfcs_answers
+
+
+def write_jsonl(path, rows):
+    with open(path, "w", encoding="utf-8") as file:
+        for row in rows:
+            file.write(json.dumps(row) + "\n")
+
+
+def test_scores_match_batch_scoring(tmp_path):
+    """
+    Streamed scores should equal scoring the whole matrix at once.
+    """
+    rows, rses_answers, nfcs_answers = export_rows(250)
+    write_jsonl(tmp_path / "results.jsonl", rows)
+
+    stats = score_file(
+        tmp_path / "results.jsonl",
+        tmp_path / "scores.jsonl",
+        [rses, nfcsShort],
+        keep=["id"],
+        chunk_size=64,
+    )
+    scored = list(read_rows(tmp_path / "scores.jsonl"))
+
+    assert stats.rows == 250 and stats.rows_per_second > 0
+    assert [row["id"] for row in scored] == list(range(250))
+    assert np.allclose(
+        [row["RSES_total"] for row in scored], score(rses, rses_answers)["total"]
+    )
+    assert np.allclose(
+        [row["NFCS_total"] for row in scored], score(nfcsShort, nfcs_answers)["total"]
+    )
+
+
+def test_csv_with_custom_names_and_missing_answers(tmp_path):
+    """
+    Custom question names should be used for the columns, and missing answers give empty scores.
+    """
+    with open(tmp_path / "results.csv", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["pid"] + [f"RSES_pre_{i}" for i in range(1, 11)])
+        writer.writerow(["a"] + [4] * 10)
+        writer.writerow(["b"] + [4] * 9 + [""])
+
+    score_file(
+        tmp_path / "results.csv",
+        tmp_path / "scores.csv",
+        {"RSES_pre": rses},
+        keep=["pid"],
+    )
+    with open(tmp_path / "scores.csv", encoding="utf-8", newline="") as file:
+        scored = list(csv.DictReader(file))
+
+    assert scored == [
+        {"pid": "a", "RSES_pre_total": "25.0"},
+        {"pid": "b", "RSES_pre_total": ""},
+    ]
+
+
+def test_rses_text_answers():
+    """
+    RSES choice texts are listed from "Strongly Agree" and should be coded by their values.
+    """
+    polish = ["1 – zdecydowanie zgadzam się", "4 – zdecydowanie nie zgadzam się"]
+    rows = []
+    for agree, disagree in [RSES_CHOICES[::3], polish]:
+        rows += [
+            {f"RSES_{i}": agree for i in range(1, 11)},
+            {
+                f"RSES_{i}": disagree if i in rses.scoring.reverse else agree
+                for i in range(1, 11)
+            },
+            {
+                f"RSES_{i}": agree if i in rses.scoring.reverse else disagree
+                for i in range(1, 11)
+            },
+        ]
+
+    english = next(score_rows(rows[:3], [rses]))
+    polish = next(score_rows(rows[3:], [rses_pl]))
+    assert [row["RSES_total"] for row in english + polish] == [25, 40, 10] * 2
+
+
+def test_malformed_answers_are_missing():
+    """
+    Objects and lists in answer cells should be NaN without failing the other rows.
+    """
+    rows = [{f"RSES_{i}": 4 for i in range(1, 11)} for _ in range(4)]
+    rows[1]["RSES_4"] = {"x": 1}
+    rows[2]["RSES_4"] = [1, 2]
+    rows[3] = {f"RSES_{i}": [4] for i in range(1, 11)}
+
+    scored = next(score_rows(rows, [rses]))
+    assert scored[0]["RSES_total"] == 25
+    assert all(np.isnan(row["RSES_total"]) for row in scored[1:])
+    assert np.isnan(next(score_rows(rows[3:], [rses]))[0]["RSES_total"])
+
+
+def test_memory_is_bounded():
+    """
+    Peak memory should depend on the chunk size, not on the number of rows.
+    """
+
+    def peak(n):
+        rows = (export_rows(1, seed=i)[0][0] for i in range(n))
+        tracemalloc.start()
+        for _ in score_rows(rows, [rses, nfcsShort], chunk_size=100):
+            pass
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak_memory
+
+    assert peak(2000) < 1.5 * peak(500)
+
+
+def test_missing_policy_by_score_column():
+    """
+    Policies keyed by score columns should apply only to their questionnaire.
+    """
+    row = {f"RSES_pre_{i}": 4 for i in range(1, 10)}
+    row |= {f"RSES_post_{i}": 4 for i in range(1, 10)}
+    (scored,) = next(
+        score_rows(
+            [row],
+            {"RSES_pre": rses, "RSES_post": rses},
+            missing={"RSES_post_total": MissingPolicy("prorate", min_answered=0.8)},
+        )
+    )
+    assert np.isnan(scored["RSES_pre_total"])
+    assert scored["RSES_post_total"] == pytest.approx(24 * 10 / 9)
+    with pytest.raises(ValueError):
+        next(score_rows([row], [rses], missing={"RSES_pre_total": MissingPolicy()}))
+
+
+def test_incremental_update(tmp_path):
+    """
+    Later runs should score only the appended rows and match scoring the whole export.
+    """
+    rows, _, _ = export_rows(300)
+    source, destination = tmp_path / "results.jsonl", tmp_path / "scores.jsonl"
+    write_jsonl(source, rows[:200])
+    with open(source, "a", encoding="utf-8") as file:
+        # A row that's still being written
+        file.write(json.dumps(rows[200])[:20])
+
+    assert update_file(source, destination, [rses], keep=["id"]).rows == 200
+    with open(source, "r+", encoding="utf-8") as file:
+        file.truncate(file.seek(0, 2) - 20)
+    with open(source, "a", encoding="utf-8") as file:
+        for row in rows[200:]:
+            file.write(json.dumps(row) + "\n")
+    assert (
+        update_file(source, destination, [rses], keep=["id"], chunk_size=32).rows == 100
+    )
+    assert update_file(source, destination, [rses], keep=["id"]).rows == 0
+
+    score_file(source, tmp_path / "full.jsonl", [rses], keep=["id"])
+    assert destination.read_text() == (tmp_path / "full.jsonl").read_text()
+    checkpoint = Checkpoint.load(tmp_path / "scores.jsonl.checkpoint.json")
+    assert checkpoint.rows == 300 and checkpoint.offset == source.stat().st_size
+
+
+def test_incremental_update_of_csv(tmp_path):
+    """
+    CSV exports should keep a single header and resume after rows with quoted newlines.
+    """
+    source, destination = tmp_path / "results.csv", tmp_path / "scores.csv"
+    with open(source, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["pid"] + [f"RSES_{i}" for i in range(1, 11)])
+        writer.writerow(["a\nb"] + [4] * 10)
+    update_file(source, destination, [rses], keep=["pid"])
+    with open(source, "a", encoding="utf-8", newline="") as file:
+        csv.writer(file).writerow(["c"] + [1] * 10)
+    assert update_file(source, destination, [rses], keep=["pid"]).rows == 1
+
+    with open(destination, encoding="utf-8", newline="") as file:
+        assert list(csv.DictReader(file)) == [
+            {"pid": "a\nb", "RSES_total": "25.0"},
+            {"pid": "c", "RSES_total": "25.0"},
+        ]
+
+
+def test_incremental_update_waits_for_open_quotes(tmp_path):
+    """
+    A CSV row cut inside a quoted multi-line field should be left until it's complete.
+    """
+    source, destination = tmp_path / "results.csv", tmp_path / "scores.csv"
+    header = ",".join(["pid"] + [f"RSES_{i}" for i in range(1, 11)])
+    source.write_text(f"{header}\n" + "a" + ",4" * 10 + '\n"line one\n', "utf-8")
+    assert update_file(source, destination, [rses], keep=["pid"]).rows == 1
+    checkpoint = Checkpoint.load(tmp_path / "scores.csv.checkpoint.json")
+
+    with open(source, "a", encoding="utf-8", newline="") as file:
+        file.write('line two"' + ",1" * 10 + "\n")
+    assert update_file(source, destination, [rses], keep=["pid"]).rows == 1
+    assert checkpoint.offset == len(f"{header}\n") + len("a" + ",4" * 10 + "\n")
+
+    with open(destination, encoding="utf-8", newline="") as file:
+        assert list(csv.DictReader(file)) == [
+            {"pid": "a", "RSES_total": "25.0"},
+            {"pid": "line one\nline two", "RSES_total": "25.0"},
+        ]
+
+
+def test_changed_setup_forces_recompute(tmp_path, monkeypatch):
+    """
+    A new scoring spec, missing-data policy or library version should rescore everything.
+    """
+    _, rses_answers, _ = export_rows(50)
+    rows = [{f"RSES_{j + 1}": int(a) for j, a in enumerate(r)} for r in rses_answers]
+    source, destination = tmp_path / "results.jsonl", tmp_path / "scores.jsonl"
+    write_jsonl(source, rows)
+    update_file(source, destination, {"RSES": rses})
+    assert update_file(source, destination, {"RSES": rses}).rows == 0
+
+    mean_spec = replace(rses.scoring, aggregation="mean")
+    assert update_file(source, destination, {"RSES": mean_spec}).rows == 50
+    scored = list(read_rows(destination))
+    assert len(scored) == 50 and scored[0]["RSES_total"] <= 4
+
+    policy = MissingPolicy("prorate")
+    assert (
+        update_file(source, destination, {"RSES": mean_spec}, missing=policy).rows == 50
+    )
+    monkeypatch.setattr(streaming, "_version", lambda: "99.0")
+    assert (
+        update_file(source, destination, {"RSES": mean_spec}, missing=policy).rows == 50
+    )
+    assert len(list(read_rows(destination))) == 50
@@ -0,0 +1,75 @@
+"""Test the shared stylesheets."""
+
+import json
+
+import pytest
+
+from veleslibrary.questionnaires import nfcs, nfcsShort, rses
+from veleslibrary.questionnaires.nfcs import SHORT_FORM
+from veleslibrary.styles import deduplicate, extract, style_tag, stylesheet
+
+
+def survey():
+    return {
+        "pages": [
+            nfcs(name="NFCS_pre").dict(),
+            rses().dict(),
+            nfcsShort(name="NFCS_post").dict(),
+        ]
+    }
+
+
+def html(page):
+    return page["elements"][0]["html"]
+
+
+def test_pages_include_their_stylesheet():
+    """
+    A single page should work on its own.
+    """
+    assert html(nfcs().dict()).startswith(style_tag("nfcs"))
+    assert html(nfcsShort().dict()).startswith(style_tag("nfcs"))
+
+
+def test_deduplicate():
+    """
+    Only the first copy of the stylesheet should be kept.
+    """
+    original = survey()
+    deduplicated = deduplicate(original)
+    pages = deduplicated["pages"]
+
+    assert html(pages[0]) == html(original["pages"][0])
+    assert html(pages[2]) == html(original["pages"][2])[len(style_tag("nfcs")) :]
+    assert pages[1] == original["pages"][1]
+    assert original == survey()
+    assert len(json.dumps(deduplicated)) < len(json.dumps(original))
+
+
+def test_extract():
+    """
+    All copies should be removed and returned once.
+    """
+    pages, css = extract(survey()["pages"])
+    assert css == stylesheet("nfcs")
+    assert all("<style" not in json.dumps(page) for page in pages)
+    assert extract(rses().dict()) == (rses().dict(), "")
+
+
+def test_short_form_is_a_subset():
+    """
+    The short form should show the selected items of the long form.
+    """
+    long_rows = nfcs().dict()["elements"][1]["rows"]
+    short_rows = nfcsShort().dict()["elements"][1]["rows"]
+    assert [row["text"] for row in short_rows] == [
+        long_rows[item - 1]["text"] for item in SHORT_FORM
+    ]
+
+
+def test_unknown_stylesheet():
+    """
+    Unknown stylesheets should raise a KeyError.
+    """
+    with pytest.raises(KeyError):
+        stylesheet("tipi")
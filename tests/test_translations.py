@@ -0,0 +1,54 @@
+"""Test the shared TLS-15 implementation and its translations."""
+
+import importlib
+import json
+
+import pytest
+
+from veleslibrary import itemstore
+from veleslibrary.questionnaires import pl, tls_15
+
+module = importlib.import_module("veleslibrary.questionnaires.tls_15")
+
+
+def test_languages():
+    """
+    Every language package should have a translation.
+    """
+    assert module.languages() == ["en", "es", "hu", "pl", "sv"]
+
+
+def test_language_functions():
+    """
+    Language functions should be TLS-15 with a fixed language and their own identity.
+    """
+    assert pl.tls_15(name="X").dict() == tls_15(name="X", lang="pl").dict()
+    assert pl.tls_15.__module__ == "veleslibrary.questionnaires.pl.tls_15"
+    assert pl.tls_15.scoring == tls_15.scoring
+    assert "Julia Jankowska" in pl.tls_15.__doc__
+
+
+def test_strings_are_shared():
+    """
+    Pages of the same language should share the same string objects.
+    """
+    first, second = tls_15(lang="hu").dict(), tls_15(lang="hu").dict()
+    assert first["elements"][1]["title"] is second["elements"][1]["title"]
+
+
+def test_new_language_is_data_only(tmp_path, monkeypatch):
+    """
+    Adding a JSON file and rebuilding the store should be enough to add a language.
+    """
+    (tmp_path / "xx").mkdir()
+    data = dict(itemstore.load("tls_15"))
+    data["items"] = [f"Item {i}" for i in range(1, 16)]
+    (tmp_path / "xx" / "tls_15.json").write_text(json.dumps(data), encoding="utf-8")
+    monkeypatch.setattr(
+        itemstore, "STORE_PATH", itemstore.build(tmp_path, tmp_path / "items.bin")
+    )
+
+    assert module.languages() == ["xx"]
+    assert tls_15(lang="xx").dict()["elements"][15]["title"] == "Item 15"
+    with pytest.raises(KeyError):
+        tls_15(lang="yy")
@@ -0,0 +1,81 @@
+"""Test the vectorized response validation."""
+
+import numpy as np
+import pytest
+
+from veleslibrary.questionnaires import mini_cope, nfcs, rses
+from veleslibrary.questionnaires.pl import tipi
+from veleslibrary.validation import ResponseError, validate, validate_rows
+
+MISSING, OUT_OF_RANGE, NOT_INTEGER = ResponseError
+
+
+@pytest.mark.parametrize(
+    "questionnaire, low, high",
+    [(rses, 1, 4), (nfcs, 1, 6), (mini_cope, 0, 3), (tipi, 1, 7)],
+)
+def test_response_ranges(questionnaire, low, high):
+    """
+    Answers within the range of each questionnaire should pass and the ones next to it shouldn't.
+    """
+    items = questionnaire.scoring.items
+    responses = np.full((4, items), low, dtype=np.float64)
+    responses[1] = high
+    responses[2, 0] = low - 1
+    responses[3, -1] = high + 1
+
+    result = validate(questionnaire, responses)
+    assert result.valid.tolist() == [True, True, False, False]
+    assert result.errors[2, 0] == result.errors[3, -1] == OUT_OF_RANGE
+    assert np.count_nonzero(result.errors) == 2
+
+
+def test_flags_are_combined():
+    """
+    Every answer should get all its flags and every row the flags of its answers.
+    """
+    responses = np.array(
+        [[1, 2, 3, 4, 1, 2, 3, 4, 1, 2], [0, 2, np.nan, 4.5, 1, 2, 3, 4, 1, 2.5]]
+    )
+    result = validate(rses, responses)
+
+    assert result.errors[1, :4].tolist() == [
+        OUT_OF_RANGE,
+        0,
+        MISSING,
+        OUT_OF_RANGE | NOT_INTEGER,
+    ]
+    assert result.rows.tolist() == [0, MISSING | OUT_OF_RANGE | NOT_INTEGER]
+    assert result.packed().tolist() == [[0, 0], [0b1101, 0b10]]
+    assert result.counts() == {"MISSING": 1, "OUT_OF_RANGE": 1, "NOT_INTEGER": 1}
+
+
+def test_integer_arrays_and_chunks():
+    """
+    Integer arrays should be checked without conversion and chunking shouldn't change the result.
+    """
+    responses = np.random.default_rng(0).integers(0, 6, size=(1000, 10), dtype=np.uint8)
+    expected = np.where((responses < 1) | (responses > 4), OUT_OF_RANGE.value, 0)
+
+    assert (validate(rses, responses).errors == expected).all()
+    assert (validate(rses, responses, chunk_size=7).errors == expected).all()
+
+
+def test_wrong_shape():
+    """
+    Arrays with a different number of items should be refused.
+    """
+    with pytest.raises(ValueError):
+        validate(rses, np.ones((3, 9)))
+
+
+def test_validate_rows():
+    """
+    Exported rows should be validated per questionnaire, with unreadable answers as missing.
+    """
+    rows = [
+        {f"RSES_{i}": 2 for i in range(1, 11)},
+        {f"RSES_{i}": "x" if i == 3 else 9 for i in range(1, 11)},
+    ]
+    result = validate_rows(rows, [rses])["RSES"]
+    assert result.rows.tolist() == [0, MISSING | OUT_OF_RANGE]
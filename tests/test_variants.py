@@ -0,0 +1,72 @@
+"""Test the per-participant item order variants."""
+
+import pytest
+
+from veleslibrary.questionnaires import mini_cope, nfcs, rses, sd3
+from veleslibrary.variants import permutation, variants
+
+
+def test_permutation_is_stable():
+    """
+    Orders must not change between versions, or returning participants would see new ones.
+    """
+    assert permutation("participant-1", 8, "salt").tolist() == [1, 7, 0, 2, 4, 3, 6, 5]
+
+
+@pytest.mark.parametrize("questionnaire", [sd3, mini_cope])
+def test_questions_are_shuffled(questionnaire):
+    """
+    Questions should be reordered in place of the items, keeping their names.
+    """
+    shuffled = variants(questionnaire, name="Q")
+    base = questionnaire(name="Q").dict()
+    page = shuffled("p1")
+    order = shuffled.order("p1")
+
+    assert page["elements"][0] == base["elements"][0]
+    assert [element["name"] for element in page["elements"][1:]] == [
+        f"Q_{item}" for item in order
+    ]
+    assert sorted(order) == list(range(1, questionnaire.scoring.items + 1))
+    assert page == shuffled("p1")
+    assert order != shuffled.order("p2")
+    assert shuffled.page == base
+
+
+def test_matrix_rows_are_shuffled():
+    """
+    NFCS should have the rows of its matrix shuffled.
+    """
+    shuffled = variants(nfcs)
+    page = shuffled(42)
+    rows = page["elements"][1]["rows"]
+
+    assert [row["value"] for row in rows] == [f"NFCS_{i}" for i in shuffled.order(42)]
+    assert shuffled.page["elements"][1]["rows"][0]["value"] == "NFCS_1"
+
+
+def test_questionnaires_get_independent_orders():
+    """
+    The same participant shouldn't get the same order in two questionnaires of the same length.
+    """
+    assert variants(rses, name="A").order("p") != variants(rses, name="B").order("p")
+    assert variants(rses, salt="x").order("p") == variants(rses, salt="x").order("p")
+
+
+def test_pages_reuse_the_built_questionnaire():
+    """
+    Variants should build the questionnaire once and share its questions between pages.
+    """
+    calls = []
+
+    def counted(name="SD3"):
+        calls.append(name)
+        return sd3(name)
+
+    counted.scoring = sd3.scoring
+    shuffled = variants(counted)
+    pages = [shuffled(participant) for participant in range(100)]
+
+    assert len(calls) == 1
+    base = {id(element) for element in shuffled.page["elements"]}
+    assert all({id(element) for element in page["elements"]} == base for page in pages)
@@ -1,2 +1,6 @@
-from .questionnaires import *
-from .tests import *
+from ._lazy import attach
+from . import questionnaires, tests
+
+__getattr__, __dir__, __all__ = attach(
+    __name__, attributes={"questionnaires": questionnaires.__all__}
+)
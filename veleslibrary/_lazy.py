@@ -0,0 +1,71 @@
+"""Lazy attribute resolution for the library packages (PEP 562)"""
+
+import importlib
+import sys
+import types
+
+
+class _LazyModule(types.ModuleType):
+    """Module type that stops submodules from shadowing lazily exported functions.
+
+    Importing `package.rses` directly makes the import system set `package.rses` to the
+    submodule. With an eager `from .rses import rses` this was overwritten right away,
+    so the lazy packages drop that assignment and resolve the function on first access instead.
+    """
+
+    def __setattr__(self, name, value):
+        if (
+            isinstance(value, types.ModuleType)
+            and value.__name__ == f"{self.__name__}.{name}"
+            and name in self.__dict__.get("_lazy_attributes", {})
+        ):
+            return
+        super().__setattr__(name, value)
+
+
+def attach(
+    module_name: str,
+    submodules: list[str] | None = None,
+    attributes: dict[str, list[str]] | None = None,
+) -> tuple:
+    """Make a package resolve its submodules and exported functions on first access.
+
+    Args:
+        module_name (str): `__name__` of the package calling the function.
+        submodules (list[str] | None): Subpackages or modules exposed as they are, e.g. language folders.
+        attributes (dict[str, list[str]] | None): Mapping of a submodule to the names it exports, e.g. `{"nfcs": ["nfcs", "nfcsShort"]}`.
+
+    Returns:
+        tuple: `__getattr__`, `__dir__` and `__all__` to be assigned in the package namespace.
+    """
+    if submodules is None:
+        submodules = []
+    if attributes is None:
+        attributes = {}
+
+    lazy_attributes = {
+        attribute: submodule
+        for submodule, names in attributes.items()
+        for attribute in names
+    }
+    module = sys.modules[module_name]
+    module._lazy_attributes = lazy_attributes
+    module.__class__ = _LazyModule
+    __all__ = [*submodules, *lazy_attributes]
+
+    def __getattr__(name: str):
+        if name in submodules:
+            return importlib.import_module(f"{module_name}.{name}")
+        if name in lazy_attributes:
+            submodule = importlib.import_module(
+                f"{module_name}.{lazy_attributes[name]}"
+            )
+            value = getattr(submodule, name)
+            setattr(module, name, value)
+            return value
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(module)) | set(__all__))
+
+    return __getattr__, __dir__, __all__
@@ -0,0 +1,192 @@
+"""Precompressed, content-hashed JSON for HTTP serving
+
+An `Artifact` holds the canonical JSON of a questionnaire or a battery (sorted keys, no
+whitespace, UTF-8), its gzip-compressed bytes and an ETag. The ETag is the SHA-256 of the
+canonical JSON, so it's the same in every process and Python version for the same
+questionnaire. The gzip bytes are written without a timestamp and are a different
+representation with their own ETag (`gzip_etag`), so caches never mix the two.
+
+Artifacts of questionnaire calls are cached together with their compressed bytes, so a
+server only looks them up.
+
+Example:
+    ```python
+    from veleslibrary.artifacts import artifact, battery_artifact
+    from veleslibrary.questionnaires import rses, sd3
+
+    rses_json = artifact(rses, name="RSES_pre")
+    rses_json.etag  # '"c0ffee..."'
+    if rses_json.matches(request.headers.get("If-None-Match"), gzip=True):
+        ...  # 304 Not Modified
+    survey = battery_artifact(rses, (sd3, {"name": "SD3_pre"}))
+    ```
+"""
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Callable
+
+from pydantic import BaseModel
+
+from .cache import QuestionnaireCache
+from .styles import deduplicate
+
+CONTENT_TYPE = "application/json; charset=utf-8"
+
+
+def canonical_json(value) -> bytes:
+    """Serialize JSON-compatible data canonically.
+
+    Args:
+        value: Data to serialize, e.g. `PageModel.dict()`.
+
+    Returns:
+        bytes: UTF-8 JSON with sorted keys and no whitespace.
+
+    Raises:
+        ValueError: If the data contains NaN or infinity.
+    """
+    return json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+    ).encode("utf-8")
+
+
+@dataclass(frozen=True, repr=False)
+class Artifact:
+    """Canonical JSON ready to be served.
+
+    Attributes:
+        body (bytes): Canonical JSON.
+        gzip (bytes): Gzip-compressed body, for `Content-Encoding: gzip`.
+        etag (str): Strong ETag of the body with its quotes, e.g. `"3f2a..."`.
+        content_type (str): Value of the `Content-Type` header.
+    """
+
+    body: bytes
+    gzip: bytes
+    etag: str
+    content_type: str = CONTENT_TYPE
+
+    @classmethod
+    def from_json(cls, value) -> "Artifact":
+        """Build an artifact of JSON-compatible data or a pydantic model"""
+        if isinstance(value, BaseModel):
+            value = value.dict()
+        body = canonical_json(value)
+        return cls(
+            body,
+            gzip.compress(body, compresslevel=9, mtime=0),
+            f'"{hashlib.sha256(body).hexdigest()}"',
+        )
+
+    @property
+    def gzip_etag(self) -> str:
+        """Strong ETag of the gzip-compressed body, e.g. `"3f2a...-gz"`"""
+        return f'{self.etag[:-1]}-gz"'
+
+    def matches(self, if_none_match: str | None, gzip: bool = False) -> bool:
+        """Whether an `If-None-Match` header matches the artifact.
+
+        Args:
+            if_none_match (str | None): Header value, possibly a list or `*`.
+            gzip (bool): Whether the gzip-compressed body would be sent.
+
+        Returns:
+            bool: True if the client's copy is current (respond with 304).
+        """
+        if not if_none_match:
+            return False
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or (self.gzip_etag if gzip else self.etag) in tags
+
+    def __repr__(self) -> str:
+        return (
+            f"Artifact(etag={self.etag}, {len(self.body)} bytes, "
+            f"{len(self.gzip)} gzipped)"
+        )
+
+
+class ArtifactCache(QuestionnaireCache):
+    """Thread-safe LRU cache of questionnaire artifacts.
+
+    Keys are the same as in `QuestionnaireCache`. Artifacts are immutable, so they are
+    returned without copying.
+    """
+
+    def lookup(self, key: tuple) -> Artifact | None:
+        """Return a stored artifact without building it.
+
+        Args:
+            key (tuple): Key from `key()`.
+
+        Returns:
+            Artifact | None: The artifact or None if it isn't stored.
+        """
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self._hits += 1
+        return template
+
+    def _build(self, factory: Callable, args: tuple, kwargs: dict) -> Artifact:
+        return Artifact.from_json(factory(*args, **kwargs))
+
+    def _copy(self, template: Artifact) -> Artifact:
+        return template
+
+
+default_artifacts = ArtifactCache()
+
+
+def artifact(factory: Callable, *args, **kwargs) -> Artifact:
+    """Return the cached artifact of a questionnaire.
+
+    Args:
+        factory (Callable): Questionnaire function, e.g. `veleslibrary.questionnaires.rses`.
+        *args: Positional arguments for the function.
+        **kwargs: Keyword arguments for the function.
+
+    Returns:
+        Artifact: Artifact of the page.
+    """
+    return default_artifacts.get(factory, *args, **kwargs)
+
+
+def battery(*questionnaires: Callable | tuple[Callable, dict]) -> dict:
+    """Build the SurveyJS JSON of several questionnaires.
+
+    Repeated library stylesheets are kept only once, see `veleslibrary.styles`.
+
+    Args:
+        *questionnaires (Callable | tuple[Callable, dict]): Questionnaire functions, alone or with their keyword arguments.
+
+    Returns:
+        dict: `{"pages": [...]}` with one page per questionnaire.
+    """
+    pages = []
+    for questionnaire in questionnaires:
+        if isinstance(questionnaire, tuple):
+            factory, kwargs = questionnaire
+        else:
+            factory, kwargs = questionnaire, {}
+        pages.append(factory(**kwargs).dict())
+    return deduplicate({"pages": pages})
+
+
+def battery_artifact(*questionnaires: Callable | tuple[Callable, dict]) -> Artifact:
+    """Return the cached artifact of a battery, see `battery()`.
+
+    Args:
+        *questionnaires (Callable | tuple[Callable, dict]): Questionnaire functions, alone or with their keyword arguments.
+
+    Returns:
+        Artifact: Artifact of the battery.
+    """
+    return default_artifacts.get(battery, *questionnaires)
@@ -0,0 +1,141 @@
+"""Counterbalanced orders of questionnaire batteries
+
+`BatteryPlanner` assigns every participant an order of the questionnaires of a battery.
+Small batteries use a balanced Latin square (Williams design): every questionnaire is in
+every position, and directly precedes every other one, equally often. For an odd number
+of questionnaires the square is followed by its mirror image, so the design has twice as
+many rows. Large batteries use blocks of random orders, as a full square would need
+many participants to be complete.
+
+Designs are cached, so a planner only looks up a row for a participant, in O(1).
+
+Example:
+    ```python
+    from veleslibrary.battery import BatteryPlanner
+
+    planner = BatteryPlanner(["rses", "sd3", ("tipi", "pl"), ("tls_15", "pl")])
+    planner.order(0)  # (Entry(code='rses', ...), Entry(code='sd3', ...), ...)
+    pages = planner.pages(17)  # SurveyJS JSON of the pages in the order of participant 17
+    ```
+"""
+
+import hashlib
+from functools import lru_cache
+
+from . import registry
+from .compiled import load_json
+from .styles import deduplicate
+from .variants import permutation
+
+# Largest battery counterbalanced with a Latin square by default
+LATIN_SQUARE_LIMIT = 12
+# Number of random orders in the design of a large battery
+BLOCK_SIZE = 1000
+
+
+@lru_cache(maxsize=None)
+def latin_square(n: int) -> tuple[tuple[int, ...], ...]:
+    """Return a balanced Latin square of `n` treatments.
+
+    Args:
+        n (int): Number of treatments.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: `n` rows (`2n` for odd `n`) of indices from 0.
+    """
+    first, low, high = [0], 1, n - 1
+    while len(first) < n:
+        first.append(low)
+        low += 1
+        if len(first) < n:
+            first.append(high)
+            high -= 1
+    rows = [tuple((treatment + shift) % n for treatment in first) for shift in range(n)]
+    if n % 2:
+        rows += [row[::-1] for row in rows]
+    return tuple(rows)
+
+
+@lru_cache(maxsize=None)
+def random_blocks(
+    n: int, size: int = BLOCK_SIZE, seed: int = 0
+) -> tuple[tuple[int, ...], ...]:
+    """Return a block of random orders of `n` treatments.
+
+    Args:
+        n (int): Number of treatments.
+        size (int): Number of orders.
+        seed (int): Seed of the design. Orders don't depend on the NumPy version.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: `size` rows of indices from 0.
+    """
+    return tuple(
+        tuple(permutation(row, n, f"battery/{seed}").tolist()) for row in range(size)
+    )
+
+
+class BatteryPlanner:
+    """Counterbalanced orders of a questionnaire battery.
+
+    Args:
+        questionnaires (list): Questionnaires as codes of English ones (e.g. "rses"), `(code, lang)` tuples or `registry.Entry` objects.
+        design (str | None): "latin" or "random". `None` means a Latin square for batteries up to `LATIN_SQUARE_LIMIT` questionnaires.
+        seed (int): Seed of the random design.
+
+    Raises:
+        KeyError: If a questionnaire isn't in the registry.
+        ValueError: If the battery is empty or the design is unknown.
+    """
+
+    def __init__(self, questionnaires: list, design: str | None = None, seed: int = 0):
+        self.entries = tuple(_entry(questionnaire) for questionnaire in questionnaires)
+        if not self.entries:
+            raise ValueError("A battery needs at least one questionnaire")
+        if design is None:
+            design = "latin" if len(self.entries) <= LATIN_SQUARE_LIMIT else "random"
+        if design == "latin":
+            self.design = latin_square(len(self.entries))
+        elif design == "random":
+            self.design = random_blocks(len(self.entries), seed=seed)
+        else:
+            raise ValueError(f"Unknown design {design!r}, use 'latin' or 'random'")
+
+    def row(self, participant: int | str) -> tuple[int, ...]:
+        """Return the order of a participant as indices of the questionnaires.
+
+        Args:
+            participant (int | str): Consecutive participant number, for a balanced design, or any ID, which is hashed.
+
+        Returns:
+            tuple[int, ...]: Indices of the questionnaires in the order of the participant.
+        """
+        if not isinstance(participant, int):
+            digest = hashlib.blake2b(str(participant).encode("utf-8"), digest_size=8)
+            participant = int.from_bytes(digest.digest(), "little")
+        return self.design[participant % len(self.design)]
+
+    def order(self, participant: int | str) -> tuple[registry.Entry, ...]:
+        """Return the questionnaires in the order of a participant, see `row()`"""
+        return tuple(self.entries[i] for i in self.row(participant))
+
+    def pages(self, participant: int | str) -> list[dict]:
+        """Return the precompiled SurveyJS JSON of the questionnaires in the order of a participant.
+
+        Args:
+            participant (int | str): See `row()`.
+
+        Returns:
+            list[dict]: Pages with default options. Library stylesheets are kept only on the first page using them, see `veleslibrary.styles`.
+        """
+        return deduplicate(
+            [load_json(entry.code, entry.lang) for entry in self.order(participant)]
+        )
+
+
+def _entry(questionnaire) -> registry.Entry:
+    if isinstance(questionnaire, registry.Entry):
+        return questionnaire
+    if isinstance(questionnaire, str):
+        return registry.get(questionnaire)
+    return registry.get(*questionnaire)
@@ -0,0 +1,198 @@
+"""Opt-in cache of built questionnaires
+
+Every call to a questionnaire function splits the items again and validates the whole
+`PageModel` with pydantic. `cached()` builds a questionnaire once per combination of
+arguments and returns an independent copy of the stored template on every next call.
+
+Example:
+    ```python
+    from veleslibrary.cache import cached
+    from veleslibrary.questionnaires import rses
+
+    page = cached(rses, name="RSES_pre")
+    ```
+"""
+
+import copy
+import inspect
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from pydantic import BaseModel
+
+_ATOMIC = frozenset({str, int, float, bool, type(None)})
+_set = object.__setattr__
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Counters of a `QuestionnaireCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+def _freeze(value):
+    """Turn dictionaries and lists in the arguments into hashable tuples"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    hash(value)
+    return value
+
+
+def copy_model(value):
+    """Copy a pydantic model with all its nested models, lists and dictionaries.
+
+    Strings and numbers are shared with the original, so the copy is several times cheaper
+    than both `model_copy(deep=True)` and building the questionnaire again. The copy is not validated.
+    """
+    cls = type(value)
+    if cls is list:
+        return [item if type(item) in _ATOMIC else copy_model(item) for item in value]
+    if cls is dict:
+        return {
+            key: item if type(item) in _ATOMIC else copy_model(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, BaseModel):
+        copied = object.__new__(cls)
+        _set(
+            copied,
+            "__dict__",
+            {
+                key: item if type(item) in _ATOMIC else copy_model(item)
+                for key, item in value.__dict__.items()
+            },
+        )
+        _set(copied, "__pydantic_fields_set__", set(value.__pydantic_fields_set__))
+        _set(copied, "__pydantic_extra__", copy.copy(value.__pydantic_extra__))
+        _set(copied, "__pydantic_private__", copy.copy(value.__pydantic_private__))
+        return copied
+    if cls in _ATOMIC:
+        return value
+    return copy.deepcopy(value)
+
+
+class QuestionnaireCache:
+    """Thread-safe LRU cache of built questionnaires.
+
+    The key is the questionnaire function together with all its arguments after defaults
+    are applied, so `rses()` and `rses(name="RSES")` share one entry. Calls with
+    arguments that can't be hashed (e.g. validators in `questionOptions`) are not cached.
+
+    Args:
+        maxsize (int): Maximum number of stored questionnaires. The least recently used one is evicted first.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    @staticmethod
+    def key(factory: Callable, *args, **kwargs) -> tuple | None:
+        """Return the cache key of a call or None if the arguments can't be hashed"""
+        bound = inspect.signature(factory).bind(*args, **kwargs)
+        bound.apply_defaults()
+        try:
+            return (
+                factory.__module__,
+                factory.__qualname__,
+                _freeze(bound.arguments),
+            )
+        except TypeError:
+            return None
+
+    def get(self, factory: Callable, *args, **kwargs):
+        """Return a copy of the questionnaire built by `factory(*args, **kwargs)`.
+
+        Args:
+            factory (Callable): Questionnaire function, e.g. `veleslibrary.questionnaires.rses`.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            PageModel: Independent copy of the stored questionnaire. It can be modified freely.
+        """
+        key = self.key(factory, *args, **kwargs)
+        if key is None:
+            return self._build(factory, args, kwargs)
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        if template is None:
+            # Build outside the lock, so that a slow questionnaire doesn't block the others
+            template = self._build(factory, args, kwargs)
+            with self._lock:
+                template = self._templates.setdefault(key, template)
+                self._templates.move_to_end(key)
+                while len(self._templates) > self.maxsize:
+                    self._templates.popitem(last=False)
+                    self._evictions += 1
+
+        return self._copy(template)
+
+    def _build(self, factory: Callable, args: tuple, kwargs: dict):
+        """Build the stored value of a call"""
+        return factory(*args, **kwargs)
+
+    def _copy(self, template):
+        """Return the value handed out for a stored value"""
+        return copy_model(template)
+
+    def clear(self):
+        """Remove all stored questionnaires and reset the counters"""
+        with self._lock:
+            self._templates.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return the hit, miss and eviction counters"""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._templates),
+                self.maxsize,
+            )
+
+
+default_cache = QuestionnaireCache()
+
+
+def cached(factory: Callable, *args, **kwargs):
+    """Build a questionnaire through the shared `default_cache`.
+
+    Args:
+        factory (Callable): Questionnaire function, e.g. `veleslibrary.questionnaires.rses`.
+        *args: Positional arguments for the function.
+        **kwargs: Keyword arguments for the function.
+
+    Returns:
+        PageModel: Independent copy of the stored questionnaire.
+    """
+    return default_cache.get(factory, *args, **kwargs)
@@ -0,0 +1,239 @@
+"""Vectorized detection of careless responding
+
+Straight-liners and random responders are common in online panels, especially on long
+scales. `detect()` computes four indices for every row of a response matrix at once:
+
+- longstring: the longest run of identical consecutive answers,
+- IRV (intra-individual response variability): standard deviation of the row's answers,
+- even-odd consistency: the Spearman-Brown corrected correlation between the means of
+  odd and even items of every subscale (after reverse keying). Needs at least three
+  subscales with two items or more, e.g. NFCS, SD3 or Mini-COPE, and is NaN otherwise,
+- Mahalanobis distance (squared) of the row from the sample mean of the complete rows.
+
+Rows beyond the `Thresholds` get `CarelessFlag` bits. Indices of rows with missing
+answers are computed from the available ones where possible and NaN otherwise, and NaN
+never raises a flag.
+
+Example:
+    ```python
+    from veleslibrary.careless import detect
+    from veleslibrary.questionnaires import nfcs
+
+    result = detect(nfcs, responses)
+    attentive = responses[~result.careless]
+    result.longstring.max()
+    ```
+"""
+
+import enum
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Callable
+
+import numpy as np
+
+from .scoring import CHUNK_SIZE, get_spec, reverse_key
+from .specs import ScoringSpec
+
+
+class CarelessFlag(enum.IntFlag):
+    """Bit flags of careless responding indices"""
+
+    LONGSTRING = 1
+    LOW_IRV = 2
+    EVEN_ODD = 4
+    MAHALANOBIS = 8
+
+
+@dataclass(frozen=True)
+class Thresholds:
+    """Cut-offs of the careless responding flags.
+
+    Attributes:
+        longstring (int | None): Flag rows whose longest run of identical answers is at least this long. `None` means more than half of the items.
+        irv (float): Flag rows whose IRV is at most this value. 0 flags only rows with a single answer repeated.
+        even_odd (float): Flag rows whose even-odd consistency is below this value.
+        mahalanobis_p (float): Flag rows whose Mahalanobis distance exceeds the `1 - p` quantile of the χ² distribution.
+    """
+
+    longstring: int | None = None
+    irv: float = 0.0
+    even_odd: float = 0.3
+    mahalanobis_p: float = 0.001
+
+
+@dataclass(frozen=True, eq=False)
+class Careless:
+    """Careless responding indices of every row.
+
+    Attributes:
+        longstring (np.ndarray): Longest run of identical consecutive answers.
+        irv (np.ndarray): Standard deviation of the answers.
+        even_odd (np.ndarray): Even-odd consistency.
+        mahalanobis (np.ndarray): Squared Mahalanobis distance.
+        flags (np.ndarray): uint8 vector of `CarelessFlag` bits.
+    """
+
+    longstring: np.ndarray
+    irv: np.ndarray
+    even_odd: np.ndarray
+    mahalanobis: np.ndarray
+    flags: np.ndarray
+
+    @property
+    def careless(self) -> np.ndarray:
+        """Boolean vector of rows with any flag"""
+        return self.flags != 0
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of rows with each flag"""
+        return {
+            flag.name: int(np.count_nonzero(self.flags & flag)) for flag in CarelessFlag
+        }
+
+
+def chi2_quantile(q: float, df: int) -> float:
+    """Approximate the `q` quantile of the χ² distribution (Wilson-Hilferty)"""
+    z = NormalDist().inv_cdf(q)
+    a = 2 / (9 * df)
+    return df * (1 - a + z * math.sqrt(a)) ** 3
+
+
+def longstring(responses: np.ndarray) -> np.ndarray:
+    """Return the longest run of identical consecutive answers of every row.
+
+    Args:
+        responses (np.ndarray): `(n_respondents × n_items)` array. Missing answers (NaN) break runs.
+
+    Returns:
+        np.ndarray: int vector of run lengths.
+    """
+    n, items = responses.shape
+    positions = np.arange(items)
+    starts = np.empty((n, items), dtype=bool)
+    starts[:, 0] = True
+    np.not_equal(responses[:, 1:], responses[:, :-1], out=starts[:, 1:])
+    # Position of the start of the run each answer belongs to
+    run_start = np.maximum.accumulate(np.where(starts, positions, 0), axis=1)
+    return (positions - run_start).max(axis=1) + 1
+
+
+def _irv(responses: np.ndarray) -> np.ndarray:
+    """Standard deviation of the available answers of every row, NaN without answers"""
+    present = ~np.isnan(responses)
+    count = present.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(present, responses, 0).sum(axis=1) / count
+        squares = np.where(present, (responses - mean[:, None]) ** 2, 0).sum(axis=1)
+        return np.sqrt(squares / count)
+
+
+def _halves(spec: ScoringSpec) -> tuple[np.ndarray, np.ndarray] | None:
+    """Weight matrices averaging the odd and even items of every subscale"""
+    subscales = [sorted(items) for items in spec.subscales.values() if len(items) >= 2]
+    if len(subscales) < 3:
+        return None
+    odd = np.zeros((spec.items, len(subscales)))
+    even = np.zeros((spec.items, len(subscales)))
+    for column, items in enumerate(subscales):
+        index = np.asarray(items) - 1
+        odd[index[0::2], column] = 1 / len(index[0::2])
+        even[index[1::2], column] = 1 / len(index[1::2])
+    return odd, even
+
+
+def even_odd(spec: ScoringSpec, responses: np.ndarray) -> np.ndarray:
+    """Return the even-odd consistency of every row.
+
+    Args:
+        spec (ScoringSpec): Spec of the questionnaire.
+        responses (np.ndarray): `(n_respondents × n_items)` array of coded answers.
+
+    Returns:
+        np.ndarray: float vector. NaN for rows without variance between subscales and for questionnaires without three subscales.
+    """
+    halves = _halves(spec)
+    if halves is None:
+        return np.full(len(responses), np.nan)
+    keyed = reverse_key(spec, responses)
+    odd, even = keyed @ halves[0], keyed @ halves[1]
+    odd -= odd.mean(axis=1, keepdims=True)
+    even -= even.mean(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = (odd * even).sum(axis=1) / np.sqrt(
+            (odd**2).sum(axis=1) * (even**2).sum(axis=1)
+        )
+        return 2 * r / (1 + r)
+
+
+def _moments(responses: np.ndarray, chunk_size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Mean and inverse covariance of the complete rows"""
+    items = responses.shape[1]
+    count, total, products = 0, np.zeros(items), np.zeros((items, items))
+    for start in range(0, len(responses), chunk_size):
+        chunk = np.asarray(responses[start : start + chunk_size], dtype=np.float64)
+        chunk = chunk[~np.isnan(chunk).any(axis=1)]
+        count += len(chunk)
+        total += chunk.sum(axis=0)
+        products += chunk.T @ chunk
+    if count <= items:
+        return np.full(items, np.nan), np.full((items, items), np.nan)
+    mean = total / count
+    covariance = (products - count * np.outer(mean, mean)) / (count - 1)
+    return mean, np.linalg.pinv(covariance, hermitian=True)
+
+
+def detect(
+    questionnaire: ScoringSpec | Callable,
+    responses: np.ndarray,
+    thresholds: Thresholds = Thresholds(),
+    chunk_size: int = CHUNK_SIZE,
+) -> Careless:
+    """Compute the careless responding indices and flags of a response matrix.
+
+    Args:
+        questionnaire (ScoringSpec | Callable): A spec or a questionnaire function, e.g. `veleslibrary.questionnaires.nfcs`.
+        responses (np.ndarray): `(n_respondents × n_items)` array of coded answers. Missing answers should be NaN.
+        thresholds (Thresholds): Cut-offs of the flags.
+        chunk_size (int): Number of rows processed at once. Bounds the temporary memory.
+
+    Returns:
+        Careless: Indices and flags of every row.
+
+    Raises:
+        ValueError: If the number of columns doesn't match the number of items.
+    """
+    spec = get_spec(questionnaire)
+    responses = np.asarray(responses)
+    if responses.ndim != 2 or responses.shape[1] != spec.items:
+        raise ValueError(
+            f"Expected an (n × {spec.items}) array, got shape {responses.shape}"
+        )
+    n = len(responses)
+    mean, precision = _moments(responses, chunk_size)
+    max_run = (
+        spec.items // 2 + 1 if thresholds.longstring is None else thresholds.longstring
+    )
+    max_distance = chi2_quantile(1 - thresholds.mahalanobis_p, spec.items)
+
+    runs = np.empty(n, dtype=np.int64)
+    irv = np.empty(n)
+    consistency = np.empty(n)
+    distance = np.empty(n)
+    flags = np.zeros(n, dtype=np.uint8)
+    for start in range(0, n, chunk_size):
+        rows = slice(start, start + chunk_size)
+        chunk = np.asarray(responses[rows], dtype=np.float64)
+        runs[rows] = longstring(chunk)
+        irv[rows] = _irv(chunk)
+        consistency[rows] = even_odd(spec, chunk)
+        centered = chunk - mean
+        distance[rows] = ((centered @ precision) * centered).sum(axis=1)
+
+        out = flags[rows]
+        out |= (runs[rows] >= max_run).view(np.uint8)
+        out |= (irv[rows] <= thresholds.irv).view(np.uint8) << 1
+        out |= (consistency[rows] < thresholds.even_odd).view(np.uint8) << 2
+        out |= (distance[rows] > max_distance).view(np.uint8) << 3
+    return Careless(runs, irv, consistency, distance, flags)
@@ -0,0 +1,113 @@
+"""Precompiled SurveyJS JSON of the questionnaires
+
+Services that only need the final SurveyJS JSON don't have to build the `PageModel`.
+`load_json()` reads the JSON produced by the questionnaire function with default arguments
+and swaps the name prefix, without importing velesresearch or pydantic.
+
+The JSON lives in `veleslibrary/data/json/<language>/<function>.json`. Rebuild it after
+changing a questionnaire with:
+
+    python -m veleslibrary.compiled
+"""
+
+import inspect
+import json
+from functools import lru_cache
+from pathlib import Path
+
+DATA_PATH = Path(__file__).parent / "data" / "json"
+
+# Keys holding question, page and matrix row names
+_NAME_KEYS = ("name", "value")
+
+
+def factories():
+    """Yield every questionnaire function in the library, see `veleslibrary.registry`.
+
+    Yields:
+        tuple[str, str, Callable]: Language code, function name and the function.
+    """
+    from . import registry
+
+    for entry in registry.entries(kind="questionnaire"):
+        yield entry.lang, entry.code, entry.factory
+
+
+def build(path: Path | str = DATA_PATH) -> list[Path]:
+    """Run every questionnaire function with default arguments and save its JSON.
+
+    Args:
+        path (Path | str): Destination folder. Defaults to the package data folder.
+
+    Returns:
+        list[Path]: Paths of the written files.
+    """
+    path = Path(path)
+    written = []
+    for lang, code, function in factories():
+        bundle = {
+            "name": inspect.signature(function).parameters["name"].default,
+            "page": function().dict(),
+        }
+        file = path / lang / f"{code}.json"
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(
+            json.dumps(bundle, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+        written.append(file)
+    return written
+
+
+@lru_cache(maxsize=None)
+def _load_bundle(code: str, lang: str) -> dict:
+    file = DATA_PATH / lang / f"{code}.json"
+    try:
+        return json.loads(file.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise KeyError(
+            f"No precompiled questionnaire {code!r} in language {lang!r}"
+        ) from None
+
+
+def _rename(value, default: str, name: str):
+    """Copy the JSON replacing the `default` name prefix with `name`"""
+    if isinstance(value, dict):
+        renamed = {}
+        for key, item in value.items():
+            if (
+                key in _NAME_KEYS
+                and isinstance(item, str)
+                and (item == default or item.startswith(default + "_"))
+            ):
+                item = name + item[len(default) :]
+            else:
+                item = _rename(item, default, name)
+            renamed[key] = item
+        return renamed
+    if isinstance(value, list):
+        return [_rename(item, default, name) for item in value]
+    return value
+
+
+def load_json(code: str, lang: str = "en", name: str | None = None) -> dict:
+    """Return the SurveyJS JSON of a questionnaire with default options.
+
+    Args:
+        code (str): Name of the questionnaire function, e.g. "rses" or "nfcsShort".
+        lang (str): Language code, e.g. "en" or "pl". Defaults to "en".
+        name (str | None): Base name for pages and questions. `None` means the default name of the questionnaire.
+
+    Returns:
+        dict: The same JSON as `PageModel.dict()` of the questionnaire. Every call returns a new object.
+
+    Raises:
+        KeyError: If there's no such questionnaire.
+    """
+    bundle = _load_bundle(code, lang)
+    default = bundle["name"]
+    return _rename(bundle["page"], default, default if name is None else name)
+
+
+if __name__ == "__main__":
+    for written_file in build():
+        print(written_file)
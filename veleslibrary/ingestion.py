@@ -0,0 +1,325 @@
+"""Asynchronous scoring of submitted results
+
+`ResultIngestor` takes SurveyJS result payloads as they are posted, e.g. from a web
+handler, scores the library questionnaires in them and passes the scored rows to a sink.
+Payloads wait in a bounded queue, so a burst slows the submitters down instead of
+growing memory. The scorer takes whatever has arrived, up to `batch_size` payloads, and
+scores it at once with the vectorized scoring (see `veleslibrary.streaming`), waiting at
+most `max_delay` seconds for a batch to fill. The scores of every payload are returned
+to its submitter as soon as its batch is scored. If a batch can't be scored, its payloads
+are scored one at a time, so a broken payload only fails its own submitter. Sinks get the
+scored rows through a second bounded queue, so a slow sink doesn't delay the scores.
+
+A sink is any object with a `write(rows)` method, which may be a coroutine, and
+optionally `close()`. `MemorySink` keeps the latest scores of every participant,
+`FileSink` appends them to a `.csv` or `.jsonl` file.
+
+Example:
+    ```python
+    from veleslibrary.ingestion import MemorySink, ResultIngestor
+    from veleslibrary.questionnaires import rses, sd3
+
+    sink = MemorySink()
+    async with ResultIngestor([rses, sd3], sink, keep=["id"]) as ingestor:
+        scores = await ingestor.score({"id": "p1", "RSES_1": 3, ...})
+        scores["RSES_total"]
+        sink["p1"]
+    ```
+"""
+
+import asyncio
+import inspect
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable
+
+from .scoring import MissingPolicy
+from .specs import ScoringSpec
+from .streaming import RowWriter, questionnaire_columns, score_rows
+
+# Payloads scored at once
+BATCH_SIZE = 256
+# Seconds the scorer waits for a batch to fill
+MAX_DELAY = 0.002
+# Payloads waiting to be scored and batches waiting for the sink
+QUEUE_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class IngestStats:
+    """Counters of a `ResultIngestor`.
+
+    Attributes:
+        received (int): Accepted payloads.
+        scored (int): Scored payloads.
+        batches (int): Scored batches.
+        written (int): Rows written to the sink.
+        write_errors (int): Batches the sink failed to write.
+    """
+
+    received: int
+    scored: int
+    batches: int
+    written: int
+    write_errors: int
+
+
+class MemorySink:
+    """Sink keeping the latest scores of every participant in memory.
+
+    Args:
+        key (str): Column identifying the participant.
+    """
+
+    def __init__(self, key: str = "id"):
+        self.key = key
+        self.scores = {}
+
+    def write(self, rows: list[dict]):
+        for row in rows:
+            self.scores[row.get(self.key)] = row
+
+    def __getitem__(self, participant) -> dict:
+        return self.scores[participant]
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+
+class FileSink:
+    """Sink appending the scored rows to a `.csv` or `.jsonl` file.
+
+    Args:
+        path (Path | str): Path to the file. A new `.csv` file gets a header.
+        fieldnames (list[str]): Columns of a `.csv` file, e.g. `ResultIngestor.fieldnames`.
+    """
+
+    def __init__(self, path: Path | str, fieldnames: list[str] | None = None):
+        path = Path(path)
+        header = not path.exists() or path.stat().st_size == 0
+        if path.suffix == ".csv" and fieldnames is None:
+            raise ValueError("A .csv sink needs the fieldnames")
+        self.file = open(path, "a", encoding="utf-8", newline="")
+        self._writer = RowWriter(self.file, path.suffix, fieldnames, header)
+
+    def write(self, rows: list[dict]):
+        self._writer.write(rows)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class ResultIngestor:
+    """Micro-batched scoring of submitted results.
+
+    Args:
+        questionnaires (dict[str, ScoringSpec | Callable] | Iterable[Callable]): Questionnaire functions or a dictionary of question base names and questionnaires.
+        sink: Object with a `write(rows)` method or coroutine, see `MemorySink`. `None` means scores are only returned.
+        keep (Iterable[str]): Fields copied to the scored rows as they are, e.g. participant ID.
+        batch_size (int): Maximum number of payloads scored at once.
+        max_delay (float): Seconds the scorer waits for more payloads before scoring a batch.
+        queue_size (int): Maximum number of waiting payloads and of batches waiting for the sink.
+        missing (MissingPolicy | dict[str, MissingPolicy] | None): Missing-data policy, see `veleslibrary.streaming.score_rows()`.
+    """
+
+    def __init__(
+        self,
+        questionnaires: dict[str, ScoringSpec | Callable] | Iterable[Callable],
+        sink=None,
+        keep: Iterable[str] = (),
+        batch_size: int = BATCH_SIZE,
+        max_delay: float = MAX_DELAY,
+        queue_size: int = QUEUE_SIZE,
+        missing: MissingPolicy | dict[str, MissingPolicy] | None = None,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.questionnaires = questionnaire_columns(questionnaires, missing)
+        self.keep = list(keep)
+        self.fieldnames = self.keep + [
+            column for q in self.questionnaires for column in q.score_columns
+        ]
+        self.sink = sink
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.queue_size = queue_size
+        self._payloads = None
+        self._batches = None
+        self._tasks = ()
+        self._error = None
+        self._received = self._scored = self._batch_count = 0
+        self._written = self._write_errors = 0
+
+    async def start(self) -> "ResultIngestor":
+        """Start the scorer and the sink writer"""
+        self._payloads = asyncio.Queue(self.queue_size)
+        self._batches = asyncio.Queue(self.queue_size)
+        self._tasks = (
+            asyncio.create_task(self._score_batches()),
+            asyncio.create_task(self._write_batches()),
+        )
+        return self
+
+    async def close(self):
+        """Score and write everything submitted so far and close the sink.
+
+        Does nothing if the ingestor was never started.
+
+        Raises:
+            Exception: The first error of the sink, if it failed to write a batch.
+        """
+        if self._payloads is None:
+            return
+        await self._payloads.join()
+        await self._batches.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = ()
+        close = getattr(self.sink, "close", None)
+        if close is not None and inspect.isawaitable(result := close()):
+            await result
+        if self._error is not None:
+            raise self._error
+
+    async def __aenter__(self) -> "ResultIngestor":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _accept(self, payload: dict | str | bytes) -> tuple[dict, asyncio.Future]:
+        if not self._tasks:
+            raise RuntimeError("The ingestor isn't running, use start()")
+        if isinstance(payload, (str, bytes)):
+            payload = json.loads(payload)
+        if not isinstance(payload, dict):
+            raise ValueError(
+                f"A payload must be a JSON object, not {type(payload).__name__}"
+            )
+        return payload, asyncio.get_running_loop().create_future()
+
+    async def submit(self, payload: dict | str | bytes) -> asyncio.Future:
+        """Queue a payload, waiting while the queue is full.
+
+        Args:
+            payload (dict | str | bytes): SurveyJS result data, as a dictionary or JSON.
+
+        Returns:
+            asyncio.Future: Resolves to the scored row when the batch is scored.
+
+        Raises:
+            ValueError: If the payload isn't a dictionary or a JSON object.
+        """
+        payload, future = self._accept(payload)
+        await self._payloads.put((payload, future))
+        self._received += 1
+        return future
+
+    def submit_nowait(self, payload: dict | str | bytes) -> asyncio.Future:
+        """Queue a payload without waiting, see `submit()`.
+
+        Raises:
+            asyncio.QueueFull: If the queue is full, e.g. to answer with 503 and let the client retry.
+            ValueError: If the payload isn't a dictionary or a JSON object.
+        """
+        payload, future = self._accept(payload)
+        self._payloads.put_nowait((payload, future))
+        self._received += 1
+        return future
+
+    async def score(self, payload: dict | str | bytes) -> dict:
+        """Queue a payload and wait for its scores.
+
+        Args:
+            payload (dict | str | bytes): SurveyJS result data, as a dictionary or JSON.
+
+        Returns:
+            dict: Scored row with the `keep` fields and `<name>_<score>` columns. Scores with missing answers are NaN.
+        """
+        return await (await self.submit(payload))
+
+    def score_batch(self, payloads: list[dict]) -> list[dict]:
+        """Score payloads at once, without the queue"""
+        return next(
+            score_rows(payloads, self.questionnaires, self.keep, len(payloads)), []
+        )
+
+    async def _next_batch(self) -> list[tuple[dict, asyncio.Future]]:
+        batch = [await self._payloads.get()]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._payloads.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._payloads.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    def _resolve(self, batch: list[tuple[dict, asyncio.Future]]) -> list[dict]:
+        """Score a batch and resolve its futures, one payload at a time if the batch fails"""
+        try:
+            scored = list(
+                zip(batch, self.score_batch([payload for payload, _ in batch]))
+            )
+        except Exception:
+            scored = []
+            for payload, future in batch:
+                try:
+                    scored.append(((payload, future), self.score_batch([payload])[0]))
+                except Exception as error:
+                    if not future.done():
+                        future.set_exception(error)
+        for (_, future), row in scored:
+            if not future.done():
+                future.set_result(row)
+        return [row for _, row in scored]
+
+    async def _score_batches(self):
+        while True:
+            batch = await self._next_batch()
+            try:
+                rows = self._resolve(batch)
+                if rows:
+                    self._scored += len(rows)
+                    self._batch_count += 1
+                    if self.sink is not None:
+                        await self._batches.put(rows)
+            finally:
+                for _ in batch:
+                    self._payloads.task_done()
+
+    async def _write_batches(self):
+        while True:
+            rows = await self._batches.get()
+            try:
+                result = self.sink.write(rows)
+                if inspect.isawaitable(result):
+                    await result
+                self._written += len(rows)
+            except Exception as error:
+                self._write_errors += 1
+                if self._error is None:
+                    self._error = error
+            finally:
+                self._batches.task_done()
+
+    def stats(self) -> IngestStats:
+        """Return the counters"""
+        return IngestStats(
+            self._received,
+            self._scored,
+            self._batch_count,
+            self._written,
+            self._write_errors,
+        )
@@ -0,0 +1,234 @@
+"""Memory-mapped store of item texts
+
+The texts of the questionnaires (instructions, items, response scales) are kept out of the
+module code, in one binary file opened with `mmap`. Worker processes reading the same file
+share its pages in the OS page cache, and `ItemStore.views()` gives zero-copy `memoryview`s
+of the UTF-8 texts. Only the questionnaires that are actually built are decoded, once per
+process, by `load()`.
+
+The file is built from the JSON sources in `veleslibrary/data/items/<language>/<code>.json`,
+one per questionnaire, with string or list-of-strings fields. Rebuild it after changing
+them with:
+
+    python -m veleslibrary.itemstore
+
+File layout (little-endian):
+
+- header: magic `b"VLIS"`, version (u16), reserved (u16), number of groups (u32),
+  number of strings (u32),
+- groups: name string index, first string index, number of strings, flags (4 × u32),
+- strings: offset in the blob and length in bytes (2 × u32),
+- blob: UTF-8 texts.
+
+A group is one field of one questionnaire, named `<language>/<code>/<field>`. Flag 1 marks
+a list field, otherwise the group holds a single string.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+DATA_PATH = Path(__file__).parent / "data"
+SOURCE_PATH = DATA_PATH / "items"
+STORE_PATH = DATA_PATH / "items.bin"
+
+MAGIC = b"VLIS"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHII")
+_GROUP = struct.Struct("<IIII")
+_STRING = struct.Struct("<II")
+_LIST = 1
+
+
+class ItemStore:
+    """Read-only view of an item store file.
+
+    Args:
+        path (Path | str): Path to the store. Defaults to the package data.
+
+    Raises:
+        ValueError: If the file isn't an item store of a supported version.
+    """
+
+    def __init__(self, path: Path | str = STORE_PATH):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        magic, version, _, n_groups, n_strings = _HEADER.unpack_from(self._view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} item store")
+        self._strings = _HEADER.size + n_groups * _GROUP.size
+        self._blob = self._strings + n_strings * _STRING.size
+        self._groups = {}
+        for name, first, count, flags in _GROUP.iter_unpack(
+            self._view[_HEADER.size : self._strings]
+        ):
+            self._groups[bytes(self._string(name)).decode("utf-8")] = (
+                first,
+                count,
+                flags,
+            )
+
+    def _string(self, index: int) -> memoryview:
+        offset, length = _STRING.unpack_from(
+            self._view, self._strings + index * _STRING.size
+        )
+        return self._view[self._blob + offset : self._blob + offset + length]
+
+    def __contains__(self, group: str) -> bool:
+        return group in self._groups
+
+    def groups(self) -> list[str]:
+        """Return the names of all groups"""
+        return list(self._groups)
+
+    def is_list(self, group: str) -> bool:
+        """Whether a group is a list field"""
+        return bool(self._groups[group][2] & _LIST)
+
+    def views(self, group: str) -> list[memoryview]:
+        """Return zero-copy views of the UTF-8 texts of a group.
+
+        Args:
+            group (str): Group name, e.g. "en/rses/items".
+
+        Returns:
+            list[memoryview]: One view per string, valid until the store is closed.
+
+        Raises:
+            KeyError: If there's no such group.
+        """
+        first, count, _ = self._groups[group]
+        return [self._string(index) for index in range(first, first + count)]
+
+    def texts(self, group: str) -> list[str]:
+        """Return the decoded texts of a group"""
+        return [bytes(view).decode("utf-8") for view in self.views(group)]
+
+    def close(self):
+        """Release the views and unmap the file"""
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "ItemStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write(path: Path | str, groups: dict[str, str | list[str]]) -> Path:
+    """Write an item store.
+
+    Args:
+        path (Path | str): Destination file.
+        groups (dict[str, str | list[str]]): Texts by group name.
+
+    Returns:
+        Path: Path of the written file.
+    """
+    strings, group_table = [], []
+    for name, texts in groups.items():
+        is_list = not isinstance(texts, str)
+        texts = list(texts) if is_list else [texts]
+        group_table.append((len(strings), len(strings) + 1, len(texts), is_list))
+        strings += [name] + texts
+
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets, offset = [], 0
+    for data in encoded:
+        offsets.append((offset, len(data)))
+        offset += len(data)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, 0, len(group_table), len(strings)))
+        for entry in group_table:
+            file.write(_GROUP.pack(*entry))
+        for entry in offsets:
+            file.write(_STRING.pack(*entry))
+        file.write(b"".join(encoded))
+    return path
+
+
+def read_sources(source: Path | str = SOURCE_PATH) -> dict[str, str | list[str]]:
+    """Read the JSON sources into groups, sorted by language, code and field"""
+    groups = {}
+    for file in sorted(Path(source).glob("*/*.json")):
+        fields = json.loads(file.read_text(encoding="utf-8"))
+        for field, texts in fields.items():
+            groups[f"{file.parent.name}/{file.stem}/{field}"] = texts
+    return groups
+
+
+def build(source: Path | str = SOURCE_PATH, path: Path | str = STORE_PATH) -> Path:
+    """Build the store from the JSON sources.
+
+    Args:
+        source (Path | str): Folder with `<language>/<code>.json` files. Defaults to the package data.
+        path (Path | str): Destination file. Defaults to the package data.
+
+    Returns:
+        Path: Path of the written file.
+    """
+    return write(path, read_sources(source))
+
+
+@lru_cache(maxsize=None)
+def open_store(path: Path | str = STORE_PATH) -> ItemStore:
+    """Open a store once per process"""
+    return ItemStore(path)
+
+
+def languages(code: str) -> list[str]:
+    """Return the languages a questionnaire has texts in.
+
+    Args:
+        code (str): Questionnaire code, e.g. "tls_15".
+
+    Returns:
+        list[str]: Sorted language codes.
+    """
+    return sorted(
+        {
+            group.split("/")[0]
+            for group in open_store(STORE_PATH).groups()
+            if group.split("/")[1] == code
+        }
+    )
+
+
+@lru_cache(maxsize=None)
+def load(code: str, lang: str = "en") -> MappingProxyType:
+    """Decode the texts of a questionnaire. The result is cached and the strings are interned.
+
+    Args:
+        code (str): Questionnaire code, e.g. "rses".
+        lang (str): Language code. Defaults to "en".
+
+    Returns:
+        MappingProxyType: Read-only mapping of fields to strings or tuples of strings.
+
+    Raises:
+        KeyError: If the store has no texts of the questionnaire.
+    """
+    store = open_store(STORE_PATH)
+    prefix = f"{lang}/{code}/"
+    fields = {}
+    for group in store.groups():
+        if group.startswith(prefix):
+            texts = tuple(sys.intern(text) for text in store.texts(group))
+            fields[group[len(prefix) :]] = texts if store.is_list(group) else texts[0]
+    if not fields:
+        raise KeyError(f"No texts of {code!r} in language {lang!r}")
+    return MappingProxyType(fields)
+
+
+if __name__ == "__main__":
+    print(build())
@@ -0,0 +1,274 @@
+"""Norm tables for percentiles and T-scores
+
+Norms of a questionnaire live in `veleslibrary/data/norms/<lang>/<code>.json`, as
+frequency tables of a reference sample stratified by sex and age band:
+
+```json
+{
+  "source": "Citation of the norm sample",
+  "tables": [
+    {"score": "total", "sex": "female", "age": [18, 29], "scores": [10, 11, ...], "counts": [3, 5, ...]},
+    {"score": "total", "sex": "all", "age": null, "scores": [...], "counts": [...]}
+  ]
+}
+```
+
+`scores` are the distinct raw scores of the sample in ascending order and `counts` their
+frequencies. A table with sex "all" or age `null` applies to everyone, and more specific
+tables take precedence. Build the tables from a reference sample with `table()` and save
+them with `write()`. The library doesn't ship any norms yet.
+
+Loaded norms are cached per process. A lookup finds the stratum of every participant and
+converts each stratum's scores with a single `searchsorted` call, so whole score arrays
+are converted at once.
+
+Example:
+    ```python
+    from veleslibrary import norms
+
+    rses_norms = norms.load("rses", "pl")
+    rses_norms.percentiles(scores, sex=sexes, age=ages)
+    rses_norms.t_scores(scores, sex="female", age=25)
+    ```
+"""
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from .scoring import read_only
+
+NORMS_PATH = Path(__file__).parent / "data" / "norms"
+
+ALL = "all"
+
+
+@dataclass(frozen=True, eq=False)
+class NormTable:
+    """Frequency table of one score in one stratum of the norm sample.
+
+    Attributes:
+        score (str): Name of the score, see `ScoringSpec.scores`.
+        sex (str): Sex of the stratum or "all".
+        age (tuple[float, float] | None): Lowest and highest age of the stratum (inclusive) or `None` for all ages.
+        scores (np.ndarray): Read-only ascending vector of the distinct raw scores.
+        cumulative (np.ndarray): Read-only vector of the number of people below each score, with the sample size at the end.
+        mean (float): Mean of the sample.
+        sd (float): Standard deviation of the sample.
+    """
+
+    score: str
+    sex: str
+    age: tuple[float, float] | None
+    scores: np.ndarray
+    cumulative: np.ndarray
+    mean: float
+    sd: float
+
+    @classmethod
+    def from_dict(cls, table: dict) -> "NormTable":
+        """Build a table from its JSON"""
+        scores = np.asarray(table["scores"], dtype=np.float64)
+        counts = np.asarray(table["counts"], dtype=np.int64)
+        if len(scores) != len(counts) or (np.diff(scores) <= 0).any():
+            raise ValueError("Norm scores must be distinct, ascending and counted")
+        cumulative = np.concatenate(([0], np.cumsum(counts)))
+        n = cumulative[-1]
+        mean = float(scores @ counts / n)
+        sd = float(np.sqrt(((scores - mean) ** 2) @ counts / (n - 1)))
+        read_only(scores, cumulative)
+        age = table.get("age")
+        return cls(
+            table.get("score", "total"),
+            table.get("sex", ALL),
+            None if age is None else (float(age[0]), float(age[1])),
+            scores,
+            cumulative,
+            mean,
+            sd,
+        )
+
+    @property
+    def n(self) -> int:
+        """Size of the sample"""
+        return int(self.cumulative[-1])
+
+    def matches(self, sex: np.ndarray, age: np.ndarray) -> np.ndarray:
+        """Boolean vector of the participants in the stratum"""
+        matches = np.ones(sex.shape, dtype=bool)
+        if self.sex != ALL:
+            matches &= sex == self.sex
+        if self.age is not None:
+            matches &= (age >= self.age[0]) & (age <= self.age[1])
+        return matches
+
+    def percentiles(self, raw: np.ndarray) -> np.ndarray:
+        """Return the percentile ranks of raw scores.
+
+        The rank counts the people below the score and half of the ones with the same score.
+
+        Args:
+            raw (np.ndarray): Raw scores.
+
+        Returns:
+            np.ndarray: Percentile ranks from 0 to 100. NaN for missing scores.
+        """
+        raw = np.asarray(raw, dtype=np.float64)
+        index = np.searchsorted(self.scores, raw)
+        found = index < len(self.scores)
+        found[found] = self.scores[index[found]] == raw[found]
+        below = self.cumulative[index]
+        same = np.where(
+            found, self.cumulative[np.minimum(index + 1, len(self.scores))] - below, 0
+        )
+        ranks = (below + same / 2) * (100 / self.n)
+        ranks[np.isnan(raw)] = np.nan
+        return ranks
+
+    def t_scores(self, raw: np.ndarray) -> np.ndarray:
+        """Return the T-scores (mean 50, SD 10 in the norm sample) of raw scores"""
+        return 50 + 10 * (np.asarray(raw, dtype=np.float64) - self.mean) / self.sd
+
+
+@dataclass(frozen=True, eq=False)
+class Norms:
+    """Norm tables of a questionnaire.
+
+    Attributes:
+        code (str): Code of the questionnaire, e.g. "rses".
+        lang (str): Language code, e.g. "pl".
+        source (str | None): Citation of the norm sample.
+        tables (tuple[NormTable, ...]): Tables, the most specific strata first.
+    """
+
+    code: str
+    lang: str
+    source: str | None
+    tables: tuple[NormTable, ...]
+
+    def _convert(self, method: str, raw, sex, age, score: str) -> np.ndarray:
+        raw = np.asarray(raw, dtype=np.float64)
+        sex = np.broadcast_to(np.asarray(ALL if sex is None else sex), raw.shape)
+        age = np.broadcast_to(
+            np.asarray(np.nan if age is None else age, dtype=np.float64), raw.shape
+        )
+        converted = np.full(raw.shape, np.nan)
+        pending = np.ones(raw.shape, dtype=bool)
+        for table in self.tables:
+            if table.score != score:
+                continue
+            rows = pending & table.matches(sex, age)
+            if rows.any():
+                converted[rows] = getattr(table, method)(raw[rows])
+                pending &= ~rows
+        return converted
+
+    def percentiles(self, raw, sex=None, age=None, score: str = "total") -> np.ndarray:
+        """Return the percentile ranks of raw scores in the participants' strata.
+
+        Args:
+            raw (np.ndarray): Raw scores.
+            sex (str | np.ndarray | None): Sex of every participant or of all. `None` uses the tables of all sexes.
+            age (float | np.ndarray | None): Age of every participant or of all. `None` uses the tables of all ages.
+            score (str): Name of the score, e.g. "total" or "Narcissism".
+
+        Returns:
+            np.ndarray: Percentile ranks from 0 to 100. NaN where no table applies.
+        """
+        return self._convert("percentiles", raw, sex, age, score)
+
+    def t_scores(self, raw, sex=None, age=None, score: str = "total") -> np.ndarray:
+        """Return the T-scores of raw scores in the participants' strata, see `percentiles()`"""
+        return self._convert("t_scores", raw, sex, age, score)
+
+
+def _path(code: str, lang: str, path: Path | None = None) -> Path:
+    return (NORMS_PATH if path is None else Path(path)) / lang / f"{code}.json"
+
+
+@lru_cache(maxsize=None)
+def load(code: str, lang: str = "en") -> Norms:
+    """Load the norms of a questionnaire.
+
+    Args:
+        code (str): Code of the questionnaire, e.g. "rses".
+        lang (str): Language code of the norm sample, e.g. "pl".
+
+    Returns:
+        Norms: The norms, cached for the process.
+
+    Raises:
+        KeyError: If there are no norms for the questionnaire in the language.
+    """
+    try:
+        data = json.loads(_path(code, lang).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise KeyError(f"No norms of {code!r} in {lang!r}") from None
+    tables = sorted(
+        (NormTable.from_dict(table) for table in data["tables"]),
+        key=lambda table: (table.sex == ALL, table.age is None),
+    )
+    return Norms(code, lang, data.get("source"), tuple(tables))
+
+
+def available() -> list[tuple[str, str]]:
+    """Return the `(code, lang)` pairs with norms"""
+    return sorted((path.stem, path.parent.name) for path in NORMS_PATH.glob("*/*.json"))
+
+
+def table(
+    sample, score: str = "total", sex: str = ALL, age: tuple | None = None
+) -> dict:
+    """Build the JSON of a norm table from the raw scores of a reference sample.
+
+    Args:
+        sample (np.ndarray): Raw scores of the sample. NaN is skipped.
+        score (str): Name of the score.
+        sex (str): Sex of the stratum or "all".
+        age (tuple | None): Lowest and highest age of the stratum or `None` for all ages.
+
+    Returns:
+        dict: Table for `write()`.
+    """
+    sample = np.asarray(sample, dtype=np.float64)
+    scores, counts = np.unique(sample[~np.isnan(sample)], return_counts=True)
+    return {
+        "score": score,
+        "sex": sex,
+        "age": None if age is None else list(age),
+        "scores": [int(s) if s.is_integer() else float(s) for s in scores],
+        "counts": counts.tolist(),
+    }
+
+
+def write(
+    code: str,
+    lang: str,
+    tables: list[dict],
+    source: str | None = None,
+    path: Path | str | None = None,
+) -> Path:
+    """Save the norms of a questionnaire.
+
+    Args:
+        code (str): Code of the questionnaire, e.g. "rses".
+        lang (str): Language code of the norm sample.
+        tables (list[dict]): Tables from `table()`.
+        source (str | None): Citation of the norm sample.
+        path (Path | str | None): Norms directory. `None` means the library one.
+
+    Returns:
+        Path: Path of the written file.
+    """
+    destination = _path(code, lang, path)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.write_text(
+        json.dumps({"source": source, "tables": tables}, ensure_ascii=False, indent=2)
+        + "\n",
+        encoding="utf-8",
+    )
+    load.cache_clear()
+    return destination
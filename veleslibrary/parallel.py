@@ -0,0 +1,146 @@
+"""Scoring of large response matrices on all CPU cores
+
+The rows are split into shards of `chunk_size` rows, scored in a process pool and written
+back in their original order. Rows are never pickled: the workers memory-map the input
+`.npy` file and write their scores into a shared, memory-mapped output `.npy` file.
+In-memory arrays are first saved to a temporary file in `/dev/shm` (shared memory on Linux)
+or in the system temporary folder. To avoid that copy, pass the path to a `.npy` file.
+
+Because the weights of the compiled specs are integers, the scores are exactly the same
+as in the serial `veleslibrary.scoring`.
+
+Example:
+    ```python
+    from veleslibrary.parallel import score_parallel
+    from veleslibrary.questionnaires import nfcs, rses, sd3
+
+    scores = score_parallel([rses, nfcs, sd3], "battery.npy", workers=8)
+    ```
+"""
+
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable
+
+import numpy as np
+
+from .scoring import (
+    CHUNK_SIZE,
+    MissingPolicy,
+    Scorer,
+    compile_battery,
+    compile_spec,
+    get_spec,
+)
+from .specs import ScoringSpec
+
+# Rows scored by one task of the pool
+SHARD_SIZE = 262144
+
+_SHARED_MEMORY = Path("/dev/shm")
+
+
+def shared_folder() -> tempfile.TemporaryDirectory:
+    """Temporary folder for memory-mapped arrays, in shared memory if possible"""
+    return tempfile.TemporaryDirectory(
+        dir=_SHARED_MEMORY if os.access(_SHARED_MEMORY, os.W_OK) else None
+    )
+
+
+def _scorer(
+    questionnaires: (
+        ScoringSpec | Callable | dict[str, ScoringSpec | Callable] | Iterable[Callable]
+    ),
+) -> Scorer:
+    """Compile a single questionnaire or a battery"""
+    if isinstance(questionnaires, ScoringSpec) or callable(questionnaires):
+        return compile_spec(get_spec(questionnaires))
+    return compile_battery(questionnaires)
+
+
+def _score_shard(
+    scorer: Scorer,
+    source: str,
+    destination: str,
+    start: int,
+    stop: int,
+    missing: MissingPolicy | dict[str, MissingPolicy] | None = None,
+):
+    """Score rows `start:stop` of the memory-mapped source into the destination"""
+    responses = np.load(source, mmap_mode="r")
+    scores = np.load(destination, mmap_mode="r+")
+    scores[start:stop] = scorer(responses[start:stop], CHUNK_SIZE, missing)
+    scores.flush()
+
+
+def score_parallel(
+    questionnaires: (
+        ScoringSpec | Callable | dict[str, ScoringSpec | Callable] | Iterable[Callable]
+    ),
+    responses: np.ndarray | Path | str,
+    workers: int | None = None,
+    chunk_size: int = SHARD_SIZE,
+    missing: MissingPolicy | dict[str, MissingPolicy] | None = None,
+) -> dict[str, np.ndarray]:
+    """Score a response matrix in a process pool.
+
+    Args:
+        questionnaires (ScoringSpec | Callable | dict | Iterable[Callable]): A questionnaire or a battery, see `veleslibrary.scoring.compile_battery()`.
+        responses (np.ndarray | Path | str): `(n_respondents × n_items)` array of coded answers or a path to such a `.npy` file.
+        workers (int | None): Number of processes. `None` means the number of CPUs.
+        chunk_size (int): Number of rows in a shard scored by one task.
+        missing (MissingPolicy | dict[str, MissingPolicy] | None): Policy of all the scores or policies by score name, see `veleslibrary.scoring.Scorer`.
+
+    Returns:
+        dict[str, np.ndarray]: Scores of every respondent in the original order, keyed by the score names.
+    """
+    scorer = _scorer(questionnaires)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with shared_folder() as folder:
+        if isinstance(responses, (str, Path)):
+            source = str(responses)
+            shape = np.load(source, mmap_mode="r").shape
+        else:
+            responses = np.asarray(responses)
+            shape = responses.shape
+            if workers == 1 or shape[0] <= chunk_size:
+                scores = scorer(responses, missing=missing)
+                return {name: scores[:, i] for i, name in enumerate(scorer.names)}
+            source = os.path.join(folder, "responses.npy")
+            np.save(source, responses)
+
+        if len(shape) != 2 or shape[1] != scorer.items:
+            raise ValueError(
+                f"Expected an array of shape (n, {scorer.items}), got {shape}"
+            )
+
+        destination = os.path.join(folder, "scores.npy")
+        np.lib.format.open_memmap(
+            destination,
+            mode="w+",
+            dtype=np.float64,
+            shape=(shape[0], len(scorer.names)),
+        ).flush()
+
+        shards = range(0, shape[0], chunk_size)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for future in [
+                pool.submit(
+                    _score_shard,
+                    scorer,
+                    source,
+                    destination,
+                    start,
+                    min(start + chunk_size, shape[0]),
+                    missing,
+                )
+                for start in shards
+            ]:
+                future.result()
+
+        scores = np.array(np.load(destination, mmap_mode="r"))
+    return {name: scores[:, i] for i, name in enumerate(scorer.names)}
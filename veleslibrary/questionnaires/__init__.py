@@ -13,9 +13,16 @@ I'd be greatful if you could also write a documentation for the questionnaire.
 See the repo: https://github.com/jakub-jedrusiak/VelesDocs
 """
 
-from . import es, hu, pl, sv
-from .rses import rses
-from .nfcs import nfcs, nfcsShort
-from .tls_15 import tls_15
-from .sd3 import sd3
-from .mini_cope import mini_cope
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["es", "hu", "pl", "sv"],
+    attributes={
+        "rses": ["rses"],
+        "nfcs": ["nfcs", "nfcsShort"],
+        "tls_15": ["tls_15"],
+        "sd3": ["sd3"],
+        "mini_cope": ["mini_cope"],
+    },
+)
@@ -3,7 +3,32 @@
 import velesresearch as vls
 from velesresearch.models import PageModel
 
-
+from ..itemstore import load
+from ..specs import scoring
+
+
+@scoring(
+    items=28,
+    response_range=(0, 3),
+    subscales={
+        "Active Coping": (1, 2),
+        "Planning": (3, 4),
+        "Positive Reframing": (5, 6),
+        "Acceptance": (7, 8),
+        "Humor": (9, 10),
+        "Religion": (11, 12),
+        "Using Emotional Support": (13, 14),
+        "Using Instrumental Support": (15, 16),
+        "Self-Distraction": (17, 18),
+        "Denial": (19, 20),
+        "Venting": (21, 22),
+        "Substance Use": (23, 24),
+        "Behavioral Disengagement": (25, 26),
+        "Self-Blame": (27, 28),
+    },
+    aggregation="mean",
+    total=False,
+)
 def mini_cope(
     name: str = "Mini_COPE",
     instruction: str | None = None,
@@ -28,7 +53,7 @@ def mini_cope(
     ## Subscales
         1. Active Coping: 1, 2
         2. Planning: 3, 4
-        3. Positive Refraining : 5, 6
+        3. Positive Reframing: 5, 6
         4. Acceptance: 7, 8
         5. Humor: 9, 10
         6. Religion: 11, 12
@@ -44,7 +69,7 @@ def mini_cope(
     ## Reliability
         1. Active Coping: α = .68
         2. Planning: α = .73
-        3. Positive Refraining : α = .64
+        3. Positive Reframing: α = .64
         4. Acceptance: α = .57
         5. Humor: α = .73
         6. Religion: α = .82
@@ -69,8 +94,10 @@ def mini_cope(
     Returns:
         PageModel: PageModel with the Mini-COPE questionnaire. Use the `*` operator to unpack it to questions.
     """
+    texts = load("mini_cope")
+
     if instruction is None:
-        instruction = """The following questions ask how you have sought to cope with a hardship in your life. Read the statements and indicate how much you have been using each coping style. """
+        instruction = texts["instruction"]
 
     if questionOptions is None:
         questionOptions = {}
@@ -78,51 +105,13 @@ def mini_cope(
     if pageOptions is None:
         pageOptions = {}
 
-    items = """I've been concentrating my efforts on doing something about the situation I'm in.
-I've been taking action to try to make the situation better.
-I've been trying to come up with a strategy about what to do.
-I've been thinking hard about what steps to take.
-I've been trying to see it in a different light, to make it seem more positive.
-I've been looking for something good in what is happening.
-I've been accepting the reality of the fact that it has happened.
-I've been learning to live with it.
-I've been making jokes about it.
-I've been making fun of the situation.
-I've been trying to find comfort in my religion or spiritual beliefs.
-I've been praying or meditating.
-I've been getting emotional support from others.
-I've been getting comfort and understanding from someone.
-I've been trying to get advice or help from other people about what to do.
-I've been getting help and advice from other people.
-I've been turning to work or other activities to take my mind off things.
-I've been doing something to think about it less, such as going to movies, watching TV, reading, daydreaming, sleeping, or shopping.
-I've been saying to myself "this isn't real."
-I've been refusing to believe that it has happened.
-I've been saying things to let my unpleasant feelings escape.
-I've been expressing my negative feelings.
-I've been using alcohol or other drugs to make myself feel better.
-I've been using alcohol or other drugs to help me get through it.
-I've been giving up trying to deal with it.
-I've been giving up the attempt to cope.
-I've been criticizing myself.
-I've been blaming myself for things that happened.""".split(
-        "\n"
-    )
-
-    scale = """0 – I haven't been doing this at all
-1
-2
-3 – I've been doing this a lot""".split(
-        "\n"
-    )
-
     return vls.page(
         name + "_page",
         vls.info(name + "_instruction", instruction),
         vls.radio(
             name,
-            items,
-            scale,
+            list(texts["items"]),
+            list(texts["scale"]),
             **questionOptions,
         ),
         **pageOptions,
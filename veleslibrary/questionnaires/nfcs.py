@@ -3,7 +3,26 @@
 import velesresearch as vls
 from velesresearch.models import PageModel
 
-
+from ..itemstore import load
+from ..specs import scoring
+from ..styles import style_tag
+
+# Items of the long form in the short form (Roets & Van Hiel, 2011)
+SHORT_FORM = (3, 4, 6, 8, 9, 11, 12, 13, 15, 25, 30, 32, 33, 39, 40)
+
+
+@scoring(
+    items=41,
+    response_range=(1, 6),
+    reverse=(2, 5, 18, 19, 20, 24, 27, 28, 34, 37, 41),
+    subscales={
+        "Need for order": (1, 6, 10, 20, 23, 27, 32, 33, 35, 41),
+        "Need for predictability": (5, 7, 11, 18, 19, 25, 26, 40),
+        "Decisiveness": (12, 13, 15, 16, 17, 22),
+        "Avoidance of ambiguity": (3, 8, 14, 21, 29, 30, 31, 36, 38),
+        "Closed mindedness": (2, 4, 9, 24, 28, 34, 37, 39),
+    },
+)
 def nfcs(
     name: str = "NFCS",
     instruction: str | None = None,
@@ -61,132 +80,18 @@ def nfcs(
         PageModel: PageModel with the NFCS long questionnaire. Use the `*` operator to unpack it to questions.
     """
 
-    if matrixOptions is None:
-        matrixOptions = {}
-    if ratingOptions is None:
-        ratingOptions = {}
-    if pageOptions is None:
-        pageOptions = {}
-
-    if instruction is None:
-        instruction = """
-<style>
-    .nfcsContainer {
-        display: grid;
-        grid-template-columns: auto auto;
-        gap: 20px;
-        max-width: 600px;
-        margin: 0 auto;
-        grid-template-areas:
-            "item1 item4"
-            "item2 item5"
-            "item3 item6";
-    }
-    .nfcsItem1 { grid-area: item1; }
-    .nfcsItem2 { grid-area: item2; }
-    .nfcsItem3 { grid-area: item3; }
-    .nfcsItem4 { grid-area: item4; }
-    .nfcsItem5 { grid-area: item5; }
-    .nfcsItem6 { grid-area: item6; }
-
-    .nfcsItem {
-        margin: 5px 0;
-    }
-
-    @media (max-width: 600px) {
-        .nfcsContainer {
-            grid-template-columns: 1fr;
-            grid-template-areas:
-                "item1"
-                "item2"
-                "item3"
-                "item4"
-                "item5"
-                "item6";
-        }
-    }
-</style>
-<p>Read each of the following statements and decide how much you agree with each according to
-your beliefs and experiences. Please respond according to the following scale:</p>
-
-<div class="nfcsContainer">
-    <div class="nfcsItem nfcsItem1">1 = Strongly disagree</div>
-    <div class="nfcsItem nfcsItem4">4 = Slightly agree</div>
-    <div class="nfcsItem nfcsItem2">2 = Moderately disagree</div>
-    <div class="nfcsItem nfcsItem5">5 = Moderately agree</div>
-    <div class="nfcsItem nfcsItem3">3 = Slightly disagree</div>
-    <div class="nfcsItem nfcsItem6">6 = Strongly agree</div>
-</div>
-"""
-
-    NFCS_items = """I think that having clear rules and order at work is essential for success.
-Even after I've made up my mind about something, I am always eager to consider a different opinion.
-I don't like situations that are uncertain.
-I dislike questions which could be answered in many different ways.
-I like to have friends who are unpredictable.
-I find that a well ordered life with regular hours suits my temperament.
-When dining out, I like to go to places where I have been before so that I know what to expect.
-I feel uncomfortable when I don't understand the reason why an event occurred in my life.
-I feel irritated when one person disagrees with what everyone else in a group believes.
-I hate to change my plans at the last minute.
-I don't like to go into a situation without knowing what I can expect from it.
-When I have made a decision, I feel relieved
-When I am confronted with a problem, I’m dying to reach a solution very quickly.
-When I am confused about an important issue, I feel very upset.
-I would quickly become impatient and irritated if I would not find a solution to a problem immediately.
-I would rather make a decision quickly than sleep over it.
-Even if I get a lot of time to make a decision, I still feel compelled to decide quickly.
-I think it is fun to change my plans at the last moment.
-I enjoy the uncertainty of going into a new situation without knowing what might happen.
-My personal space is usually messy and disorganized.
-In most social conflicts, I can easily see which side is right and which is wrong.
-I almost always feel hurried to reach a decision, even when there is no reason to do so
-I believe that orderliness and organization are among the most important characteristics of a good student.
-When considering most conflict situations, I can usually see how both sides could be right.
-I don't like to be with people who are capable of unexpected actions.
-I prefer to socialize with familiar friends because I know what to expect from them.
-I think that I would learn best in a class that lacks clearly stated objectives and requirements.
-When thinking about a problem, I consider as many different opinions on the issue as possible.
-I like to know what people are thinking all the time.
-I dislike it when a person's statement could mean many different things.
-It's annoying to listen to someone who cannot seem to make up his or her mind.
-I find that establishing a consistent routine enables me to enjoy life more.
-I enjoy having a clear and structured mode of life.
-I prefer interacting with people whose opinions are very different from my own.
-I like to have a place for everything and everything in its place.
-I feel uncomfortable when someone's meaning or intention is unclear to me.
-I always see many possible solutions to problems I face.
-I'd rather know bad news than stay in a state of uncertainty.
-I do not usually consult many different opinions before forming my own view.
-I dislike unpredictable situations.
-I dislike the routine aspects of my work (studies).""".split(
-        "\n"
-    )
-
-    return vls.page(
-        name + "_page",
-        vls.info(name + "_instruction", instruction),
-        vls.matrixDropdown(
-            name,
-            title,
-            vls.rating(
-                name,
-                None,
-                **{"rateMax": 6, "minWidth": "min-content"} | ratingOptions,
-            ),
-            NFCS_items,
-            **{
-                "titleLocation": "hidden",
-                "showHeader": False,
-                "rowTitleWidth": "100%",
-                "alternateRows": True,
-            }
-            | matrixOptions,
-        ),
-        **{"title": "NFCS"} | pageOptions,
+    return _page(
+        name,
+        instruction,
+        title,
+        load("nfcs")["items"],
+        matrixOptions,
+        ratingOptions,
+        pageOptions,
     )
 
 
+@scoring(items=15, response_range=(1, 6))
 def nfcsShort(
     name: str = "NFCS",
     instruction: str | None = None,
@@ -235,6 +140,28 @@ def nfcsShort(
         PageModel: PageModel with the NFCS short questionnaire. Use the `*` operator to unpack it to questions.
     """
 
+    items = load("nfcs")["items"]
+    return _page(
+        name,
+        instruction,
+        title,
+        [items[item - 1] for item in SHORT_FORM],
+        matrixOptions,
+        ratingOptions,
+        pageOptions,
+    )
+
+
+def _page(
+    name: str,
+    instruction: str | None,
+    title: str | None,
+    items: list[str],
+    matrixOptions: dict | None,
+    ratingOptions: dict | None,
+    pageOptions: dict | None,
+) -> PageModel:
+    "Build the page of the long or the short form"
     if matrixOptions is None:
         matrixOptions = {}
     if ratingOptions is None:
@@ -243,73 +170,7 @@ def nfcsShort(
         pageOptions = {}
 
     if instruction is None:
-        instruction = """
-<style>
-    .nfcsContainer {
-        display: grid;
-        grid-template-columns: auto auto;
-        gap: 20px;
-        max-width: 600px;
-        margin: 0 auto;
-        grid-template-areas:
-            "item1 item4"
-            "item2 item5"
-            "item3 item6";
-    }
-    .nfcsItem1 { grid-area: item1; }
-    .nfcsItem2 { grid-area: item2; }
-    .nfcsItem3 { grid-area: item3; }
-    .nfcsItem4 { grid-area: item4; }
-    .nfcsItem5 { grid-area: item5; }
-    .nfcsItem6 { grid-area: item6; }
-
-    .nfcsItem {
-        margin: 5px 0;
-    }
-
-    @media (max-width: 600px) {
-        .nfcsContainer {
-            grid-template-columns: 1fr;
-            grid-template-areas:
-                "item1"
-                "item2"
-                "item3"
-                "item4"
-                "item5"
-                "item6";
-        }
-    }
-</style>
-<p>Read each of the following statements and decide how much you agree with each according to
-your beliefs and experiences. Please respond according to the following scale:</p>
-
-<div class="nfcsContainer">
-    <div class="nfcsItem nfcsItem1">1 = Strongly disagree</div>
-    <div class="nfcsItem nfcsItem4">4 = Slightly agree</div>
-    <div class="nfcsItem nfcsItem2">2 = Moderately disagree</div>
-    <div class="nfcsItem nfcsItem5">5 = Moderately agree</div>
-    <div class="nfcsItem nfcsItem3">3 = Slightly disagree</div>
-    <div class="nfcsItem nfcsItem6">6 = Strongly agree</div>
-</div>
-"""
-
-    NFCS_items = """I don't like situations that are uncertain.
-I dislike questions which could be answered in many different ways.
-I find that a well ordered life with regular hours suits my temperament.
-I feel uncomfortable when I don't understand the reason why an event occurred in my life.
-I feel irritated when one person disagrees with what everyone else in a group believes.
-I don't like to go into a situation without knowing what I can expect from it.
-When I have made a decision, I feel relieved
-When I am confronted with a problem, I’m dying to reach a solution very quickly.
-I would quickly become impatient and irritated if I would not find a solution to a problem immediately.
-I don't like to be with people who are capable of unexpected actions.
-I dislike it when a person's statement could mean many different things.
-I find that establishing a consistent routine enables me to enjoy life more.
-I enjoy having a clear and structured mode of life.
-I do not usually consult many different opinions before forming my own view.
-I dislike unpredictable situations.""".split(
-        "\n"
-    )
+        instruction = style_tag("nfcs") + load("nfcs")["instruction"]
 
     return vls.page(
         name + "_page",
@@ -322,7 +183,7 @@ I dislike unpredictable situations.""".split(
                 None,
                 **{"rateMax": 6, "minWidth": "min-content"} | ratingOptions,
             ),
-            NFCS_items,
+            list(items),
             **{
                 "titleLocation": "hidden",
                 "showHeader": False,
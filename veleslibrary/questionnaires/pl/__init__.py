@@ -13,6 +13,13 @@ I'd be greatful if you could also write a documentation for the questionnaire.
 See the repo: https://github.com/jakub-jedrusiak/VelesDocs
 """
 
-from .tipi import tipi
-from .rses import rses
-from .tls_15 import tls_15
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "tipi": ["tipi"],
+        "rses": ["rses"],
+        "tls_15": ["tls_15"],
+    },
+)
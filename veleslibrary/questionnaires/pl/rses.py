@@ -3,7 +3,11 @@
 import velesresearch as vls
 from velesresearch.models import PageModel
 
+from ...itemstore import load
+from ...specs import scoring
 
+
+@scoring(items=10, response_range=(1, 4), reverse=(3, 5, 8, 9, 10), descending=True)
 def rses(
     name: str = "RSES",
     instruction: str | None = None,
@@ -26,6 +30,7 @@ def rses(
 
     ## Score calculation
         A simple sum.
+        "Zdecydowanie zgadzam się" is 4 and "zdecydowanie nie zgadzam się" is 1 before reverse scoring, so higher scores mean higher self-esteem.
 
     ## Reverse items
         3, 5, 8, 9, 10
@@ -48,8 +53,10 @@ def rses(
     Returns:
         PageModel: PageModel with the RSES questionnaire. Use the `*` operator to unpack it to questions.
     """
+    texts = load("rses", "pl")
+
     if instruction is None:
-        instruction = """Poniżej znajdują się różne stwierdzenia, które odnoszą się do twoich przekonań o sobie. Wskaż, w jakim stopniu zgadzasz się bądź nie zgadzasz się z każdym z tych twierdzeń, otaczając kółkiem jedną z czterech możliwych odpowiedzi. Postaraj się określić to, co naprawdę sądzisz. Liczą się tylko szczere odpowiedzi."""
+        instruction = texts["instruction"]
 
     if questionOptions is None:
         questionOptions = {}
@@ -57,33 +64,13 @@ def rses(
     if pageOptions is None:
         pageOptions = {}
 
-    items = """Uważam, że jestem osobą wartościową przynajmniej w takim samym stopniu, co inni.
-Uważam, że posiadam wiele pozytywnych cech.
-Ogólnie biorąc jestem skłonny(a) sądzić, że nie wiedzie mi się.
-Potrafię robić różne rzeczy tak dobrze, jak większość innych ludzi.
-Uważam, że nie mam wielu powodów, aby być z siebie dumn(ą)ym.
-Lubię siebie.
-Ogólnie rzecz biorąc, jestem z siebie zadowolon(a)y.
-Chciał(a)bym mieć więcej szacunku dla samego siebie.
-Czasami czuję się bezużyteczn(a)y.
-Niekiedy uważam, że jestem do niczego.""".split(
-        "\n"
-    )
-
-    scale = """1 – zdecydowanie zgadzam się
-2 – zgadzam się
-3 – nie zgadzam się
-4 – zdecydowanie nie zgadzam się""".split(
-        "\n"
-    )
-
     return vls.page(
         name + "_page",
         vls.info(name + "_instruction", instruction),
         vls.radio(
             name,
-            items,
-            scale,
+            list(texts["items"]),
+            list(texts["scale"]),
             **questionOptions,
         ),
         **pageOptions,
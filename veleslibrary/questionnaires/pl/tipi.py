@@ -3,7 +3,24 @@
 import velesresearch as vls
 from velesresearch.models import PageModel
 
-
+from ...itemstore import load
+from ...specs import scoring
+
+
+@scoring(
+    items=10,
+    response_range=(1, 7),
+    reverse=(2, 4, 6, 8, 10),
+    subscales={
+        "Extraversion": (1, 6),
+        "Agreeableness": (2, 7),
+        "Conscientiousness": (3, 8),
+        "Emotional Stability": (4, 9),
+        "Openness to Experience": (5, 10),
+    },
+    aggregation="mean",
+    total=False,
+)
 def tipi(
     name: str = "TIPI",
     instruction: str | None = None,
@@ -20,6 +37,9 @@ def tipi(
     ## Adaptation
         Sorokowska, A., Słowińska A., Zbieg A., Sorokowski, P. (2014). _Polska adaptacja testu Ten Item Personality Inventory (TIPI) – TIPI-PL – wersja standardowa i internetowa._ Wrocław: WrocLab.
 
+    ## Score calculation
+        An average.
+
     ## Reverse items
         2, 4, 6, 8, 10
 
@@ -65,8 +85,10 @@ def tipi(
     Returns:
         PageModel: PageModel with the TIPI questionnaire.
     """
+    texts = load("tipi", "pl")
+
     if instruction is None:
-        instruction = "Poniżej przedstawiona jest lista cech, które <u>są lub nie są</u> Twoimi charakterystykami. Zaznacz przy poszczególnych stwierdzeniach, do jakiego stopnia <u>zgadzasz się lub nie zgadzasz</u> z każdym z nich. Oceń stopień, w jakim każde z pytań odnosi się do Ciebie."
+        instruction = texts["instruction"]
 
     if questionOptions is None:
         questionOptions = {}
@@ -74,37 +96,14 @@ def tipi(
     if pageOptions is None:
         pageOptions = {}
 
-    items = """Lubiącą towarzystwo innych, aktywną i optymistyczną.
-Krytyczną względem innych, konfliktową.
-Sumienną, zdyscyplinowaną.
-Pełną niepokoju, łatwo wpadającą w przygnębienie.
-Otwartą na nowe doznania, w złożony sposób postrzegającą świat.
-Zamkniętą w sobie, wycofaną i cichą.
-Zgodną, życzliwą.
-Źle zorganizowaną, niedbałą.
-Niemartwiącą się, stabilną emocjonalnie.
-Trzymającą się utartych schematów, biorącą rzeczy wprost.""".split(
-        "\n"
-    )
-
-    scale = """Zdecydowanie się nie zgadzam
-Raczej się nie zgadzam
-W niewielkim stopniu się nie zgadzam
-Ani się zgadzam, ani się nie zgadzam
-W niewielkim stopniu się zgadzam
-Raczej się zgadzam
-Zdecydowanie się zgadzam""".split(
-        "\n"
-    )
-
     return vls.page(
         name + "_page",
         vls.info(name + "_instruction", instruction),
-        vls.info(name + "_intro", "**Spostrzegam siebie jako osobę:**"),
+        vls.info(name + "_intro", texts["intro"]),
         vls.radio(
             name,
-            items,
-            scale,
+            list(texts["items"]),
+            list(texts["scale"]),
             **questionOptions,
         ),
         **pageOptions,
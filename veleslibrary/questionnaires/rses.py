@@ -3,7 +3,11 @@
 import velesresearch as vls
 from velesresearch.models import PageModel
 
+from ..itemstore import load
+from ..specs import scoring
 
+
+@scoring(items=10, response_range=(1, 4), reverse=(3, 5, 8, 9, 10), descending=True)
 def rses(
     name: str = "RSES",
     instruction: str | None = None,
@@ -21,9 +25,10 @@ def rses(
 
     ## Score calculation
         A simple sum.
+        "Strongly Agree" is 4 and "Strongly Disagree" is 1 before reverse scoring, so higher scores mean higher self-esteem.
 
     ## Reverse items
-        3, 5, 8, 10
+        3, 5, 8, 9, 10
 
     ## Subscales
         None.
@@ -44,8 +49,10 @@ def rses(
         PageModel: PageModel with the RSES questionnaire. Use the `*` operator to unpack it to questions.
     """
 
+    texts = load("rses")
+
     if instruction is None:
-        instruction = "Below is a list of statements dealing with your general feelings about yourself. Please indicate how strongly you agree or disagree with each statement."
+        instruction = texts["instruction"]
 
     if questionOptions is None:
         questionOptions = {}
@@ -55,25 +62,11 @@ def rses(
 
     return vls.page(
         name + "_page",
-        vls.info(
-            name + "_instruction",
-            instruction,
-        ),
+        vls.info(name + "_instruction", instruction),
         vls.radio(
             name,
-            """I feel that I am a person of worth, at least on an equal plane with others.
-I feel that I have a number of good qualities.
-All in all, I am inclined to feel that I am a failure.
-I am able to do things as well as most other people.
-I feel I do not have much to be proud of.
-I take a positive attitude toward myself.
-On the whole, I am satisfied with myself.
-I wish I could have more respect for myself.
-I certainly feel useless at times.
-At times I think I am no good at all.""".split(
-                "\n"
-            ),
-            "Strongly Agree; Agree; Disagree; Strongly Disagree".split("; "),
+            list(texts["items"]),
+            list(texts["scale"]),
             **questionOptions,
         ),
         **pageOptions,
@@ -3,7 +3,21 @@
 import velesresearch as vls
 from velesresearch.models import PageModel
 
-
+from ..itemstore import load
+from ..specs import scoring
+
+
+@scoring(
+    items=27,
+    response_range=(1, 5),
+    reverse=(11, 15, 17, 20, 25),
+    subscales={
+        "Machiavellianism": (1, 2, 3, 4, 5, 6, 7, 8, 9),
+        "Narcissism": (10, 11, 12, 13, 14, 15, 16, 17, 18),
+        "Psychopathy": (19, 20, 21, 22, 23, 24, 25, 26, 27),
+    },
+    total=False,
+)
 def sd3(
     name: str = "SD3",
     instruction: str | None = None,
@@ -47,8 +61,10 @@ def sd3(
     Returns:
         PageModel: PageModel with the SD3 questionnaire. Use the `*` operator to unpack it to questions.
     """
+    texts = load("sd3")
+
     if instruction is None:
-        instruction = """Please indicate how much you agree with each of the following statements."""
+        instruction = texts["instruction"]
 
     if questionOptions is None:
         questionOptions = {}
@@ -56,51 +72,13 @@ def sd3(
     if pageOptions is None:
         pageOptions = {}
 
-    items = """It’s not wise to tell your secrets.
-I like to use clever manipulation to get my way.
-Whatever it takes, you must get the important people on your side.
-Avoid direct conflict with others because they may be useful in the future.
-It’s wise to keep track of information that you can use against people later.
-You should wait for the right time to get back at people.
-There are things you should hide from other people to preserve your reputation.
-Make sure your plans benefit yourself, not others.
-Most people can be manipulated.
-People see me as a natural leader.
-I hate being the center of attention.
-Many group activities tend to be dull without me.
-I know that I am special because everyone keeps telling me so.
-I like to get acquainted with important people.
-I feel embarrassed if someone compliments me.
-I have been compared to famous people.
-I am an average person.
-I insist on getting the respect I deserve.
-I like to get revenge on authorities.
-I avoid dangerous situations.
-Payback needs to be quick and nasty.
-People often say I’m out of control.
-It’s true that I can be mean to others.
-People who mess with me always regret it.
-I have never gotten into trouble with the law.
-I enjoy having sex with people I hardly know
-I’ll say anything to get what I want.""".split(
-        "\n"
-    )
-
-    scale = """1 – Disagree strongly
-2 – Disagree
-3 – Neither agree nor disagree
-4 – Agree
-5 – Agree strongly""".split(
-        "\n"
-    )
-
     return vls.page(
         name + "_page",
         vls.info(name + "_instruction", instruction),
         vls.radio(
             name,
-            items,
-            scale,
+            list(texts["items"]),
+            list(texts["scale"]),
             **questionOptions,
         ),
         **pageOptions,
@@ -1,25 +1,42 @@
-"""Triangular Love Scale (TLS-15)"""
+"""Triangular Love Scale (TLS-15)
+
+All the language versions share this implementation. Their texts are in the item store
+(sources in `veleslibrary/data/items/<language>/tls_15.json`), decoded on first use of a
+language and interned, so pages of the same language share their strings. To add a
+translation, add its JSON file and rebuild the store. It's then available as
+`tls_15(lang="<language>")`.
+"""
+
+from functools import lru_cache
+from typing import Callable, NamedTuple
 
 import velesresearch as vls
 from velesresearch.models import PageModel
 
-
-def tls_15(
-    name: str = "TLS_15",
-    instruction: str | None = None,
-    questionOptions: dict | None = None,
-    pageOptions: dict | None = None,
-) -> PageModel:
-    """
+from .. import itemstore
+from ..specs import scoring
+
+_scoring = scoring(
+    items=15,
+    response_range=(1, 5),
+    subscales={
+        "Intimacy": (1, 2, 3, 4, 5),
+        "Passion": (6, 7, 8, 9, 10),
+        "Commitment": (11, 12, 13, 14, 15),
+    },
+    aggregation="mean",
+)
+
+_DOCSTRING = """
     ## Triangular Love Scale (TLS-15)
-       Sternberg's triangular love theory questionnaire. A shorter version of TLS-45, that measures three components of love: intimacy, passion, and commitment.
+        Sternberg’s triangular love theory questionnaire. A shorter version of TLS-45, that measures three components of love: intimacy, passion, and commitment.
 
     ## Original
-        Kowal, M., et al., (2024). Validation of the Short Version (TLS-15) of the Triangular Love Scale (TLS-45) across 37 Languages. _Archives of Sexual Behavior_, _53_, 839-857. <https://doi.org/10.1007/s10508-023-02702-7>
-
-        Sternberg, R. J. (1997). Construct validation of a triangular love scale. _European Journal of Social Psychology_, _27_(3), 313-335. <https://doi.org/10.1002/(SICI)1099-0992(199705)27:3%3C313::AID-EJSP824%3E3.0.CO;2-4>
-
-        Sternberg, R. J. (1988). _The triangle of love: Intimacy, passion, commitment._ Basic Books.
+        <div class="csl-bib-body" style="line-height: 2; margin-left: 2em; text-indent:-2em;">
+        <div class="csl-entry">Kowal, M., Sorokowski, P., Dinić, B. M., Pisanski, K., Gjoneska, B., Frederick, D. A., Pfuhl, G., Milfont, T. L., Bode, A., Aguilar, L., García, F. E., Roberts, S. C., Abad-Villaverde, B., Kavčič, T., Miroshnik, K. G., Ndukaihe, I. L. G., Šafárová, K., Valentova, J. V., Aavik, T., … Sternberg, R. J. (2024). Validation of the short version (TLS-15) of the triangular love scale (TLS-45) across 37 languages. <i>Archives of Sexual Behavior</i>, <i>53</i>(2), 839–857. <https://doi.org/10.1007/s10508-023-02702-7></div>
+        <div class="csl-entry">Sternberg, R. J. (1988). <i>The triangle of love: Intimacy, passion, commitment.</i> Basic Books.</div>
+        <div class="csl-entry">Sternberg, R. J. (1997). Construct validation of a triangular love scale. <i>European Journal of Social Psychology</i>, <i>27</i>(3), 313–335. <https://doi.org/10.1002/(SICI)1099-0992(199705)27:3&lt;313::AID-EJSP824&gt;3.0.CO;2-4></div>
+        </div>
 
     ## Score calculation
         An average. Can be calculated separately for the subscales or for the whole questionnaire.
@@ -37,24 +54,74 @@ def tls_15(
 
         ### Subscales
             1. Intimacy: α = .89
-            2. Passion: α =.89
-            3. Commitment: α = 0.92
+            2. Passion: α = .89
+            3. Commitment: α = .92
 
     ## Implemented by
-        Ksawery Łakomy (University of Wrocław)
+        {implemented_by}
 
     Args:
         name (str): Base name for pages and questions. Defaults to "TLS_15".
         instruction (str): Instruction for the questionnaire. `None` means that the default instruction will be used.
         questionOptions (dict | None): Additional options for questions as a dictionary. Defaults to None.
-        pageOptions (dict | None): Additional options for pages as a dictionary. Defaults to None.
+        pageOptions (dict | None): Additional options for pages as a dictionary. Defaults to None.{lang}
 
     Returns:
         PageModel: PageModel with the TLS-15 questionnaire. Use the `*` operator to unpack it to questions.
     """
 
+_LANG_ARG = """
+        lang (str): Language code of the translation, see `languages()`. Defaults to "en"."""
+
+
+class Translation(NamedTuple):
+    "Texts of one language version"
+
+    implemented_by: str
+    instruction: str
+    scale: tuple[str, ...]
+    items: tuple[str, ...]
+
+
+def languages() -> list[str]:
+    "Return the codes of the available translations"
+    return itemstore.languages("tls_15")
+
+
+@lru_cache(maxsize=None)
+def translation(lang: str) -> Translation:
+    """Load the texts of a language. The result is cached and the strings are interned.
+
+    Args:
+        lang (str): Language code, e.g. "pl".
+
+    Returns:
+        Translation: The texts.
+
+    Raises:
+        KeyError: If there's no such translation.
+    """
+    try:
+        texts = itemstore.load("tls_15", lang)
+    except KeyError:
+        raise KeyError(f"No TLS-15 translation in language {lang!r}") from None
+    return Translation(
+        texts["implemented_by"], texts["instruction"], texts["scale"], texts["items"]
+    )
+
+
+@_scoring
+def tls_15(
+    name: str = "TLS_15",
+    instruction: str | None = None,
+    questionOptions: dict | None = None,
+    pageOptions: dict | None = None,
+    lang: str = "en",
+) -> PageModel:
+    texts = translation(lang)
+
     if instruction is None:
-        instruction = "In this part of the survey, we are interested in processes that happen within relationships. Read each of the following statements, thinking about one person you love or care for deeply (your boyfriend/girlfriend/spouse). Rate your agreement with each statement according to the following scale and mark the appropriate number between 1 (not at all) and 5 (extremely)."
+        instruction = texts.instruction
 
     if questionOptions is None:
         questionOptions = {}
@@ -64,31 +131,44 @@ def tls_15(
 
     return vls.page(
         name + "_page",
-        vls.info(
-            name + "_instruction",
-            instruction,
-        ),
+        vls.info(name + "_instruction", instruction),
         vls.radio(
             name,
-            """I have a warm relationship with my partner.
-I receive considerable emotional support from my partner.
-I value my partner greatly in my life.
-I have a comfortable relationship with my partner.
-I feel that my partner really understands me.
-My relationship with my partner is very romantic.
-I find my partner to be very personally attractive.
-I cannot imagine another person making me as happy as my partner does.
-There is something almost “magical” about my relationship with my partner.
-My relationship with my partner is passionate.
-I have confidence in the stability of my relationship with my partner.
-I view my commitment to my partner as a solid one.
-I am certain of my love for my partner.
-I view my relationship with my partner as permanent.
-I feel a sense of responsibility toward my partner.""".split(
-                "\n"
-            ),
-            "1 – Not at all; 2; 3; 4; 5 – Extremely".split("; "),
+            list(texts.items),
+            list(texts.scale),
             **questionOptions,
         ),
         **pageOptions,
     )
+
+
+tls_15.__doc__ = _DOCSTRING.format(
+    implemented_by=translation("en").implemented_by, lang=_LANG_ARG
+)
+
+
+def translated(lang: str, module: str) -> Callable:
+    """Return `tls_15()` fixed to one language, for the language packages.
+
+    Args:
+        lang (str): Language code of the translation.
+        module (str): Name of the module the function is exported from.
+
+    Returns:
+        Callable: Questionnaire function without the `lang` argument.
+    """
+
+    def function(
+        name: str = "TLS_15",
+        instruction: str | None = None,
+        questionOptions: dict | None = None,
+        pageOptions: dict | None = None,
+    ) -> PageModel:
+        return tls_15(name, instruction, questionOptions, pageOptions, lang=lang)
+
+    function.__name__ = function.__qualname__ = "tls_15"
+    function.__module__ = module
+    function.__doc__ = _DOCSTRING.format(
+        implemented_by=translation(lang).implemented_by, lang=""
+    )
+    return _scoring(function)
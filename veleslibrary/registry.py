@@ -0,0 +1,243 @@
+"""Index of all the questionnaires and tests in the library
+
+The index maps `(code, language)` to static metadata and the import path of the function.
+It's precomputed in `veleslibrary/data/registry.json`, so lookups don't import any
+questionnaire module (nor velesresearch). The function itself is imported on first use
+of `Entry.factory`. Rebuild the index after adding or changing a questionnaire with:
+
+    python -m veleslibrary.registry
+
+Example:
+    ```python
+    from veleslibrary import registry
+
+    registry.get("tls_15", "hu").items  # 15
+    [entry.code for entry in registry.entries(lang="en")]
+    page = registry.get("rses")(name="RSES_pre")
+    ```
+"""
+
+import html
+import importlib
+import inspect
+import json
+import pkgutil
+import re
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterator
+
+INDEX_PATH = Path(__file__).parent / "data" / "registry.json"
+
+# Packages with the library functions, by kind. English is the package itself.
+PACKAGES = {
+    "questionnaire": "veleslibrary.questionnaires",
+    "test": "veleslibrary.tests",
+}
+
+
+@dataclass(frozen=True)
+class Entry:
+    """A questionnaire or test of the library.
+
+    Attributes:
+        code (str): Name of the function, e.g. "nfcsShort".
+        lang (str): Language code, e.g. "en" or "pl".
+        kind (str): "questionnaire" or "test".
+        module (str): Module with the function.
+        title (str): Full name from the docstring, e.g. "Rosenberg Self-Esteem Scale (RSES)".
+        items (int | None): Number of items. `None` if there's no scoring spec.
+        scale_length (int | None): Number of response options of the items. `None` if there's no scoring spec.
+        citation (str | None): Citation of the original, as plain text.
+        adaptation (str | None): Citation of the adaptation, as plain text.
+        short_form (str | None): Code of the short form in the same language, e.g. "nfcsShort".
+        long_form (str | None): Code of the long form if this is a short form, e.g. "nfcs".
+    """
+
+    code: str
+    lang: str
+    kind: str
+    module: str
+    title: str
+    items: int | None = None
+    scale_length: int | None = None
+    citation: str | None = None
+    adaptation: str | None = None
+    short_form: str | None = None
+    long_form: str | None = None
+
+    @property
+    def factory(self) -> Callable:
+        """The questionnaire function, imported on first use"""
+        return getattr(importlib.import_module(self.module), self.code)
+
+    @property
+    def norms(self):
+        """The norm tables, see `veleslibrary.norms.load()`"""
+        from .norms import load
+
+        return load(self.code, self.lang)
+
+    def __call__(self, *args, **kwargs):
+        """Call the questionnaire function"""
+        return self.factory(*args, **kwargs)
+
+
+def _packages(kind: str) -> Iterator[tuple[str, object]]:
+    """Yield the language code and package of every language of a kind"""
+    package = importlib.import_module(PACKAGES[kind])
+    yield "en", package
+    for module in pkgutil.iter_modules(package.__path__):
+        if module.ispkg:
+            yield module.name, importlib.import_module(
+                f"{package.__name__}.{module.name}"
+            )
+
+
+def _sections(function: Callable) -> dict[str, str]:
+    """Split the docstring into its `## ` sections"""
+    sections = {}
+    title = None
+    for line in (function.__doc__ or "").splitlines():
+        line = line.strip()
+        if line.startswith("## "):
+            title = line[3:].rstrip(":")
+            sections[title] = []
+        elif line.startswith("Args:"):
+            title = None
+        elif title is not None and line:
+            sections[title].append(line)
+    return {title: " ".join(lines) for title, lines in sections.items()}
+
+
+def _plain(text: str | None) -> str | None:
+    """Strip the HTML of a CSL citation"""
+    if not text:
+        return None
+    text = re.sub(r"<(https?:[^>]*)>", r"\1", re.sub(r"<(?!https?:)[^>]*>", "", text))
+    text = html.unescape(text)
+    return re.sub(r"\s+", " ", text).strip() or None
+
+
+def discover() -> list[Entry]:
+    """Import every questionnaire and test and read its metadata.
+
+    Returns:
+        list[Entry]: Entries in the order of kinds, languages and `__all__`.
+    """
+    entries = []
+    for kind in PACKAGES:
+        for lang, package in _packages(kind):
+            codes = [
+                code
+                for code in getattr(package, "__all__", ())
+                if inspect.isfunction(getattr(package, code))
+            ]
+            for code in codes:
+                function = getattr(package, code)
+                sections = _sections(function)
+                spec = getattr(function, "scoring", None)
+                long_form = code.removesuffix("Short")
+                entries.append(
+                    Entry(
+                        code=code,
+                        lang=lang,
+                        kind=kind,
+                        module=function.__module__,
+                        title=next(iter(sections), code),
+                        items=spec.items if spec else None,
+                        scale_length=(
+                            spec.response_range[1] - spec.response_range[0] + 1
+                            if spec
+                            else None
+                        ),
+                        citation=_plain(sections.get("Original")),
+                        adaptation=_plain(sections.get("Adaptation")),
+                        short_form=(
+                            f"{code}Short" if f"{code}Short" in codes else None
+                        ),
+                        long_form=(
+                            long_form
+                            if long_form != code and long_form in codes
+                            else None
+                        ),
+                    )
+                )
+    return entries
+
+
+def build(path: Path | str = INDEX_PATH) -> Path:
+    """Discover all the questionnaires and save the index.
+
+    Args:
+        path (Path | str): Destination file. Defaults to the package data.
+
+    Returns:
+        Path: Path of the written file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            [asdict(entry) for entry in discover()], ensure_ascii=False, indent=2
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@lru_cache(maxsize=None)
+def _index() -> tuple[dict[tuple[str, str], Entry], dict[str | None, tuple]]:
+    """Return the entries by `(code, lang)` and by language (`None` for all)"""
+    entries = tuple(
+        Entry(**entry) for entry in json.loads(INDEX_PATH.read_text(encoding="utf-8"))
+    )
+    by_lang = {None: entries}
+    for entry in entries:
+        by_lang[entry.lang] = by_lang.get(entry.lang, ()) + (entry,)
+    return {(entry.code, entry.lang): entry for entry in entries}, by_lang
+
+
+def get(code: str, lang: str = "en") -> Entry:
+    """Look up a questionnaire or test.
+
+    Args:
+        code (str): Name of the function, e.g. "tls_15".
+        lang (str): Language code. Defaults to "en".
+
+    Returns:
+        Entry: The entry. Call it or use `Entry.factory` to get the function.
+
+    Raises:
+        KeyError: If there's no such questionnaire.
+    """
+    try:
+        return _index()[0][code, lang]
+    except KeyError:
+        raise KeyError(f"No questionnaire {code!r} in language {lang!r}") from None
+
+
+def entries(
+    lang: str | None = None, code: str | None = None, kind: str | None = None
+) -> list[Entry]:
+    """List the questionnaires and tests, optionally filtered.
+
+    Args:
+        lang (str | None): Only this language, e.g. "en".
+        code (str | None): Only this function in all its languages, e.g. "tls_15".
+        kind (str | None): Only "questionnaire" or "test".
+
+    Returns:
+        list[Entry]: Matching entries in the index order.
+    """
+    return [
+        entry
+        for entry in _index()[1].get(lang, ())
+        if (code is None or entry.code == code) and (kind is None or entry.kind == kind)
+    ]
+
+
+if __name__ == "__main__":
+    print(build())
@@ -0,0 +1,215 @@
+"""Streaming reliability statistics
+
+`ItemStatistics` keeps the number of respondents, item means and the matrix of centered
+co-moments. It's updated batch by batch with Welford-style updates (Chan et al.'s pairwise
+formula), so the data never have to be in memory at once, and states from shards or
+nodes can be merged. Cronbach's α, the covariance matrix (e.g. for ω) and corrected
+item-total correlations can be read at any time.
+
+Example:
+    ```python
+    from veleslibrary.questionnaires import nfcs
+    from veleslibrary.reliability import ReliabilityMonitor
+
+    monitor = ReliabilityMonitor(nfcs)
+    for chunk in chunks:
+        monitor.update(chunk)
+    monitor.alpha()  # {"total": 0.84, "Need for order": 0.82, ...}
+    ```
+"""
+
+from typing import Callable
+
+import numpy as np
+
+from .scoring import get_spec, reverse_key
+from .specs import ScoringSpec
+
+
+class ItemStatistics:
+    """Mergeable running means and covariances of items.
+
+    Rows with any missing (NaN) answer are skipped.
+
+    Args:
+        items (int): Number of items.
+    """
+
+    def __init__(self, items: int):
+        self.n = 0
+        self.mean = np.zeros(items)
+        self.comoment = np.zeros((items, items))
+
+    @property
+    def items(self) -> int:
+        return self.mean.shape[0]
+
+    def _combine(self, n: int, mean: np.ndarray, comoment: np.ndarray):
+        if n == 0:
+            return
+        total = self.n + n
+        delta = mean - self.mean
+        self.comoment += comoment + np.outer(delta, delta) * (self.n * n / total)
+        self.mean += delta * (n / total)
+        self.n = total
+
+    def update(self, responses: np.ndarray) -> "ItemStatistics":
+        """Add a batch of respondents.
+
+        Args:
+            responses (np.ndarray): `(n_respondents × items)` array of keyed answers.
+
+        Returns:
+            ItemStatistics: `self`, for chaining.
+        """
+        responses = np.asarray(responses, dtype=np.float64)
+        responses = responses[~np.isnan(responses).any(axis=1)]
+        if len(responses):
+            mean = responses.mean(axis=0)
+            centered = responses - mean
+            self._combine(len(responses), mean, centered.T @ centered)
+        return self
+
+    def merge(self, other: "ItemStatistics") -> "ItemStatistics":
+        """Add the respondents of another state, e.g. from another shard.
+
+        Args:
+            other (ItemStatistics): State with the same items.
+
+        Returns:
+            ItemStatistics: `self`, for chaining.
+        """
+        if other.items != self.items:
+            raise ValueError("Can't merge statistics of different items")
+        self._combine(other.n, other.mean, other.comoment)
+        return self
+
+    def state(self) -> dict:
+        """Return a JSON-serializable state, e.g. to send it to another node"""
+        return {
+            "n": self.n,
+            "mean": self.mean.tolist(),
+            "comoment": self.comoment.tolist(),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "ItemStatistics":
+        """Restore the statistics from `state()`"""
+        statistics = cls(len(state["mean"]))
+        statistics.n = state["n"]
+        statistics.mean = np.array(state["mean"], dtype=np.float64)
+        statistics.comoment = np.array(state["comoment"], dtype=np.float64)
+        return statistics
+
+    def covariance(self, items: list[int] | None = None) -> np.ndarray:
+        """Return the sample covariance matrix.
+
+        Args:
+            items (list[int] | None): Item numbers (from 1) to include. `None` means all.
+
+        Returns:
+            np.ndarray: `(k × k)` covariance matrix. NaN with less than two respondents.
+        """
+        index = self._index(items)
+        if self.n < 2:
+            return np.full((len(index), len(index)), np.nan)
+        return self.comoment[np.ix_(index, index)] / (self.n - 1)
+
+    def _index(self, items: list[int] | None) -> np.ndarray:
+        if items is None:
+            return np.arange(self.items)
+        return np.asarray(items) - 1
+
+    def alpha(self, items: list[int] | None = None) -> float:
+        """Return Cronbach's α.
+
+        Args:
+            items (list[int] | None): Item numbers (from 1) to include. `None` means all.
+
+        Returns:
+            float: α. NaN with less than two items or two respondents.
+        """
+        covariance = self.covariance(items)
+        k = covariance.shape[0]
+        if k < 2:
+            return np.nan
+        return k / (k - 1) * (1 - np.trace(covariance) / covariance.sum())
+
+    def item_total_correlations(self, items: list[int] | None = None) -> np.ndarray:
+        """Return the corrected item-total correlations.
+
+        Every item is correlated with the sum of the other items.
+
+        Args:
+            items (list[int] | None): Item numbers (from 1) to include. `None` means all.
+
+        Returns:
+            np.ndarray: Correlation of every included item.
+        """
+        covariance = self.covariance(items)
+        variance = np.diag(covariance)
+        with_total = covariance.sum(axis=1)
+        rest_covariance = with_total - variance
+        rest_variance = covariance.sum() - 2 * with_total + variance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return rest_covariance / np.sqrt(variance * rest_variance)
+
+
+class ReliabilityMonitor:
+    """Reliability of a questionnaire and its subscales on streamed data.
+
+    Reverse-keyed items are recoded before they're added, so the statistics describe
+    the items as they enter the scores. Subscale statistics are read from the
+    covariance of all the items.
+
+    Args:
+        questionnaire (ScoringSpec | Callable): A spec or a questionnaire function.
+    """
+
+    def __init__(self, questionnaire: ScoringSpec | Callable):
+        self.spec = get_spec(questionnaire)
+        self.statistics = ItemStatistics(self.spec.items)
+
+    def _groups(self) -> dict[str, list[int] | None]:
+        return ({"total": None} if self.spec.total else {}) | {
+            name: list(items) for name, items in self.spec.subscales.items()
+        }
+
+    def update(self, responses: np.ndarray) -> "ReliabilityMonitor":
+        """Add a batch of coded answers.
+
+        Args:
+            responses (np.ndarray): `(n_respondents × n_items)` array of coded answers, as for scoring.
+
+        Returns:
+            ReliabilityMonitor: `self`, for chaining.
+        """
+        self.statistics.update(reverse_key(self.spec, responses))
+        return self
+
+    def merge(self, other: "ReliabilityMonitor") -> "ReliabilityMonitor":
+        """Add the respondents of another monitor of the same questionnaire"""
+        if other.spec != self.spec:
+            raise ValueError("Can't merge monitors of different questionnaires")
+        self.statistics.merge(other.statistics)
+        return self
+
+    def alpha(self) -> dict[str, float]:
+        """Return Cronbach's α of the total score and of every subscale"""
+        return {
+            name: self.statistics.alpha(items) for name, items in self._groups().items()
+        }
+
+    def item_total_correlations(self) -> dict[str, np.ndarray]:
+        """Return the corrected item-total correlations within the total score and every subscale"""
+        return {
+            name: self.statistics.item_total_correlations(items)
+            for name, items in self._groups().items()
+        }
+
+    def covariance(self) -> dict[str, np.ndarray]:
+        """Return the covariance matrices of the total score and every subscale"""
+        return {
+            name: self.statistics.covariance(items)
+            for name, items in self._groups().items()
+        }
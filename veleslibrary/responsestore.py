@@ -0,0 +1,307 @@
+"""Compact on-disk store of coded answers
+
+Likert answers fit in one byte. A `ResponseStore` keeps the answers of a battery as
+`uint8` arrays, one `(respondents × items)` block per questionnaire and append, with
+`MISSING` (255) for missing answers. A battery of ~100 items for 10 million respondents
+takes about 1 GB instead of 8 GB of int64 or float64.
+
+A store is a directory:
+
+- `schema.json`: format version, the questionnaires with their scoring specs, and the
+  number of rows of every block,
+- `<name>/<block>.npy`: the blocks of each questionnaire, e.g. `RSES/000000.npy`.
+
+Blocks are row-major, so the answers of a respondent are contiguous. Scoring and
+reliability analysis read whole respondents chunk by chunk, which is a sequential read of
+a block, and an append writes each block once. Blocks are written before the schema,
+which is replaced atomically, so a failed append leaves the store as it was. Blocks are
+reopened memory-mapped, without copying, and the specs come from the schema, so reading
+a store doesn't import the questionnaires. Only `codes()` of a store with several blocks
+copies them into memory, use `blocks()` or `chunks()` to avoid that.
+
+Example:
+    ```python
+    from veleslibrary.questionnaires import nfcs, rses
+    from veleslibrary.responsestore import ResponseStore
+
+    store = ResponseStore.create("answers", [rses, nfcs])
+    store.append({"RSES": rses_answers, "NFCS": nfcs_answers})
+
+    store = ResponseStore("answers")
+    store.blocks("RSES")  # uint8 arrays, memory-mapped
+    store.score()  # {"RSES_total": ..., "NFCS_total": ..., ...}
+    store.reliability("NFCS").alpha()
+    ```
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+
+from .reliability import ReliabilityMonitor
+from .scoring import CHUNK_SIZE, MissingPolicy, compile_spec, get_spec, named
+from .specs import ScoringSpec
+from .validation import ResponseError, validate
+
+FORMAT = "veleslibrary.responsestore"
+VERSION = 1
+# Code of a missing answer
+MISSING = 255
+SCHEMA = "schema.json"
+
+
+def encode(spec: ScoringSpec, responses: np.ndarray) -> np.ndarray:
+    """Convert coded answers to `uint8`, with `MISSING` for NaN.
+
+    Args:
+        spec (ScoringSpec): Spec of the questionnaire.
+        responses (np.ndarray): `(n_respondents × n_items)` array of coded answers.
+
+    Returns:
+        np.ndarray: `uint8` array of the same shape.
+
+    Raises:
+        ValueError: If an answer is out of the response range or not a whole number.
+    """
+    result = validate(spec, responses)
+    invalid = result.rows & (ResponseError.OUT_OF_RANGE | ResponseError.NOT_INTEGER)
+    if invalid.any():
+        raise ValueError(
+            f"{np.count_nonzero(invalid)} rows have answers out of the range "
+            f"{spec.response_range} or not whole numbers"
+        )
+    responses = np.asarray(responses)
+    if np.issubdtype(responses.dtype, np.floating):
+        return np.where(np.isnan(responses), MISSING, responses).astype(np.uint8)
+    return responses.astype(np.uint8)
+
+
+def decode(codes: np.ndarray) -> np.ndarray:
+    """Convert `uint8` codes to float64 answers, with NaN for `MISSING`"""
+    responses = codes.astype(np.float64)
+    responses[codes == MISSING] = np.nan
+    return responses
+
+
+class ResponseStore:
+    """Coded answers of a battery stored as memory-mapped `uint8` blocks.
+
+    Args:
+        path (Path | str): Directory of an existing store, see `create()`.
+
+    Attributes:
+        specs (dict[str, ScoringSpec]): Scoring specs by the base names of the questions.
+        questionnaires (dict[str, str | None]): Import paths of the questionnaire functions by base name.
+        block_rows (list[int]): Number of rows of every block.
+
+    Raises:
+        FileNotFoundError: If there's no store in the directory.
+        ValueError: If the store has an unknown format.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        schema = json.loads((self.path / SCHEMA).read_text(encoding="utf-8"))
+        if schema.get("format") != FORMAT or schema.get("version") != VERSION:
+            raise ValueError(f"{self.path} isn't a response store of version {VERSION}")
+        self.specs = {
+            entry["name"]: ScoringSpec.from_dict(entry["spec"])
+            for entry in schema["questionnaires"]
+        }
+        self.questionnaires = {
+            entry["name"]: entry["questionnaire"] for entry in schema["questionnaires"]
+        }
+        self.block_rows = list(schema["blocks"])
+
+    @classmethod
+    def create(
+        cls,
+        path: Path | str,
+        questionnaires: dict[str, ScoringSpec | Callable] | Iterable[Callable],
+    ) -> "ResponseStore":
+        """Create an empty store.
+
+        Args:
+            path (Path | str): New or empty directory.
+            questionnaires (dict[str, ScoringSpec | Callable] | Iterable[Callable]): Questionnaire functions or a dictionary of question base names and questionnaires.
+
+        Returns:
+            ResponseStore: The store.
+
+        Raises:
+            FileExistsError: If there's already a store in the directory.
+        """
+        path = Path(path)
+        if (path / SCHEMA).exists():
+            raise FileExistsError(f"{path} already has a response store")
+        entries = []
+        for name, questionnaire in named(questionnaires):
+            spec = get_spec(questionnaire)
+            if spec.response_range[0] < 0 or spec.response_range[1] >= MISSING:
+                raise ValueError(f"Answers of {name} don't fit in uint8")
+            entries.append(
+                {
+                    "name": name,
+                    "questionnaire": (
+                        None
+                        if isinstance(questionnaire, ScoringSpec)
+                        else f"{questionnaire.__module__}.{questionnaire.__qualname__}"
+                    ),
+                    "spec": spec.to_dict(),
+                }
+            )
+        path.mkdir(parents=True, exist_ok=True)
+        _write_schema(path, entries, [])
+        return cls(path)
+
+    def __len__(self) -> int:
+        return sum(self.block_rows)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the answers in bytes"""
+        return len(self) * sum(spec.items for spec in self.specs.values())
+
+    def _block_path(self, name: str, block: int) -> Path:
+        return self.path / name / f"{block:06d}.npy"
+
+    def append(self, responses: dict[str, np.ndarray]):
+        """Add the answers of new respondents as a new block.
+
+        Args:
+            responses (dict[str, np.ndarray]): `(n_respondents × n_items)` arrays of coded answers of every questionnaire, by base name. Missing answers should be NaN.
+
+        Raises:
+            ValueError: If a questionnaire is missing or unknown, the numbers of rows differ or an answer is invalid.
+        """
+        if set(responses) != set(self.specs):
+            raise ValueError(f"Expected answers of {', '.join(self.specs)}")
+        encoded = {
+            name: encode(self.specs[name], responses[name]) for name in self.specs
+        }
+        rows = {len(codes) for codes in encoded.values()}
+        if len(rows) != 1:
+            raise ValueError("All questionnaires need the same number of rows")
+
+        block = len(self.block_rows)
+        for name, codes in encoded.items():
+            destination = self._block_path(name, block)
+            destination.parent.mkdir(exist_ok=True)
+            np.save(destination, codes)
+        schema = json.loads((self.path / SCHEMA).read_text(encoding="utf-8"))
+        block_rows = self.block_rows + [rows.pop()]
+        _write_schema(self.path, schema["questionnaires"], block_rows)
+        self.block_rows = block_rows
+
+    def blocks(self, name: str) -> list[np.ndarray]:
+        """Return the memory-mapped, read-only `uint8` blocks of a questionnaire"""
+        if name not in self.specs:
+            raise KeyError(f"No questionnaire {name!r} in the store")
+        return [
+            np.load(self._block_path(name, block), mmap_mode="r")
+            for block in range(len(self.block_rows))
+        ]
+
+    def codes(self, name: str) -> np.ndarray:
+        """Return the `uint8` answers of a questionnaire.
+
+        Args:
+            name (str): Base name of the questions, e.g. "RSES".
+
+        Returns:
+            np.ndarray: `(n_respondents × n_items)` array with `MISSING` for missing answers. Memory-mapped if the store has one block. Otherwise the blocks are concatenated into a new in-memory array of `len(store) × n_items` bytes, see `blocks()` for the memory-mapped blocks.
+        """
+        blocks = self.blocks(name)
+        if len(blocks) == 1:
+            return blocks[0]
+        if not blocks:
+            return np.empty((0, self.specs[name].items), dtype=np.uint8)
+        return np.concatenate(blocks)
+
+    def chunks(self, name: str, chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+        """Read the answers of a questionnaire as float64 chunks.
+
+        Args:
+            name (str): Base name of the questions, e.g. "RSES".
+            chunk_size (int): Maximum number of rows of a chunk.
+
+        Yields:
+            np.ndarray: `(rows × n_items)` arrays with NaN for missing answers.
+        """
+        for block in self.blocks(name):
+            for start in range(0, len(block), chunk_size):
+                yield decode(block[start : start + chunk_size])
+
+    def score(
+        self,
+        missing: MissingPolicy | dict[str, MissingPolicy] | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> dict[str, np.ndarray]:
+        """Score all the questionnaires of the store.
+
+        Args:
+            missing (MissingPolicy | dict[str, MissingPolicy] | None): Policy of all the scores or policies by score column, e.g. "SD3_Narcissism", see `veleslibrary.scoring.Scorer`.
+            chunk_size (int): Number of rows decoded and scored at once.
+
+        Returns:
+            dict[str, np.ndarray]: Scores of every respondent, keyed `<name>_<score>`.
+        """
+        scores = {}
+        for name, spec in self.specs.items():
+            scorer = compile_spec(spec)
+            policy = missing
+            if isinstance(missing, dict):
+                policy = {
+                    score: missing[f"{name}_{score}"]
+                    for score in scorer.names
+                    if f"{name}_{score}" in missing
+                }
+            columns = np.empty((len(self), len(scorer.names)))
+            row = 0
+            for chunk in self.chunks(name, chunk_size):
+                columns[row : row + len(chunk)] = scorer(chunk, missing=policy)
+                row += len(chunk)
+            for i, score in enumerate(scorer.names):
+                scores[f"{name}_{score}"] = columns[:, i]
+        return scores
+
+    def reliability(
+        self, name: str, chunk_size: int = CHUNK_SIZE
+    ) -> ReliabilityMonitor:
+        """Compute the reliability statistics of a questionnaire, chunk by chunk.
+
+        Args:
+            name (str): Base name of the questions, e.g. "NFCS".
+            chunk_size (int): Number of rows decoded at once.
+
+        Returns:
+            ReliabilityMonitor: Statistics of the complete rows.
+        """
+        monitor = ReliabilityMonitor(self.specs[name])
+        for chunk in self.chunks(name, chunk_size):
+            monitor.update(chunk)
+        return monitor
+
+
+def _write_schema(path: Path, questionnaires: list[dict], blocks: list[int]):
+    """Replace the schema atomically"""
+    temporary = path / f"{SCHEMA}.tmp"
+    temporary.write_text(
+        json.dumps(
+            {
+                "format": FORMAT,
+                "version": VERSION,
+                "missing": MISSING,
+                "questionnaires": questionnaires,
+                "blocks": blocks,
+            },
+            ensure_ascii=False,
+            indent=2,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    os.replace(temporary, path / SCHEMA)
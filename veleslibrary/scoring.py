@@ -0,0 +1,362 @@
+"""Vectorized scoring of whole response matrices
+
+A questionnaire's `ScoringSpec` is compiled once into a weight matrix (items × scores)
+and an intercept, with reverse keying folded into both. Scoring an
+`(n_respondents × n_items)` array is then a single matrix product, so a million rows are
+scored in well under a second.
+
+Scores with missing answers (NaN) are NaN by default. A `MissingPolicy` prorates them
+instead, imputes the person's mean or requires a minimum number of answered items, for
+the whole questionnaire or per score.
+
+Example:
+    ```python
+    import numpy as np
+    from veleslibrary.questionnaires import sd3
+    from veleslibrary.scoring import MissingPolicy, score
+
+    responses = np.random.default_rng().integers(1, 6, size=(1000, 27))
+    scores = score(sd3, responses)
+    scores["Narcissism"]
+    score(sd3, responses, missing=MissingPolicy("prorate", min_answered=0.8))
+    ```
+"""
+
+import inspect
+import math
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Callable, Iterable
+
+import numpy as np
+
+from .specs import ScoringSpec
+
+# Rows converted to float64 at once. Bounds the temporary memory of the matrix product.
+CHUNK_SIZE = 65536
+
+MISSING_METHODS = ("nan", "prorate", "person_mean")
+
+
+def get_spec(questionnaire: ScoringSpec | Callable) -> ScoringSpec:
+    """Return the scoring spec of a questionnaire.
+
+    Args:
+        questionnaire (ScoringSpec | Callable): A spec or a questionnaire function, e.g. `veleslibrary.questionnaires.rses`.
+
+    Returns:
+        ScoringSpec: The spec.
+    """
+    if isinstance(questionnaire, ScoringSpec):
+        return questionnaire
+    try:
+        return questionnaire.scoring
+    except AttributeError:
+        raise TypeError(f"{questionnaire!r} has no scoring spec") from None
+
+
+def reverse_key(spec: ScoringSpec, responses: np.ndarray) -> np.ndarray:
+    """Recode the reverse-keyed items as `low + high - answer`.
+
+    Args:
+        spec (ScoringSpec): Spec of the questionnaire.
+        responses (np.ndarray): `(n_respondents × n_items)` array of coded answers.
+
+    Returns:
+        np.ndarray: New float64 array with all the items keyed in the same direction.
+    """
+    keyed = np.array(responses, dtype=np.float64)
+    if spec.reverse:
+        reverse = np.asarray(spec.reverse) - 1
+        low, high = spec.response_range
+        keyed[:, reverse] = low + high - keyed[:, reverse]
+    return keyed
+
+
+def default_name(questionnaire: Callable) -> str:
+    """Return the default base name of a questionnaire function, e.g. 'RSES'"""
+    return inspect.signature(questionnaire).parameters["name"].default
+
+
+def named(
+    questionnaires: dict[str, ScoringSpec | Callable] | Iterable[Callable],
+) -> list[tuple[str, ScoringSpec | Callable]]:
+    """Pair the questionnaires of a battery with the base names of their questions.
+
+    Args:
+        questionnaires (dict[str, ScoringSpec | Callable] | Iterable[Callable]): Questionnaire functions, which use their default names, or a dictionary of names and questionnaires.
+
+    Returns:
+        list[tuple[str, ScoringSpec | Callable]]: Names and questionnaires in the battery order.
+    """
+    if isinstance(questionnaires, dict):
+        return list(questionnaires.items())
+    return [(default_name(q), q) for q in questionnaires]
+
+
+@dataclass(frozen=True)
+class MissingPolicy:
+    """How a score is computed when some of its items are missing.
+
+    Methods:
+
+    - "nan": the score is NaN if any of its items is missing,
+    - "prorate": the mean of the answered items of the score, times the number of its items for sums,
+    - "person_mean": missing items are replaced with the mean of the person's answered items of the whole questionnaire, after reverse keying.
+
+    Attributes:
+        method (str): One of `MISSING_METHODS`.
+        min_answered (int | float): Minimum number of answered items of the score, as a count (int) or a fraction of its items (float, e.g. 0.8). With fewer, the score is NaN.
+    """
+
+    method: str = "nan"
+    min_answered: int | float = 1
+
+    def __post_init__(self):
+        if self.method not in MISSING_METHODS:
+            raise ValueError(
+                f"method must be one of {MISSING_METHODS}, not {self.method!r}"
+            )
+        if self.min_answered < 0 or (
+            isinstance(self.min_answered, float) and self.min_answered > 1
+        ):
+            raise ValueError(f"Invalid min_answered {self.min_answered!r}")
+
+    def required(self, size: int) -> int:
+        """Return the minimum number of answered items of a score with `size` items"""
+        if isinstance(self.min_answered, float):
+            return math.ceil(self.min_answered * size - 1e-9)
+        return self.min_answered
+
+
+@dataclass(frozen=True, eq=False)
+class Scorer:
+    """Compiled scoring spec of a questionnaire or a battery.
+
+    `scores = (responses @ weights + intercept) / divisor`. Weights are 1 for the items of
+    a score, -1 for its reverse-keyed items and 0 otherwise, and the `low + high` offset of
+    the reverse-keyed items is part of the intercept. Sums of coded answers are therefore
+    exact, whatever the order of summation, and averages are divided only at the end.
+
+    With a `MissingPolicy`, missing answers count as 0 in the product and the number of
+    answered items of every score is another product with the item membership, so
+    prorating and imputation are a few more array operations per chunk.
+
+    Attributes:
+        names (tuple[str, ...]): Names of the score columns, see `ScoringSpec.scores`.
+        weights (np.ndarray): Read-only `(items × scores)` weight matrix.
+        intercept (np.ndarray): Read-only vector added to every row of scores.
+        divisor (np.ndarray): Read-only vector of item counts for averages and ones for sums.
+        sign (np.ndarray): Read-only vector of -1 for reverse-keyed items and 1 for the others.
+        offset (np.ndarray): Read-only vector of `low + high` for reverse-keyed items and 0 for the others.
+        blocks (np.ndarray): Read-only vector of the index of each item's questionnaire in a battery.
+    """
+
+    names: tuple[str, ...]
+    weights: np.ndarray
+    intercept: np.ndarray
+    divisor: np.ndarray
+    sign: np.ndarray
+    offset: np.ndarray
+    blocks: np.ndarray
+
+    @property
+    def items(self) -> int:
+        return self.weights.shape[0]
+
+    @cached_property
+    def _membership(self) -> tuple:
+        """Item membership, item offsets of the scores, score sizes and item blocks"""
+        membership = (self.weights != 0).astype(np.float64)
+        blocks = (self.blocks[:, None] == np.unique(self.blocks)).astype(np.float64)
+        column_blocks = (membership.T @ blocks).argmax(axis=1)
+        return (
+            membership,
+            self.offset[:, None] * membership,
+            membership.sum(axis=0),
+            (blocks, column_blocks),
+        )
+
+    def _policies(
+        self, missing: MissingPolicy | dict[str, MissingPolicy]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Method codes and minimum answered items of every score"""
+        if isinstance(missing, MissingPolicy):
+            policies = [missing] * len(self.names)
+        else:
+            unknown = set(missing) - set(self.names)
+            if unknown:
+                raise ValueError(f"Unknown scores: {', '.join(sorted(unknown))}")
+            policies = [missing.get(name, MissingPolicy()) for name in self.names]
+        sizes = self._membership[2]
+        return (
+            np.array([MISSING_METHODS.index(policy.method) for policy in policies]),
+            np.array(
+                [policy.required(size) for policy, size in zip(policies, sizes)],
+                dtype=np.float64,
+            ),
+        )
+
+    def _score_missing(
+        self, chunk: np.ndarray, methods: np.ndarray, required: np.ndarray
+    ) -> np.ndarray:
+        membership, offsets, size, (blocks, column_blocks) = self._membership
+        answered = ~np.isnan(chunk)
+        filled = np.where(answered, chunk, 0)
+        answered = answered.astype(np.float64)
+        sums = filled @ self.weights + answered @ offsets
+        counts = answered @ membership
+        scores = np.where(counts == size, sums, np.nan)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if (methods == 1).any():
+                scores = np.where(methods == 1, sums * size / counts, scores)
+            if (methods == 2).any():
+                keyed = filled * self.sign + answered * self.offset
+                means = (keyed @ blocks) / (answered @ blocks)
+                imputed = sums + (size - counts) * means[:, column_blocks]
+                scores = np.where(methods == 2, imputed, scores)
+        scores[counts < required] = np.nan
+        return scores / self.divisor
+
+    def __call__(
+        self,
+        responses: np.ndarray,
+        chunk_size: int = CHUNK_SIZE,
+        missing: MissingPolicy | dict[str, MissingPolicy] | None = None,
+    ) -> np.ndarray:
+        """Score a response matrix.
+
+        Args:
+            responses (np.ndarray): `(n_respondents × n_items)` array of coded answers. Missing answers should be NaN.
+            chunk_size (int): Number of rows converted to float at once.
+            missing (MissingPolicy | dict[str, MissingPolicy] | None): Policy of all the scores or policies by score name (the others are "nan"). `None` means scores with missing answers are NaN.
+
+        Returns:
+            np.ndarray: `(n_respondents × n_scores)` float64 array. Columns are in the order of `names`.
+        """
+        responses = np.asarray(responses)
+        if responses.ndim != 2 or responses.shape[1] != self.items:
+            raise ValueError(
+                f"Expected an array of shape (n, {self.items}), got {responses.shape}"
+            )
+        scores = np.empty((responses.shape[0], len(self.names)))
+        if missing is not None:
+            methods, required = self._policies(missing)
+            for start in range(0, responses.shape[0], chunk_size):
+                chunk = responses[start : start + chunk_size]
+                scores[start : start + chunk_size] = self._score_missing(
+                    chunk.astype(np.float64, copy=False), methods, required
+                )
+            return scores
+
+        for start in range(0, responses.shape[0], chunk_size):
+            chunk = responses[start : start + chunk_size]
+            np.matmul(
+                chunk.astype(np.float64, copy=False),
+                self.weights,
+                out=scores[start : start + chunk_size],
+            )
+        scores += self.intercept
+        scores /= self.divisor
+        return scores
+
+
+def read_only(*arrays: np.ndarray):
+    """Make arrays read-only, e.g. ones shared by cached scorers or tables"""
+    for array in arrays:
+        array.flags.writeable = False
+
+
+@lru_cache(maxsize=None)
+def compile_spec(spec: ScoringSpec) -> Scorer:
+    """Compile a scoring spec into a weight matrix. The result is cached.
+
+    Args:
+        spec (ScoringSpec): The spec to compile.
+
+    Returns:
+        Scorer: The compiled spec.
+    """
+    low, high = spec.response_range
+    groups = ([range(1, spec.items + 1)] if spec.total else []) + list(
+        spec.subscales.values()
+    )
+
+    membership = np.zeros((spec.items, len(groups)))
+    for column, items in enumerate(groups):
+        membership[np.asarray(items) - 1, column] = 1
+    if spec.aggregation == "mean":
+        divisor = membership.sum(axis=0)
+    else:
+        divisor = np.ones(len(groups))
+
+    sign = np.ones(spec.items)
+    sign[np.asarray(spec.reverse, dtype=int) - 1] = -1
+    offset = np.where(sign < 0, float(low + high), 0.0)
+
+    weights = sign[:, None] * membership
+    intercept = offset @ membership
+    blocks = np.zeros(spec.items, dtype=np.int64)
+    read_only(weights, intercept, divisor, sign, offset, blocks)
+    return Scorer(tuple(spec.scores), weights, intercept, divisor, sign, offset, blocks)
+
+
+def compile_battery(
+    questionnaires: dict[str, ScoringSpec | Callable] | Iterable[Callable],
+) -> Scorer:
+    """Compile several questionnaires given one after another into a single scorer.
+
+    The response matrix has the items of all the questionnaires side by side, in the battery
+    order. The weight matrix is block-diagonal, so the whole battery is one matrix product.
+
+    Args:
+        questionnaires (dict[str, ScoringSpec | Callable] | Iterable[Callable]): See `named()`.
+
+    Returns:
+        Scorer: Scorer with columns named `<name>_<score>`, e.g. `SD3_Narcissism`.
+    """
+    scorers = [(name, compile_spec(get_spec(q))) for name, q in named(questionnaires)]
+    weights = np.zeros(
+        (
+            sum(scorer.items for _, scorer in scorers),
+            sum(len(scorer.names) for _, scorer in scorers),
+        )
+    )
+    row = column = 0
+    for _, scorer in scorers:
+        rows, columns = scorer.weights.shape
+        weights[row : row + rows, column : column + columns] = scorer.weights
+        row += rows
+        column += columns
+    intercept = np.concatenate([scorer.intercept for _, scorer in scorers])
+    divisor = np.concatenate([scorer.divisor for _, scorer in scorers])
+    sign = np.concatenate([scorer.sign for _, scorer in scorers])
+    offset = np.concatenate([scorer.offset for _, scorer in scorers])
+    blocks = np.concatenate(
+        [np.full(scorer.items, block) for block, (_, scorer) in enumerate(scorers)]
+    )
+    read_only(weights, intercept, divisor, sign, offset, blocks)
+    names = tuple(
+        f"{name}_{score}" for name, scorer in scorers for score in scorer.names
+    )
+    return Scorer(names, weights, intercept, divisor, sign, offset, blocks)
+
+
+def score(
+    questionnaire: ScoringSpec | Callable,
+    responses: np.ndarray,
+    missing: MissingPolicy | dict[str, MissingPolicy] | None = None,
+) -> dict[str, np.ndarray]:
+    """Score all respondents of a questionnaire at once.
+
+    Args:
+        questionnaire (ScoringSpec | Callable): A spec or a questionnaire function, e.g. `veleslibrary.questionnaires.rses`.
+        responses (np.ndarray): `(n_respondents × n_items)` array of coded answers, e.g. 1–4 for RSES.
+        missing (MissingPolicy | dict[str, MissingPolicy] | None): Policy of all the scores or policies by score name, see `Scorer`.
+
+    Returns:
+        dict[str, np.ndarray]: Scores of every respondent, keyed by 'total' and the subscale names.
+    """
+    scorer = compile_spec(get_spec(questionnaire))
+    scores = scorer(responses, missing=missing)
+    return {name: scores[:, column] for column, name in enumerate(scorer.names)}
@@ -0,0 +1,362 @@
+"""Local HTTP service of questionnaire JSON
+
+A small asyncio server, on the standard library only, that serves the SurveyJS JSON of
+the library questionnaires at `/q/{lang}/{code}`, e.g. `/q/pl/rses`. It's meant as a
+local stand-in for a survey backend, e.g. in load tests. Query parameters:
+
+- `name`: Base name of the questions,
+- `instruction`: Instruction shown above the questionnaire,
+- `options`: JSON object with the other keyword arguments of the questionnaire function,
+  e.g. `{"questionOptions": {"isRequired": true}}`.
+
+Responses are `Artifact`s (see `veleslibrary.artifacts`): canonical JSON with an ETag,
+gzip-compressed if the client accepts it. The compressed body has its own ETag and every
+response has `Vary: Accept-Encoding`. Conditional requests with `If-None-Match` get
+`304 Not Modified`. Cached artifacts are served directly from the event loop. Missing ones
+are built in an executor, as are the first imports of the questionnaire modules, so
+velesresearch and pydantic don't block the other connections. Concurrent requests for the
+same missing artifact wait for one build.
+
+Example:
+    ```bash
+    python -m veleslibrary.server --port 8000
+    curl --compressed "localhost:8000/q/pl/rses?name=RSES_pre"
+    ```
+"""
+
+import argparse
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import sys
+from concurrent.futures import Executor, ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from . import registry
+from .artifacts import Artifact, ArtifactCache
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the next request on a kept-alive connection
+KEEP_ALIVE = 5
+# Keyword arguments that can't be set in `options`
+_RESERVED = frozenset({"name", "instruction", "lang"})
+
+
+class HTTPError(Exception):
+    """Error returned to the client as a JSON response.
+
+    Args:
+        status (HTTPStatus): Status of the response.
+        message (str | None): Description of the error. `None` means the status phrase.
+    """
+
+    def __init__(self, status: HTTPStatus, message: str | None = None):
+        super().__init__(message or status.phrase)
+        self.status = status
+
+
+def parse_query(factory, query: str) -> dict:
+    """Turn a query string into keyword arguments of a questionnaire function.
+
+    Args:
+        factory (Callable): Questionnaire function.
+        query (str): Query string without the `?`.
+
+    Returns:
+        dict: Keyword arguments.
+
+    Raises:
+        HTTPError: If a parameter or option is unknown or `options` isn't a JSON object.
+    """
+    params = parse_qs(query, keep_blank_values=True)
+    parameters = inspect.signature(factory).parameters
+    kwargs = {}
+    for field in ("name", "instruction"):
+        if field in params and field in parameters:
+            kwargs[field] = params.pop(field)[-1]
+    if "options" in params:
+        try:
+            options = json.loads(params.pop("options")[-1])
+        except json.JSONDecodeError:
+            options = None
+        if not isinstance(options, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "options must be a JSON object")
+        unknown = sorted(set(options) - (set(parameters) - _RESERVED))
+        if unknown:
+            raise HTTPError(
+                HTTPStatus.BAD_REQUEST, f"Unknown options: {', '.join(unknown)}"
+            )
+        kwargs.update(options)
+    if params:
+        raise HTTPError(
+            HTTPStatus.BAD_REQUEST,
+            f"Unknown query parameters: {', '.join(sorted(params))}",
+        )
+    return kwargs
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Whether an `Accept-Encoding` header allows a gzip-compressed response"""
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            q = params.strip().lower().removeprefix("q=")
+            try:
+                return not params or float(q) > 0
+            except ValueError:
+                return False
+    return False
+
+
+def _response(
+    status: HTTPStatus, headers: dict, body: bytes = b"", head: bool = False
+) -> bytes:
+    """Serialize an HTTP/1.1 response"""
+    if status != HTTPStatus.NOT_MODIFIED:
+        headers["Content-Length"] = str(len(body))
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (b"" if head else body)
+
+
+class QuestionnaireServer:
+    """Asyncio HTTP server of questionnaire JSON.
+
+    Args:
+        host (str): Address to listen on.
+        port (int): Port to listen on. 0 picks a free one, see `port` after `start()`.
+        cache (ArtifactCache | None): Cache of the artifacts. `None` means a new cache of 1024 artifacts.
+        executor (Executor | None): Executor building missing artifacts. `None` means a thread pool owned by the server.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        cache: ArtifactCache | None = None,
+        executor: Executor | None = None,
+    ):
+        self.host = host
+        self.port = port
+        self.cache = ArtifactCache(1024) if cache is None else cache
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._pending: dict[tuple, asyncio.Future] = {}
+        self._server = None
+
+    async def start(self) -> "QuestionnaireServer":
+        """Start listening"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(thread_name_prefix="veleslibrary")
+        self._server = await asyncio.start_server(
+            self._connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        """Start listening if needed and serve until cancelled"""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Stop listening and shut down the owned executor"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def __aenter__(self) -> "QuestionnaireServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def artifact(self, lang: str, code: str, query: str = "") -> Artifact:
+        """Return the artifact of a questionnaire, building it in the executor if needed.
+
+        Args:
+            lang (str): Language code, e.g. "pl".
+            code (str): Code of the questionnaire, e.g. "rses".
+            query (str): Query string, see `parse_query()`.
+
+        Returns:
+            Artifact: Artifact of the page.
+
+        Raises:
+            HTTPError: If there's no such questionnaire or the query is invalid.
+        """
+        try:
+            entry = registry.get(code, lang)
+        except KeyError:
+            raise HTTPError(
+                HTTPStatus.NOT_FOUND, f"No questionnaire {code!r} in {lang!r}"
+            ) from None
+        if entry.module in sys.modules:
+            factory = entry.factory
+        else:
+            # The first request imports the module (and velesresearch) off the event loop
+            factory = await asyncio.get_running_loop().run_in_executor(
+                self._executor, getattr, entry, "factory"
+            )
+        kwargs = parse_query(factory, query)
+        key = self.cache.key(factory, **kwargs)
+        if key is not None:
+            found = self.cache.lookup(key)
+            if found is not None:
+                return found
+
+        build = self._pending.get(key) if key is not None else None
+        if build is None:
+            build = asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(self.cache.get, factory, **kwargs)
+            )
+            if key is not None:
+                self._pending[key] = build
+                build.add_done_callback(lambda _: self._pending.pop(key, None))
+        try:
+            return await asyncio.shield(build)
+        except (TypeError, ValueError) as error:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid options: {error}")
+
+    async def _connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE
+                    )
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(
+                        _response(
+                            HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                            {"Connection": "close"},
+                        )
+                    )
+                    await writer.drain()
+                    break
+                if not await self._request(head, reader, writer):
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _request(
+        self, head: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """Answer one request and return whether to keep the connection open"""
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            writer.write(_response(HTTPStatus.BAD_REQUEST, {"Connection": "close"}))
+            await writer.drain()
+            return False
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = (
+            connection != "close"
+            if version == "HTTP/1.1"
+            else connection == "keep-alive"
+        )
+        response = {} if keep_alive else {"Connection": "close"}
+        head_only = method == "HEAD"
+
+        try:
+            length = int(headers.get("content-length") or 0)
+            if length:
+                await reader.readexactly(length)
+        except (ValueError, asyncio.IncompleteReadError):
+            writer.write(_response(HTTPStatus.BAD_REQUEST, {"Connection": "close"}))
+            await writer.drain()
+            return False
+
+        try:
+            if method not in ("GET", "HEAD"):
+                response["Allow"] = "GET, HEAD"
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            url = urlsplit(target)
+            parts = url.path.split("/")
+            if len(parts) != 4 or parts[1] != "q":
+                raise HTTPError(HTTPStatus.NOT_FOUND, "Use /q/{lang}/{code}")
+            found = await self.artifact(unquote(parts[2]), unquote(parts[3]), url.query)
+        except HTTPError as error:
+            body = json.dumps({"error": str(error)}).encode("utf-8")
+            response["Content-Type"] = "application/json; charset=utf-8"
+            writer.write(_response(error.status, response, body, head_only))
+        except Exception:
+            logger.exception("Error while answering %s %s", method, target)
+            writer.write(
+                _response(HTTPStatus.INTERNAL_SERVER_ERROR, {"Connection": "close"})
+            )
+            await writer.drain()
+            return False
+        else:
+            compressed = accepts_gzip(headers.get("accept-encoding"))
+            response["ETag"] = found.gzip_etag if compressed else found.etag
+            response["Cache-Control"] = "no-cache"
+            response["Vary"] = "Accept-Encoding"
+            if found.matches(headers.get("if-none-match"), compressed):
+                writer.write(_response(HTTPStatus.NOT_MODIFIED, response))
+            else:
+                response["Content-Type"] = found.content_type
+                body = found.body
+                if compressed:
+                    response["Content-Encoding"] = "gzip"
+                    body = found.gzip
+                writer.write(_response(HTTPStatus.OK, response, body, head_only))
+        await writer.drain()
+        return keep_alive
+
+
+def main(argv: list[str] | None = None):
+    """Run the server from the command line"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="threads building missing artifacts"
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=1024, help="maximum number of artifacts"
+    )
+    args = parser.parse_args(argv)
+
+    server = QuestionnaireServer(
+        args.host,
+        args.port,
+        ArtifactCache(args.cache_size),
+        ThreadPoolExecutor(args.workers, thread_name_prefix="veleslibrary"),
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
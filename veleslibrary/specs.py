@@ -0,0 +1,143 @@
+"""Machine-readable scoring specifications of the questionnaires
+
+Every questionnaire function is decorated with `@scoring(...)`, which attaches a `ScoringSpec`
+as its `scoring` attribute. The spec repeats the "Score calculation", "Reverse items" and
+"Subscales" sections of the docstring in a form that the scoring tools can use.
+
+Example:
+    ```python
+    from veleslibrary.questionnaires import rses
+
+    rses.scoring.reverse  # (3, 5, 8, 9, 10)
+    ```
+"""
+
+from dataclasses import asdict, dataclass, field
+from typing import Callable
+
+AGGREGATIONS = ("sum", "mean")
+
+
+@dataclass(frozen=True)
+class ScoringSpec:
+    """Scoring rules of a questionnaire.
+
+    Item numbers start from 1, as in the docstrings and in the question names (e.g. `RSES_1`).
+
+    Attributes:
+        items (int): Number of items.
+        response_range (tuple[int, int]): Lowest and highest possible answer, e.g. `(1, 4)`. Answers are coded by the values of the choices, see `choice_values`.
+        reverse (tuple[int, ...]): Reverse-keyed items.
+        subscales (dict[str, tuple[int, ...]]): Items belonging to each subscale.
+        aggregation (str): How the items are aggregated. Can be 'sum' or 'mean'.
+        total (bool): Whether the score of the whole questionnaire is interpretable.
+        descending (bool): Whether the choices are listed from the highest value, e.g. "Strongly Agree" first in RSES.
+    """
+
+    items: int
+    response_range: tuple[int, int]
+    reverse: tuple[int, ...] = ()
+    subscales: dict[str, tuple[int, ...]] = field(default_factory=dict)
+    aggregation: str = "sum"
+    total: bool = True
+    descending: bool = False
+
+    def __post_init__(self):
+        if self.aggregation not in AGGREGATIONS:
+            raise ValueError(
+                f"aggregation must be one of {AGGREGATIONS}, not {self.aggregation!r}"
+            )
+        low, high = self.response_range
+        if low >= high:
+            raise ValueError(f"Invalid response range {self.response_range}")
+        for item in (*self.reverse, *sum(self.subscales.values(), ())):
+            if not 1 <= item <= self.items:
+                raise ValueError(f"Item {item} is out of range 1–{self.items}")
+
+    def __hash__(self):
+        return hash(
+            (
+                self.items,
+                self.response_range,
+                self.reverse,
+                tuple(self.subscales.items()),
+                self.aggregation,
+                self.total,
+                self.descending,
+            )
+        )
+
+    @property
+    def scores(self) -> list[str]:
+        """Names of the scores: 'total' (if interpretable) and the subscales"""
+        return (["total"] if self.total else []) + list(self.subscales)
+
+    @property
+    def choice_values(self) -> tuple[int, ...]:
+        """Values of the choices in the order they're listed in the questionnaire"""
+        low, high = self.response_range
+        values = tuple(range(low, high + 1))
+        return values[::-1] if self.descending else values
+
+    def to_dict(self) -> dict:
+        """Return the spec as a JSON-serializable dictionary"""
+        spec = asdict(self)
+        spec["response_range"] = list(self.response_range)
+        spec["reverse"] = list(self.reverse)
+        spec["subscales"] = {
+            name: list(items) for name, items in self.subscales.items()
+        }
+        return spec
+
+    @classmethod
+    def from_dict(cls, spec: dict) -> "ScoringSpec":
+        """Build a spec from the dictionary returned by `to_dict()`"""
+        return cls(
+            spec["items"],
+            tuple(spec["response_range"]),
+            tuple(spec["reverse"]),
+            {name: tuple(items) for name, items in spec["subscales"].items()},
+            spec["aggregation"],
+            spec["total"],
+            spec.get("descending", False),
+        )
+
+
+def scoring(
+    items: int,
+    response_range: tuple[int, int],
+    reverse: tuple[int, ...] = (),
+    subscales: dict[str, tuple[int, ...]] | None = None,
+    aggregation: str = "sum",
+    total: bool = True,
+    descending: bool = False,
+) -> Callable:
+    """Attach a `ScoringSpec` to a questionnaire function as its `scoring` attribute.
+
+    Args:
+        items (int): Number of items.
+        response_range (tuple[int, int]): Lowest and highest possible answer.
+        reverse (tuple[int, ...]): Reverse-keyed items. Defaults to none.
+        subscales (dict[str, tuple[int, ...]] | None): Items belonging to each subscale. Defaults to None.
+        aggregation (str): Can be 'sum' or 'mean'. Defaults to 'sum'.
+        total (bool): Whether the score of the whole questionnaire is interpretable. Defaults to True.
+        descending (bool): Whether the choices are listed from the highest value. Defaults to False.
+
+    Returns:
+        Callable: Decorator returning the same function.
+    """
+    spec = ScoringSpec(
+        items,
+        tuple(response_range),
+        tuple(reverse),
+        {name: tuple(members) for name, members in (subscales or {}).items()},
+        aggregation,
+        total,
+        descending,
+    )
+
+    def decorator(function: Callable) -> Callable:
+        function.scoring = spec
+        return function
+
+    return decorator
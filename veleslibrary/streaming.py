@@ -0,0 +1,523 @@
+"""Streaming scoring of SurveyJS result exports
+
+Exports can be much bigger than memory, so the rows are read lazily, scored in chunks of
+`chunk_size` rows with the vectorized scoring and written out right away. Peak memory
+depends on `chunk_size`, not on the size of the file.
+
+Columns are matched to items by the question names, e.g. `RSES_1`…`RSES_10`. Matrix
+questions (NFCS) may also be nested, as in SurveyJS JSON results (`{"NFCS": {"NFCS_1": {"NFCS": 5}}}`).
+Answers can be numbers or the texts of the choices, which are coded by their values (see
+`ScoringSpec.choice_values`).
+
+Exports that only grow can be scored with `update_file()`, which keeps a checkpoint and
+scores only the rows appended since the last run.
+
+Example:
+    ```python
+    from veleslibrary.questionnaires import nfcs, rses
+    from veleslibrary.streaming import score_file
+
+    stats = score_file("results.jsonl", "scores.csv", [rses, nfcs], keep=["id"])
+    print(f"{stats.rows_per_second:.0f} rows/s")
+    ```
+"""
+
+import csv
+import hashlib
+import itertools
+import json
+import math
+import numbers
+import os
+import time
+from dataclasses import asdict, dataclass
+from importlib import metadata
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+
+from .compiled import load_json
+from .scoring import MissingPolicy, compile_spec, default_name, get_spec, named
+from .specs import ScoringSpec
+
+CHUNK_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class StreamStats:
+    """Summary of a streaming run.
+
+    Attributes:
+        rows (int): Number of scored rows.
+        seconds (float): Wall time of the run.
+    """
+
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else math.inf
+
+
+def _choice_codes(questionnaire: Callable) -> dict[str, int]:
+    """Code the choice texts of a library questionnaire by their values"""
+    parts = questionnaire.__module__.split(".")
+    if parts[:2] != ["veleslibrary", "questionnaires"]:
+        return {}
+    lang = parts[2] if len(parts) == 4 else "en"
+    try:
+        page = load_json(questionnaire.__name__, lang)
+    except KeyError:
+        return {}
+    for element in page["elements"]:
+        if "choices" in element:
+            return dict(zip(element["choices"], questionnaire.scoring.choice_values))
+    return {}
+
+
+class QuestionnaireColumns:
+    """Maps the columns of an export to the items of one questionnaire.
+
+    Args:
+        questionnaire (ScoringSpec | Callable): A spec or a questionnaire function.
+        name (str | None): Base name of the questions in the export. `None` means the default name of the questionnaire function.
+        missing (MissingPolicy | dict[str, MissingPolicy] | None): Policy of all the scores or policies by score column (e.g. "SD3_Narcissism"), see `veleslibrary.scoring.Scorer`. Columns of other questionnaires are ignored.
+    """
+
+    def __init__(
+        self,
+        questionnaire: ScoringSpec | Callable,
+        name: str | None = None,
+        missing: MissingPolicy | dict[str, MissingPolicy] | None = None,
+    ):
+        self.spec = get_spec(questionnaire)
+        if name is None:
+            if isinstance(questionnaire, ScoringSpec):
+                raise ValueError("A name is required for a bare ScoringSpec")
+            name = default_name(questionnaire)
+        self.name = name
+        self.columns = [f"{name}_{item}" for item in range(1, self.spec.items + 1)]
+        self.scorer = compile_spec(self.spec)
+        self.score_columns = [f"{name}_{score}" for score in self.scorer.names]
+        if isinstance(missing, dict):
+            missing = {
+                score: missing[column]
+                for score, column in zip(self.scorer.names, self.score_columns)
+                if column in missing
+            }
+        self.missing = missing
+        self.codes = (
+            {}
+            if isinstance(questionnaire, ScoringSpec)
+            else _choice_codes(questionnaire)
+        )
+
+    def _values(self, row: dict) -> list:
+        values = [row.get(column) for column in self.columns]
+        # Matrix answers nested as {name: {row: {column: value}}}
+        nested = row.get(self.name)
+        if isinstance(nested, dict):
+            for i, column in enumerate(self.columns):
+                cell = nested.get(column)
+                if values[i] is None and isinstance(cell, dict):
+                    values[i] = next(iter(cell.values()), None)
+        return values
+
+    def _code(self, value) -> float:
+        if value is None or value == "":
+            return math.nan
+        if isinstance(value, str):
+            if value in self.codes:
+                return self.codes[value]
+            try:
+                return float(value)
+            except ValueError:
+                return math.nan
+        if isinstance(value, numbers.Real):
+            return float(value)
+        # Objects and lists, e.g. a malformed cell
+        return math.nan
+
+    def responses(self, rows: list[dict]) -> np.ndarray:
+        """Extract the coded answers of the questionnaire.
+
+        Args:
+            rows (list[dict]): Rows of the export.
+
+        Returns:
+            np.ndarray: `(len(rows) × items)` float array. Missing and unreadable answers are NaN.
+        """
+        values = [self._values(row) for row in rows]
+        try:
+            # Numbers, numeric strings and None convert in one go
+            responses = np.array(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            responses = None
+        if responses is None or responses.ndim != 2:
+            responses = np.array(
+                [[self._code(value) for value in row] for row in values],
+                dtype=np.float64,
+            )
+        return responses.reshape(len(rows), self.spec.items)
+
+    def score(self, rows: list[dict]) -> np.ndarray:
+        """Score the rows. Columns are in the order of `score_columns`."""
+        return self.scorer(self.responses(rows), missing=self.missing)
+
+
+def read_rows(path: Path | str) -> Iterator[dict]:
+    """Lazily read the rows of a `.csv` or `.jsonl` export.
+
+    Args:
+        path (Path | str): Path to the file.
+
+    Yields:
+        dict: One row at a time.
+    """
+    path = Path(path)
+    with open(path, encoding="utf-8", newline="") as file:
+        if path.suffix == ".csv":
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def chunked(rows: Iterable[dict], size: int = CHUNK_SIZE) -> Iterator[list[dict]]:
+    """Group the rows into lists of at most `size` rows"""
+    rows = iter(rows)
+    while chunk := list(itertools.islice(rows, size)):
+        yield chunk
+
+
+def questionnaire_columns(
+    questionnaires: dict[str, ScoringSpec | Callable] | Iterable[Callable],
+    missing: MissingPolicy | dict[str, MissingPolicy] | None = None,
+) -> list[QuestionnaireColumns]:
+    """Prepare the column extraction and scoring of a battery.
+
+    Args:
+        questionnaires (dict[str, ScoringSpec | Callable] | Iterable[Callable]): Questionnaire functions or a dictionary of question base names and questionnaires. A list of `QuestionnaireColumns` is returned as it is.
+        missing (MissingPolicy | dict[str, MissingPolicy] | None): See `score_rows()`.
+
+    Returns:
+        list[QuestionnaireColumns]: Questionnaires in the battery order.
+
+    Raises:
+        ValueError: If `missing` has unknown score columns.
+    """
+    if isinstance(questionnaires, list) and all(
+        isinstance(q, QuestionnaireColumns) for q in questionnaires
+    ):
+        return questionnaires
+    columns = [
+        QuestionnaireColumns(q, name, missing) for name, q in named(questionnaires)
+    ]
+    if isinstance(missing, dict):
+        unknown = set(missing).difference(*(q.score_columns for q in columns))
+        if unknown:
+            raise ValueError(f"Unknown score columns: {', '.join(sorted(unknown))}")
+    return columns
+
+
+def score_rows(
+    rows: Iterable[dict],
+    questionnaires: dict[str, ScoringSpec | Callable] | Iterable[Callable],
+    keep: Iterable[str] = (),
+    chunk_size: int = CHUNK_SIZE,
+    missing: MissingPolicy | dict[str, MissingPolicy] | None = None,
+) -> Iterator[list[dict]]:
+    """Score rows chunk by chunk.
+
+    Args:
+        rows (Iterable[dict]): Rows of the export, e.g. from `read_rows()`.
+        questionnaires (dict[str, ScoringSpec | Callable] | Iterable[Callable]): Questionnaire functions or a dictionary of question base names and questionnaires.
+        keep (Iterable[str]): Columns copied to the output as they are, e.g. participant ID.
+        chunk_size (int): Number of rows scored at once.
+        missing (MissingPolicy | dict[str, MissingPolicy] | None): Policy of all the scores or policies by score column, e.g. "SD3_Narcissism". `None` means scores with missing answers are NaN.
+
+    Yields:
+        list[dict]: Scored rows of each chunk. Score columns are named `<name>_<score>`, e.g. `SD3_Narcissism`.
+    """
+    questionnaires = questionnaire_columns(questionnaires, missing)
+    keep = list(keep)
+    for chunk in chunked(rows, chunk_size):
+        columns = {column: [row.get(column) for row in chunk] for column in keep}
+        for questionnaire in questionnaires:
+            scores = questionnaire.score(chunk)
+            for i, column in enumerate(questionnaire.score_columns):
+                columns[column] = scores[:, i].tolist()
+        yield [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+def _without_nan(row: dict, missing) -> dict:
+    return {
+        key: missing if isinstance(value, float) and math.isnan(value) else value
+        for key, value in row.items()
+    }
+
+
+class RowWriter:
+    """Writer of scored rows to a `.csv` (NaN as empty cells) or `.jsonl` (NaN as null) file.
+
+    Args:
+        file: Open text file.
+        suffix (str): ".csv" or ".jsonl".
+        fieldnames (list[str]): Columns of a `.csv` file.
+        header (bool): Whether to write the header of a `.csv` file.
+    """
+
+    def __init__(self, file, suffix: str, fieldnames: list[str], header: bool = True):
+        self.file = file
+        self.csv = None
+        if suffix == ".csv":
+            self.csv = csv.DictWriter(file, fieldnames)
+            if header:
+                self.csv.writeheader()
+
+    def write(self, rows: list[dict]):
+        if self.csv is not None:
+            self.csv.writerows(_without_nan(row, "") for row in rows)
+        else:
+            self.file.writelines(
+                json.dumps(_without_nan(row, None), ensure_ascii=False) + "\n"
+                for row in rows
+            )
+
+
+def score_file(
+    source: Path | str,
+    destination: Path | str,
+    questionnaires: dict[str, ScoringSpec | Callable] | Iterable[Callable],
+    keep: Iterable[str] = (),
+    chunk_size: int = CHUNK_SIZE,
+    missing: MissingPolicy | dict[str, MissingPolicy] | None = None,
+) -> StreamStats:
+    """Score an export file and write the scores incrementally.
+
+    Args:
+        source (Path | str): `.csv` or `.jsonl` export.
+        destination (Path | str): Output `.csv` or `.jsonl` file.
+        questionnaires (dict[str, ScoringSpec | Callable] | Iterable[Callable]): Questionnaire functions or a dictionary of question base names and questionnaires.
+        keep (Iterable[str]): Columns copied to the output as they are, e.g. participant ID.
+        chunk_size (int): Number of rows held in memory and scored at once.
+        missing (MissingPolicy | dict[str, MissingPolicy] | None): See `score_rows()`.
+
+    Returns:
+        StreamStats: Number of rows and throughput.
+    """
+    start = time.perf_counter()
+    keep = list(keep)
+    questionnaires = questionnaire_columns(questionnaires, missing)
+    fieldnames = keep + [c for q in questionnaires for c in q.score_columns]
+    destination = Path(destination)
+    rows = 0
+    with open(destination, "w", encoding="utf-8", newline="") as file:
+        writer = RowWriter(file, destination.suffix, fieldnames)
+        for scored in score_rows(read_rows(source), questionnaires, keep, chunk_size):
+            writer.write(scored)
+            rows += len(scored)
+    return StreamStats(rows, time.perf_counter() - start)
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Progress of `update_file()`.
+
+    Attributes:
+        offset (int): Byte offset in the export after the last scored row.
+        rows (int): Number of scored rows.
+        output (int): Size of the output in bytes after the last written row.
+        fingerprint (str): Hash of the scoring setup and library version, see `fingerprint()`.
+    """
+
+    offset: int
+    rows: int
+    output: int
+    fingerprint: str
+
+    @classmethod
+    def load(cls, path: Path | str) -> "Checkpoint | None":
+        """Read a checkpoint. `None` if there's none."""
+        try:
+            return cls(**json.loads(Path(path).read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return None
+
+    def save(self, path: Path | str):
+        """Replace the checkpoint atomically"""
+        path = Path(path)
+        temporary = path.with_name(f"{path.name}.tmp")
+        temporary.write_text(json.dumps(asdict(self)) + "\n", encoding="utf-8")
+        os.replace(temporary, path)
+
+
+def _version() -> str:
+    try:
+        return metadata.version("veleslibrary")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def fingerprint(questionnaires: list[QuestionnaireColumns], keep: list[str]) -> str:
+    """Hash everything that affects the scores of a row.
+
+    The hash covers the scoring specs, the choice codes, the missing-data policies, the
+    output columns and the library version, so a change to any of them means the old
+    scores are stale.
+
+    Args:
+        questionnaires (list[QuestionnaireColumns]): Questionnaires, e.g. from `questionnaire_columns()`.
+        keep (list[str]): Columns copied to the output.
+
+    Returns:
+        str: SHA-256 hex digest.
+    """
+    setup = {
+        "version": _version(),
+        "keep": keep,
+        "questionnaires": [
+            {
+                "name": q.name,
+                "spec": q.spec.to_dict(),
+                "codes": q.codes,
+                "missing": repr(q.missing),
+            }
+            for q in questionnaires
+        ],
+    }
+    return hashlib.sha256(
+        json.dumps(setup, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def _complete_lines(file, offset: int) -> Iterator[tuple[str, int]]:
+    """Yield the lines after `offset` ending with a newline and the offset after each"""
+    file.seek(offset)
+    while (line := file.readline()).endswith(b"\n"):
+        offset += len(line)
+        yield line.decode("utf-8"), offset
+
+
+def _complete_records(file, offset: int) -> Iterator[tuple[str, int]]:
+    """Yield the complete CSV records after `offset` and the offset after each"""
+    record = ""
+    for line, end in _complete_lines(file, offset):
+        record += line
+        # Escaped quotes are doubled, so an odd count means a quoted field is still open
+        if record.count('"') % 2 == 0:
+            yield record, end
+            record = ""
+
+
+def read_rows_from(path: Path | str, offset: int = 0) -> Iterator[tuple[dict, int]]:
+    """Lazily read the rows of a `.csv` or `.jsonl` export from a byte offset.
+
+    Only rows ending with a newline outside quotes are read, so a row that is still being
+    appended, even within a quoted multi-line field, is left for the next run.
+
+    Args:
+        path (Path | str): Path to the file.
+        offset (int): Byte offset of the first row, e.g. `Checkpoint.offset`. 0 means the beginning (after the CSV header).
+
+    Yields:
+        tuple[dict, int]: A row and the byte offset after it.
+    """
+    path = Path(path)
+    with open(path, "rb") as file:
+        if path.suffix == ".csv":
+            header = file.readline()
+            fieldnames = next(csv.reader([header.decode("utf-8")]))
+            end = max(offset, len(header))
+
+            def records() -> Iterator[str]:
+                nonlocal end
+                for record, end in _complete_records(file, end):
+                    yield record
+
+            for row in csv.DictReader(records(), fieldnames):
+                yield row, end
+        else:
+            for line, end in _complete_lines(file, offset):
+                if line.strip():
+                    yield json.loads(line), end
+
+
+def update_file(
+    source: Path | str,
+    destination: Path | str,
+    questionnaires: dict[str, ScoringSpec | Callable] | Iterable[Callable],
+    keep: Iterable[str] = (),
+    chunk_size: int = CHUNK_SIZE,
+    missing: MissingPolicy | dict[str, MissingPolicy] | None = None,
+    checkpoint: Path | str | None = None,
+) -> StreamStats:
+    """Score the rows appended to an export since the last run.
+
+    A checkpoint next to the output keeps the byte offset reached in the export and a
+    `fingerprint()` of the scoring setup. Later runs score only the new rows and append
+    them to the output. The whole export is scored again if there's no checkpoint, the
+    fingerprint changed (e.g. a scoring spec or the library version) or the export is
+    shorter than the offset. The export is expected to only grow.
+
+    Args:
+        source (Path | str): `.csv` or `.jsonl` export.
+        destination (Path | str): Output `.csv` or `.jsonl` file.
+        questionnaires (dict[str, ScoringSpec | Callable] | Iterable[Callable]): Questionnaire functions or a dictionary of question base names and questionnaires.
+        keep (Iterable[str]): Columns copied to the output as they are, e.g. participant ID.
+        chunk_size (int): Number of rows held in memory and scored at once.
+        missing (MissingPolicy | dict[str, MissingPolicy] | None): See `score_rows()`.
+        checkpoint (Path | str | None): Checkpoint file. Defaults to `<destination>.checkpoint.json`.
+
+    Returns:
+        StreamStats: Number of rows scored in this run and throughput.
+    """
+    start = time.perf_counter()
+    keep = list(keep)
+    questionnaires = questionnaire_columns(questionnaires, missing)
+    fieldnames = keep + [c for q in questionnaires for c in q.score_columns]
+    destination = Path(destination)
+    checkpoint = Path(
+        checkpoint or destination.with_name(f"{destination.name}.checkpoint.json")
+    )
+    current = fingerprint(questionnaires, keep)
+    state = Checkpoint.load(checkpoint)
+    if (
+        state is None
+        or state.fingerprint != current
+        or state.offset > Path(source).stat().st_size
+        or not destination.exists()
+        or state.output > destination.stat().st_size
+    ):
+        state = Checkpoint(0, 0, 0, current)
+
+    rows = 0
+    with open(
+        destination, "r+" if state.output else "w", encoding="utf-8", newline=""
+    ) as file:
+        # Drop rows written after the last checkpoint by an interrupted run
+        file.seek(state.output)
+        file.truncate()
+        writer = RowWriter(
+            file, destination.suffix, fieldnames, header=not state.output
+        )
+        for chunk in chunked(read_rows_from(source, state.offset), chunk_size):
+            scored = next(
+                score_rows([row for row, _ in chunk], questionnaires, keep, len(chunk))
+            )
+            writer.write(scored)
+            file.flush()
+            rows += len(scored)
+            state = Checkpoint(
+                chunk[-1][1], state.rows + len(scored), file.tell(), current
+            )
+            state.save(checkpoint)
+        if not state.output:
+            # Even an empty export gets its header and checkpoint
+            file.flush()
+            state = Checkpoint(state.offset, 0, file.tell(), current)
+            state.save(checkpoint)
+    return StreamStats(rows, time.perf_counter() - start)
@@ -0,0 +1,106 @@
+"""Stylesheets shared by questionnaire pages
+
+Some questionnaires need CSS, e.g. the scale legend of NFCS. The stylesheets live in
+`veleslibrary/data/css/<name>.css`, and the pages include them as
+`<style data-veles-style="<name>">` at the start of their HTML, so a single page works on
+its own. The surveys assembled by the library, `veleslibrary.artifacts.battery()` and
+`veleslibrary.battery.BatteryPlanner.pages()`, keep only the first copy of every
+stylesheet. When assembling a survey from the pages yourself, use:
+
+- `deduplicate()` to keep only the first copy of every stylesheet, or
+- `extract()` to remove all of them and get one stylesheet for the whole survey,
+  e.g. to serve it as a separate asset.
+
+Example:
+    ```python
+    from veleslibrary.questionnaires import nfcs, nfcsShort
+    from veleslibrary.styles import extract
+
+    pages = [nfcs(name="NFCS_pre").dict(), nfcsShort(name="NFCS_post").dict()]
+    pages, css = extract(pages)
+    ```
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+
+STYLES_PATH = Path(__file__).parent / "data" / "css"
+
+_STYLE = re.compile(r'<style data-veles-style="([^"]+)">.*?</style>\s*', re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def stylesheet(name: str) -> str:
+    """Return the CSS of a stylesheet.
+
+    Args:
+        name (str): Name of the stylesheet, e.g. "nfcs".
+
+    Returns:
+        str: The CSS.
+
+    Raises:
+        KeyError: If there's no such stylesheet.
+    """
+    try:
+        return (STYLES_PATH / f"{name}.css").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise KeyError(f"No stylesheet {name!r}") from None
+
+
+def style_tag(name: str) -> str:
+    """Return the `<style>` element of a stylesheet, to put at the start of page HTML"""
+    return f'<style data-veles-style="{name}">\n{stylesheet(name)}</style>\n'
+
+
+def _strip(value, keep: set | None, found: list):
+    """Copy the JSON, removing the style elements.
+
+    Names are added to `found` in the order of appearance. If `keep` is a set, the first
+    element of every name is kept and the name is added to the set.
+    """
+    if isinstance(value, dict):
+        stripped = {key: _strip(item, keep, found) for key, item in value.items()}
+        if isinstance(value.get("html"), str):
+
+            def replace(match: re.Match) -> str:
+                name = match.group(1)
+                if name not in found:
+                    found.append(name)
+                if keep is not None and name not in keep:
+                    keep.add(name)
+                    return match.group(0)
+                return ""
+
+            stripped["html"] = _STYLE.sub(replace, value["html"])
+        return stripped
+    if isinstance(value, list):
+        return [_strip(item, keep, found) for item in value]
+    return value
+
+
+def deduplicate(survey: dict | list) -> dict | list:
+    """Keep only the first copy of every library stylesheet.
+
+    Args:
+        survey (dict | list): SurveyJS JSON of a survey, a page or a list of pages.
+
+    Returns:
+        dict | list: A copy without the repeated `<style>` elements.
+    """
+    return _strip(survey, set(), [])
+
+
+def extract(survey: dict | list) -> tuple[dict | list, str]:
+    """Remove the library stylesheets from the pages and return them as one stylesheet.
+
+    Args:
+        survey (dict | list): SurveyJS JSON of a survey, a page or a list of pages.
+
+    Returns:
+        tuple[dict | list, str]: A copy without the `<style>` elements and the CSS of the stylesheets it used.
+    """
+    found = []
+    stripped = _strip(survey, None, found)
+    return stripped, "".join(stylesheet(name) for name in found)
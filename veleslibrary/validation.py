@@ -0,0 +1,134 @@
+"""Vectorized validation of response matrices
+
+Rows with missing or impossible answers should be rejected before scoring. `validate()`
+checks a whole `(n_respondents × n_items)` array against the `ScoringSpec` of a
+questionnaire at once and returns the errors as bit flags per answer, instead of raising
+on the first one:
+
+- `ResponseError.MISSING`: no answer (NaN),
+- `ResponseError.OUT_OF_RANGE`: outside the response range, e.g. 5 in RSES (1–4),
+- `ResponseError.NOT_INTEGER`: not a whole number, e.g. 2.5.
+
+Example:
+    ```python
+    from veleslibrary.questionnaires import rses
+    from veleslibrary.validation import ResponseError, validate
+
+    result = validate(rses, responses)
+    clean = responses[result.valid]
+    result.rows & ResponseError.OUT_OF_RANGE  # rows with impossible answers
+    ```
+"""
+
+import enum
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+import numpy as np
+
+from .scoring import CHUNK_SIZE, get_spec
+from .specs import ScoringSpec
+from .streaming import questionnaire_columns
+
+
+class ResponseError(enum.IntFlag):
+    """Bit flags of invalid answers"""
+
+    MISSING = 1
+    OUT_OF_RANGE = 2
+    NOT_INTEGER = 4
+
+
+@dataclass(frozen=True, eq=False)
+class Validation:
+    """Errors found in a response matrix.
+
+    Attributes:
+        errors (np.ndarray): `(n_respondents × n_items)` uint8 array of `ResponseError` flags. 0 means a valid answer.
+    """
+
+    errors: np.ndarray
+
+    @property
+    def rows(self) -> np.ndarray:
+        """uint8 vector of all the `ResponseError` flags of each row"""
+        return np.bitwise_or.reduce(self.errors, axis=1)
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean vector of rows without errors"""
+        return ~self.errors.any(axis=1)
+
+    def packed(self) -> np.ndarray:
+        """Return the invalid items of each row as a bitmask.
+
+        Returns:
+            np.ndarray: `(n_respondents × ceil(n_items / 8))` uint8 array. Bit `i % 8` (from the least significant) of byte `i // 8` is set if item `i + 1` is invalid.
+        """
+        return np.packbits(self.errors != 0, axis=1, bitorder="little")
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of rows with each kind of error"""
+        rows = self.rows
+        return {flag.name: int(np.count_nonzero(rows & flag)) for flag in ResponseError}
+
+
+def validate(
+    questionnaire: ScoringSpec | Callable,
+    responses: np.ndarray,
+    chunk_size: int = CHUNK_SIZE,
+) -> Validation:
+    """Check a response matrix against the response range of a questionnaire.
+
+    Args:
+        questionnaire (ScoringSpec | Callable): A spec or a questionnaire function, e.g. `veleslibrary.questionnaires.rses`.
+        responses (np.ndarray): `(n_respondents × n_items)` array of coded answers. Missing answers should be NaN.
+        chunk_size (int): Number of rows checked at once. Bounds the temporary memory.
+
+    Returns:
+        Validation: Error flags of every answer.
+
+    Raises:
+        ValueError: If the number of columns doesn't match the number of items.
+    """
+    spec = get_spec(questionnaire)
+    responses = np.asarray(responses)
+    if responses.ndim != 2 or responses.shape[1] != spec.items:
+        raise ValueError(
+            f"Expected an (n × {spec.items}) array, got shape {responses.shape}"
+        )
+    low, high = spec.response_range
+    errors = np.empty(responses.shape, dtype=np.uint8)
+    floating = np.issubdtype(responses.dtype, np.floating)
+    for start in range(0, len(responses), chunk_size):
+        chunk = responses[start : start + chunk_size]
+        out = errors[start : start + chunk_size]
+        # Comparisons with NaN are False, so missing answers are only MISSING
+        out[...] = ((chunk < low) | (chunk > high)).view(np.uint8) << 1
+        if floating:
+            out |= np.isnan(chunk).view(np.uint8)
+            fraction = np.not_equal(chunk, np.floor(chunk))
+            fraction &= np.isfinite(chunk)
+            out |= fraction.view(np.uint8) << 2
+    return Validation(errors)
+
+
+def validate_rows(
+    rows: list[dict],
+    questionnaires: dict[str, ScoringSpec | Callable] | Iterable[Callable],
+) -> dict[str, Validation]:
+    """Validate the questionnaires of a battery in exported rows.
+
+    Answers are read as in `veleslibrary.streaming`, so unreadable ones count as missing.
+
+    Args:
+        rows (list[dict]): Rows of the export.
+        questionnaires (dict[str, ScoringSpec | Callable] | Iterable[Callable]): Questionnaire functions or a dictionary of question base names and questionnaires.
+
+    Returns:
+        dict[str, Validation]: Errors of every questionnaire by its base name.
+    """
+    return {
+        columns.name: validate(columns.spec, columns.responses(rows))
+        for columns in questionnaire_columns(questionnaires)
+    }
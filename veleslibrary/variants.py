@@ -0,0 +1,142 @@
+"""Per-participant item order randomization
+
+`variants()` builds a questionnaire once and returns a `Variants` object, which produces the
+SurveyJS JSON of the page with the items in a participant-specific order. The order sorts
+the items by keys read from a SHAKE-256 hash of the participant ID, so the same participant
+always gets the same order, on any machine and with any NumPy version. Only the item list
+is permuted: questions keep their names (e.g. `SD3_11`), so answers are scored as usual.
+
+Questionnaires with one question per item (e.g. SD3, Mini-COPE) have their questions
+shuffled, matrix questionnaires (e.g. NFCS) have the rows of the matrix shuffled.
+
+Example:
+    ```python
+    from veleslibrary.questionnaires import sd3
+    from veleslibrary.variants import variants
+
+    sd3_variants = variants(sd3)
+    page = sd3_variants("participant-0042")  # SurveyJS JSON of the page
+    sd3_variants.order("participant-0042")  # (14, 3, 27, ...)
+    ```
+"""
+
+import hashlib
+from typing import Callable
+
+import numpy as np
+
+from .scoring import default_name, get_spec
+
+
+def permutation(participant: str | int, items: int, salt: str = "") -> np.ndarray:
+    """Return the participant's permutation of item indices.
+
+    Args:
+        participant (str | int): Participant ID.
+        items (int): Number of items.
+        salt (str): Text mixed into the hash, so that different questionnaires get independent orders.
+
+    Returns:
+        np.ndarray: Permutation of `range(items)`.
+    """
+    digest = hashlib.shake_256(f"{salt}\x00{participant}".encode("utf-8")).digest(
+        8 * items
+    )
+    return np.argsort(np.frombuffer(digest, dtype="<u8"), kind="stable")
+
+
+class Variants:
+    """Item order variants of one questionnaire page.
+
+    The returned JSON is a new page and element list, but the question objects are shared
+    with the base page. Don't modify them in place.
+
+    Args:
+        questionnaire (Callable): Questionnaire function with a scoring spec, e.g. `sd3`.
+        *args: Arguments of the questionnaire function.
+        salt (str | None): Text mixed into the participant hash. `None` means the name of the function and the base name.
+        **kwargs: Keyword arguments of the questionnaire function.
+
+    Raises:
+        ValueError: If the items can't be found on the page.
+    """
+
+    def __init__(
+        self, questionnaire: Callable, *args, salt: str | None = None, **kwargs
+    ):
+        self.page = questionnaire(*args, **kwargs).dict()
+        self.items = get_spec(questionnaire).items
+        name = kwargs.get("name", args[0] if args else default_name(questionnaire))
+        self.salt = (
+            f"{questionnaire.__module__}.{questionnaire.__qualname__}/{name}"
+            if salt is None
+            else salt
+        )
+
+        item_names = [f"{name}_{item}" for item in range(1, self.items + 1)]
+        elements = self.page["elements"]
+        positions = {element.get("name"): i for i, element in enumerate(elements)}
+        if all(item in positions for item in item_names):
+            self._matrix = None
+            self._positions = [positions[item] for item in item_names]
+            self._base = [elements[i] for i in self._positions]
+        else:
+            for i, element in enumerate(elements):
+                rows = element.get("rows") or []
+                if [row.get("value") for row in rows] == item_names:
+                    self._matrix = i
+                    self._base = list(rows)
+                    break
+            else:
+                raise ValueError(f"Can't find the items of {name} on the page")
+
+    def order(self, participant: str | int) -> tuple[int, ...]:
+        """Return the item numbers (from 1) in the order shown to a participant.
+
+        Args:
+            participant (str | int): Participant ID.
+
+        Returns:
+            tuple[int, ...]: Permutation of the item numbers.
+        """
+        return tuple((permutation(participant, self.items, self.salt) + 1).tolist())
+
+    def __call__(self, participant: str | int) -> dict:
+        """Return the page of a participant.
+
+        Args:
+            participant (str | int): Participant ID.
+
+        Returns:
+            dict: SurveyJS JSON of the page with the items in the participant's order.
+        """
+        shuffled = [
+            self._base[i]
+            for i in permutation(participant, self.items, self.salt).tolist()
+        ]
+        elements = list(self.page["elements"])
+        if self._matrix is None:
+            for position, element in zip(self._positions, shuffled):
+                elements[position] = element
+        else:
+            elements[self._matrix] = self.page["elements"][self._matrix] | {
+                "rows": shuffled
+            }
+        return self.page | {"elements": elements}
+
+
+def variants(
+    questionnaire: Callable, *args, salt: str | None = None, **kwargs
+) -> Variants:
+    """Build a questionnaire once for per-participant item orders.
+
+    Args:
+        questionnaire (Callable): Questionnaire function with a scoring spec, e.g. `sd3`.
+        *args: Arguments of the questionnaire function.
+        salt (str | None): See `Variants`.
+        **kwargs: Keyword arguments of the questionnaire function.
+
+    Returns:
+        Variants: Call it with a participant ID to get their page.
+    """
+    return Variants(questionnaire, *args, salt=salt, **kwargs)